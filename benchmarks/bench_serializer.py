@@ -0,0 +1,100 @@
+"""
+Micro benchmark for the JSON backends and the binary format of the serializer.
+
+Compares load and save times and file sizes of a paramset descriptions
+cache (<central>_paramsets.json) for all installed JSON backends and the
+binary format. Without a file, a cache with the given number of devices
+(default 500) is generated.
+
+Usage: PYTHONPATH=. python benchmarks/bench_serializer.py [file | devices]
+"""
+from __future__ import annotations
+
+from collections.abc import Callable
+import os
+import sys
+import tempfile
+import timeit
+from typing import Any
+
+from hahomematic import serializer
+
+ROUNDS = 5
+
+
+def _paramset_descriptions(devices: int) -> dict[str, Any]:
+    """Return paramset descriptions like the ones cached for a CCU."""
+    parameter = {
+        "DEFAULT": 0.0,
+        "FLAGS": 1,
+        "ID": "LEVEL",
+        "MAX": 1.0,
+        "MIN": 0.0,
+        "OPERATIONS": 7,
+        "TAB_ORDER": 0,
+        "TYPE": "FLOAT",
+        "UNIT": "100%",
+    }
+    return {
+        "HmIP-RF": {
+            f"000A1BE9A7B1{device:02d}:{channel}": {
+                paramset_key: {
+                    f"PARAMETER_{index}": {**parameter, "ID": f"PARAMETER_{index}"}
+                    for index in range(20)
+                }
+                for paramset_key in ("MASTER", "VALUES")
+            }
+            for device in range(devices)
+            for channel in range(10)
+        }
+    }
+
+
+def main() -> None:
+    """Run the benchmark."""
+    argument = sys.argv[1] if len(sys.argv) > 1 else "500"
+    with tempfile.TemporaryDirectory() as temp_dir:
+        if os.path.isfile(argument):
+            file_path = argument
+        else:
+            file_path = os.path.join(temp_dir, "bench_paramsets.json")
+            serializer.dump_file(
+                _paramset_descriptions(int(argument)), file_path=file_path
+            )
+        data = serializer.load_file(file_path=file_path)
+        json_path = os.path.join(temp_dir, "bench_save.json")
+        binary_path = os.path.join(temp_dir, "bench_save.bin")
+        serializer.dump_binary_file(data, file_path=binary_path)
+        size = os.path.getsize(file_path) / 1e6
+        print(f"{file_path}, {size:.1f} MB, {ROUNDS} rounds")
+        for backend in serializer.AVAILABLE_BACKENDS:
+            serializer.set_backend(backend)
+            _print_times(
+                name=backend,
+                load=lambda: serializer.load_file(file_path=file_path),
+                save=lambda: serializer.dump_file(data, file_path=json_path),
+                file_path=json_path,
+            )
+        _print_times(
+            name="binary",
+            load=lambda: serializer.load_binary_file(file_path=binary_path),
+            save=lambda: serializer.dump_binary_file(data, file_path=binary_path),
+            file_path=binary_path,
+        )
+
+
+def _print_times(
+    name: str, load: Callable[[], Any], save: Callable[[], Any], file_path: str
+) -> None:
+    """Print the load and save times and the size of the saved file."""
+    load_time = min(timeit.repeat(load, number=ROUNDS, repeat=3))
+    save_time = min(timeit.repeat(save, number=ROUNDS, repeat=3))
+    print(
+        f"{name:8} load {load_time / ROUNDS * 1e3:8.1f} ms, "
+        f"save {save_time / ROUNDS * 1e3:8.1f} ms, "
+        f"size {os.path.getsize(file_path) / 1e6:6.1f} MB"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Micro benchmark for the XML-RPC fast path decoder.
+
+Compares the generic SimpleXMLRPCDispatcher with the fast path
+for multicall bodies as they are sent by a CCU.
+
+Usage: PYTHONPATH=. python benchmarks/bench_xml_rpc_decoder.py [events]
+"""
+from __future__ import annotations
+
+import sys
+import timeit
+from typing import Any
+from xmlrpc import client as xmlrpc_client
+from xmlrpc.server import SimpleXMLRPCDispatcher
+
+from hahomematic.xml_rpc_decoder import decode_request, get_events
+from hahomematic.xml_rpc_server import FastPathXMLRPCDispatcher
+
+INTERFACE_ID = "ccu-dev-HmIP-RF"
+ROUNDS = 2000
+
+
+class _RPCFunctions:
+    """Minimal callback target."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def event(
+        self, interface_id: str, channel_address: str, parameter: str, value: Any
+    ) -> None:
+        """Count events."""
+        self.count += 1
+
+
+def _ccu_multicall_body(size: int) -> bytes:
+    """Return a multicall body like the ones sent by a CCU."""
+    samples: list[tuple[str, Any]] = [
+        ("ACTUAL_TEMPERATURE", 21.3),
+        ("HUMIDITY", 48),
+        ("STATE", True),
+        ("LEVEL", 0.5),
+        ("OPERATING_VOLTAGE", 2.9),
+        ("RSSI_DEVICE", -61),
+        ("UNREACH", False),
+        ("DUTY_CYCLE_LEVEL", 3.5),
+    ]
+    calls = []
+    for i in range(size):
+        parameter, value = samples[i % len(samples)]
+        calls.append(
+            {
+                "methodName": "event",
+                "params": [
+                    INTERFACE_ID,
+                    f"000A1BE9A7B1A{i % 50:02d}:1",
+                    parameter,
+                    value,
+                ],
+            }
+        )
+    return xmlrpc_client.dumps((calls,), methodname="system.multicall").encode()
+
+
+def _get_dispatcher(
+    dispatcher_cls: type[SimpleXMLRPCDispatcher],
+) -> SimpleXMLRPCDispatcher:
+    """Return a dispatcher with registered callbacks."""
+    dispatcher = dispatcher_cls(allow_none=True)
+    dispatcher.register_multicall_functions()
+    dispatcher.register_instance(_RPCFunctions(), allow_dotted_names=True)
+    return dispatcher
+
+
+def main() -> None:
+    """Run the benchmark."""
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    body = _ccu_multicall_body(size)
+    generic = _get_dispatcher(SimpleXMLRPCDispatcher)
+    fast = _get_dispatcher(FastPathXMLRPCDispatcher)
+    # pylint: disable=protected-access
+    assert generic._marshaled_dispatch(body) == fast._marshaled_dispatch(body)
+
+    results = {
+        "generic decode (xmlrpc.client.loads)": lambda: xmlrpc_client.loads(body),
+        "fast decode (decode_request/get_events)": lambda: get_events(
+            *decode_request(body)
+        ),
+        "generic dispatch": lambda: generic._marshaled_dispatch(body),
+        "fast dispatch": lambda: fast._marshaled_dispatch(body),
+    }
+    print(f"multicall with {size} events, {len(body)} bytes, {ROUNDS} rounds")
+    for name, func in results.items():
+        duration = min(timeit.repeat(func, number=ROUNDS, repeat=3))
+        print(f"{name:42} {duration / ROUNDS * 1e6:9.1f} µs/request")
+
+
+if __name__ == "__main__":
+    main()
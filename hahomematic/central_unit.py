@@ -6,11 +6,10 @@ from __future__ import annotations
 
 from abc import ABC
 import asyncio
-from collections.abc import Awaitable, Callable, Coroutine
+from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine
 from concurrent.futures._base import CancelledError
 from dataclasses import dataclass
 from datetime import datetime
-import json
 import logging
 import os
 import socket
@@ -19,15 +18,15 @@ from typing import Any, Final, TypeVar
 
 from aiohttp import ClientSession
 
-from hahomematic import config
+from hahomematic import config, serializer
 import hahomematic.client as hmcl
 from hahomematic.const import (
     ATTR_INTERFACE_ID,
     ATTR_TYPE,
     ATTR_VALUE,
-    DEFAULT_ENCODING,
     DEFAULT_TLS,
     DEFAULT_VERIFY_TLS,
+    FILE_BINARY_CACHE_EXTENSION,
     FILE_DEVICES,
     FILE_PARAMSETS,
     HH_EVENT_DELETE_DEVICES,
@@ -45,8 +44,11 @@ from hahomematic.const import (
     NO_CACHE_ENTRY,
     OPERATION_EVENT,
     OPERATION_READ,
+    PARAM_CARRIER_SENSE_LEVEL,
+    PARAM_DUTY_CYCLE_LEVEL,
     PARAMSET_KEY_VALUES,
     PROXY_INIT_SUCCESS,
+    HmCacheFormat,
     HmCallSource,
     HmDataOperationResult,
     HmEntityUsage,
@@ -55,7 +57,6 @@ from hahomematic.const import (
     HmPlatform,
 )
 from hahomematic.decorators import (
-    callback_event,
     callback_system_event,
     config_property,
     value_property,
@@ -69,6 +70,8 @@ from hahomematic.entity import (
     GenericHubEntity,
     GenericSystemVariable,
 )
+from hahomematic.event_aggregator import EventAggregate, EventAggregator
+from hahomematic.event_queue import EventQueue, EventQueueStatistics
 from hahomematic.exceptions import (
     BaseHomematicException,
     HaHomematicException,
@@ -82,9 +85,10 @@ from hahomematic.helpers import (
     get_device_channel,
     updated_within_seconds,
 )
-from hahomematic.hub import HmHub
+from hahomematic.hub import HmHub, HubPollingStatistics
 from hahomematic.json_rpc_client import JsonRpcAioHttpClient
 from hahomematic.parameter_visibility import ParameterVisibilityCache
+from hahomematic.rpc_metrics import JSON_RPC, MethodMetrics
 import hahomematic.xml_rpc_server as xml_rpc
 
 _LOGGER = logging.getLogger(__name__)
@@ -92,6 +96,10 @@ T = TypeVar("T")
 
 # {instance_name, central_unit}
 CENTRAL_INSTANCES: dict[str, CentralUnit] = {}
+# Routing of interface_id to client for the callbacks of all centrals.
+CLIENT_ROUTES: Final[dict[str, hmcl.Client]] = {}
+# Events, that feed the command scheduler of the client.
+_RF_LEVEL_PARAMETERS: Final = (PARAM_CARRIER_SENSE_LEVEL, PARAM_DUTY_CYCLE_LEVEL)
 
 
 class CentralUnit:
@@ -109,12 +117,18 @@ class CentralUnit:
         self._attr_name: Final[str] = central_config.name
         self._attr_model: str | None = None
         self._loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
-        self._xml_rpc_server: xml_rpc.XmlRpcServer | None = None
+        self._xml_rpc_server: xml_rpc.BaseXmlRpcServer | None = None
         if central_config.enable_server:
-            self._xml_rpc_server = xml_rpc.register_xml_rpc_server(
-                local_port=central_config.callback_port
-                or central_config.default_callback_port
+            local_port = (
+                central_config.callback_port or central_config.default_callback_port
             )
+            if central_config.use_async_xml_rpc_server:
+                # The async server is started within start().
+                self._xml_rpc_server = xml_rpc.AsyncXmlRpcServer(local_port=local_port)
+            else:
+                self._xml_rpc_server = xml_rpc.register_xml_rpc_server(
+                    local_port=local_port
+                )
             self._xml_rpc_server.register_central(self)
         self.local_port: Final[int] = (
             self._xml_rpc_server.local_port if self._xml_rpc_server else 0
@@ -162,6 +176,19 @@ class CentralUnit:
 
         CENTRAL_INSTANCES[self._attr_name] = self
         self._connection_checker: Final[ConnectionChecker] = ConnectionChecker(self)
+        self._event_queue: Final[EventQueue] = EventQueue(
+            loop=self._loop, process=self._events
+        )
+        self._event_aggregator: Final[EventAggregator | None] = (
+            EventAggregator(
+                loop=self._loop,
+                intervals=central_config.event_aggregation,
+                get_device_type=self._get_device_type,
+                emit=self._emit_event,
+            )
+            if central_config.event_aggregation
+            else None
+        )
         self._hub: HmHub = HmHub(central=self)
         self._attr_version: str | None = None
 
@@ -188,7 +215,10 @@ class CentralUnit:
         """Return if active sub threads are alive."""
         if self._connection_checker.is_alive():
             return True
-        if self._xml_rpc_server and self._xml_rpc_server.is_alive():
+        if (
+            isinstance(self._xml_rpc_server, xml_rpc.XmlRpcServer)
+            and self._xml_rpc_server.is_alive()
+        ):
             return True
         return False
 
@@ -239,6 +269,10 @@ class CentralUnit:
     async def start(self) -> None:
         """Start processing of the central unit. #CC"""
         await self.parameter_visibility.load()
+        if isinstance(self._xml_rpc_server, xml_rpc.AsyncXmlRpcServer):
+            await xml_rpc.register_async_xml_rpc_server(
+                local_port=self._xml_rpc_server.local_port
+            )
         await self._start_clients()
         if self.config.enable_server:
             self._start_connection_checker()
@@ -266,6 +300,10 @@ class CentralUnit:
     async def stop(self) -> None:
         """Stop processing of the central unit. #CC"""
         self._stop_connection_checker()
+        self._hub.polling.stop()
+        self._event_queue.clear()
+        if self._event_aggregator:
+            self._event_aggregator.clear()
         await self._stop_clients()
         if self.json_rpc_client.is_activated:
             await self.json_rpc_client.logout()
@@ -275,7 +313,10 @@ class CentralUnit:
             self._xml_rpc_server.un_register_central(central=self)
             # un-register and stop XmlRPC-Server, if possible
             if self._xml_rpc_server.no_central_registered:
-                self._xml_rpc_server.stop()
+                if isinstance(self._xml_rpc_server, xml_rpc.AsyncXmlRpcServer):
+                    await self._xml_rpc_server.stop()
+                else:
+                    self._xml_rpc_server.stop()
             _LOGGER.debug("stop: XmlRPC-Server stopped")
         else:
             _LOGGER.debug(
@@ -308,6 +349,7 @@ class CentralUnit:
         await self._de_init_clients()
         for client in self._clients.values():
             _LOGGER.debug("stop_client: Stopping %s.", client.interface_id)
+            _remove_client_route(client=client)
             client.stop()
         _LOGGER.debug("stop_clients: Clearing existing clients.")
         self._clients.clear()
@@ -353,6 +395,7 @@ class CentralUnit:
                     )
                     if client:
                         self._clients[client.interface_id] = client
+                        CLIENT_ROUTES[client.interface_id] = client
             except BaseHomematicException as ex:
                 self.fire_interface_event(
                     interface_id=interface_config.interface_id,
@@ -382,8 +425,7 @@ class CentralUnit:
 
     async def _init_hub(self) -> None:
         """Init the hub."""
-        await self._hub.fetch_program_data()
-        await self._hub.fetch_sysvar_data()
+        await self._hub.fetch_hub_data()
 
     def fire_interface_event(
         self,
@@ -483,6 +525,12 @@ class CentralUnit:
         """Return homematic device. #CC"""
         return self._devices.get(device_address)
 
+    def _get_device_type(self, device_address: str) -> str | None:
+        """Return the device type of a device."""
+        if device := self._devices.get(device_address):
+            return device.device_type
+        return None
+
     def get_entities_by_platform(
         self, platform: HmPlatform, existing_unique_ids: list[str] | None = None
     ) -> list[BaseEntity]:
@@ -566,7 +614,7 @@ class CentralUnit:
             await self.paramset_descriptions.load()
             await self.device_details.load()
             await self.device_data.load()
-        except json.decoder.JSONDecodeError:
+        except (serializer.JSONDecodeError, serializer.BinaryDecodeError):
             _LOGGER.warning(
                 "load_caches failed: Unable to load caches for %s.", self._attr_name
             )
@@ -716,17 +764,25 @@ class CentralUnit:
                 )
             ]
             client = self._clients[interface_id]
+            new_device_descriptions: list[dict[str, Any]] = []
             for dev_desc in device_descriptions:
                 try:
                     if dev_desc[HM_ADDRESS] not in known_addresses:
                         self.device_descriptions.add_device_description(
                             interface_id, dev_desc
                         )
-                        await client.fetch_paramset_descriptions(dev_desc)
+                        new_device_descriptions.append(dev_desc)
                 except Exception as err:
                     _LOGGER.error(
                         "add_new_devices failed: %s [%s]", type(err).__name__, err.args
                     )
+            try:
+                # paramset descriptions of all new devices are fetched by multicall
+                await client.fetch_all_paramset_descriptions(new_device_descriptions)
+            except Exception as err:
+                _LOGGER.error(
+                    "add_new_devices failed: %s [%s]", type(err).__name__, err.args
+                )
 
             await self.device_descriptions.save()
             await self.paramset_descriptions.save()
@@ -734,7 +790,6 @@ class CentralUnit:
             await self.device_data.load()
             await self._create_devices()
 
-    @callback_event
     def event(
         self, interface_id: str, channel_address: str, parameter: str, value: Any
     ) -> None:
@@ -749,10 +804,93 @@ class CentralUnit:
             parameter,
             str(value),
         )
-        if self.has_client(interface_id=interface_id) is False:
+        self._events(
+            interface_id=interface_id, events=[(channel_address, parameter, value)]
+        )
+
+    def events(self, interface_id: str, events: list[tuple[str, str, Any]]) -> None:
+        """
+        Handle a batch of events (channel_address, parameter, value)
+        of one interface, e.g. from a multicall.
+        If not called from within the event loop, the batch is passed
+        to the bounded event queue, that is drained by the event loop.
+        """
+        try:
+            in_loop = asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            in_loop = False
+        if in_loop and self._event_queue.size == 0:
+            self._events(interface_id=interface_id, events=events)
+        else:
+            self._event_queue.put(interface_id=interface_id, events=events)
+
+    @property
+    def event_queue_statistics(self) -> EventQueueStatistics:
+        """Return the counters of the event queue."""
+        return self._event_queue.statistics
+
+    def get_rpc_metrics(self) -> dict[str, dict[str, MethodMetrics]]:
+        """
+        Return a snapshot of the RPC metrics by interface_id and method.
+        The JSON-RPC calls are listed under JSON-RPC.
+        """
+        rpc_metrics = {
+            interface_id: client.rpc_metrics
+            for interface_id, client in self._clients.items()
+        }
+        rpc_metrics[JSON_RPC] = self.json_rpc_client.rpc_metrics
+        return rpc_metrics
+
+    def _events(self, interface_id: str, events: list[tuple[str, str, Any]]) -> None:
+        """Handle a batch of events within the event loop."""
+        _LOGGER.debug(
+            "events: interface_id = %s, events = %i", interface_id, len(events)
+        )
+        if (client := self._clients.get(interface_id)) is None:
             return
 
-        self.last_events[interface_id] = datetime.now()
+        now = datetime.now()
+        self.last_events[interface_id] = now
+        client.last_updated = now
+        for channel_address, parameter, value in events:
+            if parameter in _RF_LEVEL_PARAMETERS:
+                client.set_rf_level(parameter=parameter, value=value)
+            if self._event_aggregator and self._event_aggregator.aggregate(
+                interface_id=interface_id,
+                channel_address=channel_address,
+                parameter=parameter,
+                value=value,
+            ):
+                continue
+            self._emit_event(interface_id, channel_address, parameter, value)
+
+    def _emit_event(
+        self, interface_id: str, channel_address: str, parameter: str, value: Any
+    ) -> None:
+        """Pass an event to the entities and the entity event callback."""
+        self._fire_entity_event(
+            interface_id=interface_id,
+            channel_address=channel_address,
+            parameter=parameter,
+            value=value,
+        )
+        if self.callback_entity_event is not None:
+            self.callback_entity_event(interface_id, channel_address, parameter, value)
+
+    def get_event_aggregate(
+        self, channel_address: str, parameter: str
+    ) -> EventAggregate | None:
+        """Return the aggregated values of a rate limited event parameter."""
+        if self._event_aggregator is None:
+            return None
+        return self._event_aggregator.get_aggregate(
+            channel_address=channel_address, parameter=parameter
+        )
+
+    def _fire_entity_event(
+        self, interface_id: str, channel_address: str, parameter: str, value: Any
+    ) -> None:
+        """Pass an event to the subscribed entities."""
         # No need to check the response of a XmlRPC-PING
         if parameter == "PONG":
             return
@@ -828,6 +966,8 @@ class CentralUnit:
         await self.device_descriptions.remove_device(device=device)
         await self.paramset_descriptions.remove_device(device=device)
         self.device_details.remove_device(device=device)
+        if self._event_aggregator:
+            self._event_aggregator.remove_device(device_address=device.device_address)
         del self._devices[device.device_address]
 
     def remove_entity(self, entity: BaseEntity) -> None:
@@ -904,6 +1044,44 @@ class CentralUnit:
         """fetch program data for the hub. #CC"""
         await self._hub.fetch_program_data(include_internal=include_internal)
 
+    async def fetch_hub_data(
+        self,
+        include_internal_sysvars: bool = True,
+        include_internal_programs: bool = False,
+    ) -> None:
+        """fetch sysvar and program data for the hub within one request. #CC"""
+        await self._hub.fetch_hub_data(
+            include_internal_sysvars=include_internal_sysvars,
+            include_internal_programs=include_internal_programs,
+        )
+
+    def start_hub_polling(
+        self,
+        include_internal_sysvars: bool = True,
+        include_internal_programs: bool = False,
+    ) -> None:
+        """
+        Fetch sysvar and program data for the hub with an adaptive interval,
+        instead of a fixed timer. #CC
+        """
+        self._hub.polling.start(
+            include_internal_sysvars=include_internal_sysvars,
+            include_internal_programs=include_internal_programs,
+        )
+
+    def stop_hub_polling(self) -> None:
+        """Stop the adaptive polling of the hub data. #CC"""
+        self._hub.polling.stop()
+
+    def notify_sysvar_write(self) -> None:
+        """Poll the hub data soon, after a system variable has been written."""
+        self._hub.polling.notify_write()
+
+    @property
+    def hub_polling_statistics(self) -> HubPollingStatistics:
+        """Return the decisions of the hub polling scheduler."""
+        return self._hub.polling.statistics
+
     async def refresh_entity_data(
         self, paramset_key: str | None = None, max_age_seconds: int = MAX_CACHE_AGE
     ) -> None:
@@ -926,6 +1104,29 @@ class CentralUnit:
 
         _LOGGER.warning("Variable %s not found on %s", name, self.name)
 
+    async def set_system_variables(self, values: dict[str, Any]) -> dict[str, bool]:
+        """
+        Set several variable values on CCU/Homegear within one call.
+        Return the success by name. #CC
+        """
+        results: dict[str, bool] = {name: False for name in values}
+        send_values: dict[str, Any] = {}
+        for name, value in values.items():
+            if (entity := self.sysvar_entities.get(name)) is None:
+                _LOGGER.warning("Variable %s not found on %s", name, self.name)
+                continue
+            if (send_value := entity.get_send_value(value)) is not None:
+                send_values[name] = send_value
+        if not send_values or not (client := self.get_primary_client()):
+            return results
+
+        results.update(await client.set_system_variables(values=send_values))
+        for name, send_value in send_values.items():
+            if results[name]:
+                self.sysvar_entities[name].update_value(value=send_value)
+        self.notify_sysvar_write()
+        return results
+
     # pylint: disable=invalid-name
     async def set_install_mode(
         self,
@@ -1028,6 +1229,7 @@ class CentralUnit:
         await self.paramset_descriptions.clear()
         await self.device_details.clear()
         await self.device_data.clear()
+        self.json_rpc_client.clear_ext_markers()
 
 
 class ConnectionChecker(threading.Thread):
@@ -1040,6 +1242,7 @@ class ConnectionChecker(threading.Thread):
         self._central: Final[CentralUnit] = central
         self._active = True
         self._central_is_connected = True
+        self._dropped_events = 0
 
     def run(self) -> None:
         """
@@ -1092,7 +1295,7 @@ class ConnectionChecker(threading.Thread):
                         await asyncio.gather(*reconnects)
                         if self._central.available:
                             # refresh cache
-                            await self._central.device_data.load()
+                            await self._central.device_data.load(changed_only=True)
                             # refresh entity data
                             await self._central.device_data.refresh_entity_data()
             except NoConnection as nex:
@@ -1102,9 +1305,40 @@ class ConnectionChecker(threading.Thread):
                 _LOGGER.error(
                     "check_connection failed: %s [%s]", type(err).__name__, err.args
                 )
+            self._check_event_queue()
             if self._active:
                 await asyncio.sleep(config.CONNECTION_CHECKER_INTERVAL)
 
+    def _check_event_queue(self) -> None:
+        """Warn if events have been dropped since the last check."""
+        statistics = self._central.event_queue_statistics
+        if statistics.dropped > self._dropped_events:
+            _LOGGER.warning(
+                "check_event_queue: %i events dropped for %s "
+                "(enqueued: %i, coalesced: %i, max lag: %.1fs)",
+                statistics.dropped - self._dropped_events,
+                self._central.name,
+                statistics.enqueued,
+                statistics.coalesced,
+                statistics.max_lag,
+            )
+            self._dropped_events = statistics.dropped
+
+
+def _remove_client_route(client: hmcl.Client) -> None:
+    """
+    Remove the route of a client.
+    The route is only removed, if it still belongs to the client,
+    because another central could have taken over the interface_id.
+    """
+    if CLIENT_ROUTES.get(client.interface_id) is client:
+        del CLIENT_ROUTES[client.interface_id]
+
+
+def get_client_by_route(interface_id: str) -> hmcl.Client | None:
+    """Return the client of the interface_id from the routing table."""
+    return CLIENT_ROUTES.get(interface_id)
+
 
 class CentralConfig:
     """Config for a Client."""
@@ -1128,6 +1362,12 @@ class CentralConfig:
         un_ignore_list: list[str] | None = None,
         use_caches: bool = True,
         load_un_ignore: bool = True,
+        use_async_xml_rpc_server: bool = False,
+        event_aggregation: dict[tuple[str, str], float] | None = None,
+        use_async_xml_rpc_proxy: bool = False,
+        send_value_debounce: float = 0.0,
+        cache_format: HmCacheFormat = HmCacheFormat.JSON,
+        use_command_scheduler: bool = False,
     ):
         self.storage_folder: Final[str] = storage_folder
         self.name: Final[str] = name
@@ -1146,6 +1386,19 @@ class CentralConfig:
         self.un_ignore_list: Final[list[str] | None] = un_ignore_list
         self._use_caches: Final[bool] = use_caches
         self._load_un_ignore: Final[bool] = load_un_ignore
+        self.use_async_xml_rpc_server: Final[bool] = use_async_xml_rpc_server
+        self.use_async_xml_rpc_proxy: Final[bool] = use_async_xml_rpc_proxy
+        # Rate limit in seconds by (device_type, parameter),
+        # device_type "*" matches all device types.
+        self.event_aggregation: Final[dict[tuple[str, str], float]] = (
+            event_aggregation or {}
+        )
+        # Last write wins window in seconds for numeric entities, 0 disables.
+        self.send_value_debounce: Final[float] = send_value_debounce
+        # Format of the device and paramset description caches.
+        self.cache_format: Final[HmCacheFormat] = cache_format
+        # Pace the commands of the RF interfaces by their duty cycle.
+        self.use_command_scheduler: Final[bool] = use_command_scheduler
 
     @property
     def central_url(self) -> str:
@@ -1219,14 +1472,17 @@ class DeviceDetailsCache:
 
     async def load(self) -> None:
         """Fetch names from backend."""
-        _LOGGER.debug("load: Loading names for %s", self._central.name)
+        _LOGGER.debug(
+            "load: Loading names, rooms and functions for %s", self._central.name
+        )
         if client := self._central.get_primary_client():
-            await client.fetch_device_details()
-        _LOGGER.debug("load: Loading rooms for %s", self._central.name)
-        self._channel_rooms = await self._get_all_rooms()
+            (
+                self._channel_rooms,
+                self._functions,
+            ) = await client.fetch_device_details_rooms_functions()
+        else:
+            self._channel_rooms, self._functions = {}, {}
         self._identify_device_room()
-        _LOGGER.debug("load: Loading functions for %s", self._central.name)
-        self._functions = await self._get_all_functions()
 
     def add_name(self, address: str, name: str) -> None:
         """Add name to cache."""
@@ -1250,22 +1506,10 @@ class DeviceDetailsCache:
         """Add channel id for a channel"""
         self.device_channel_ids[address] = channel_id
 
-    async def _get_all_rooms(self) -> dict[str, set[str]]:
-        """Get all rooms, if available."""
-        if client := self._central.get_primary_client():
-            return await client.get_all_rooms()
-        return {}
-
     def get_room(self, device_address: str) -> str | None:
         """Return room by device_address."""
         return self._device_room.get(device_address)
 
-    async def _get_all_functions(self) -> dict[str, set[str]]:
-        """Get all functions, if available."""
-        if client := self._central.get_primary_client():
-            return await client.get_all_functions()
-        return {}
-
     def get_function_text(self, address: str) -> str | None:
         """Return function by address"""
         if functions := self._functions.get(address):
@@ -1312,19 +1556,36 @@ class DeviceDataCache:
         # { interface, {channel_address, {parameter, CacheEntry}}}
         self._central_values_cache: dict[str, dict[str, dict[str, Any]]] = {}
         self._last_updated = INIT_DATETIME
+        # Time of the backend of the last fetch. Base of the next delta.
+        self._backend_timestamp: int | None = None
 
     @property
     def is_empty(self) -> bool:
         """Return if cache is empty."""
         return len(self._central_values_cache) == 0
 
-    async def load(self) -> None:
-        """Fetch device data from backend."""
+    @property
+    def backend_timestamp(self) -> int | None:
+        """Return the time of the backend of the last fetch."""
+        return self._backend_timestamp
+
+    async def load(self, changed_only: bool = False) -> None:
+        """
+        Fetch device data from backend.
+        With changed_only, only the datapoints, that changed since the last
+        fetch, are fetched and merged, if supported by the backend.
+        """
         if self._central.config.use_caches is False:
             _LOGGER.debug("load: not caching device data for %s", self._central.name)
             return
         _LOGGER.debug("load: device data for %s", self._central.name)
         if client := self._central.get_primary_client():
+            if (
+                changed_only
+                and not self.is_empty
+                and await client.fetch_changed_device_data()
+            ):
+                return
             await client.fetch_all_device_data()
 
     async def refresh_entity_data(
@@ -1342,11 +1603,45 @@ class DeviceDataCache:
                 )
 
     def add_device_data(
-        self, device_data: dict[str, dict[str, dict[str, Any]]]
+        self,
+        device_data: dict[str, dict[str, dict[str, Any]]],
+        backend_timestamp: int | None = None,
     ) -> None:
         """Add device data to cache."""
         self._central_values_cache = device_data
         self._last_updated = datetime.now()
+        self._backend_timestamp = backend_timestamp
+
+    async def add_device_data_records(
+        self,
+        records: AsyncIterator[tuple[str, str, str, Any]],
+        backend_timestamp: int | None = None,
+    ) -> int:
+        """
+        Add (interface, channel_address, parameter, value) records to cache,
+        while they are received. The cache is replaced with the first record.
+        Return the number of records.
+        """
+        device_data: dict[str, dict[str, dict[str, Any]]] = {}
+        count = 0
+        async for record in records:
+            if count == 0:
+                self.add_device_data(device_data=device_data)
+            _add_record(device_data=device_data, record=record)
+            count += 1
+        if count:
+            self._last_updated = datetime.now()
+            self._backend_timestamp = backend_timestamp
+        return count
+
+    def merge_device_data(
+        self, records: list[tuple[str, str, str, Any]], backend_timestamp: int
+    ) -> None:
+        """Merge the records of changed datapoints into the cache."""
+        for record in records:
+            _add_record(device_data=self._central_values_cache, record=record)
+        self._last_updated = datetime.now()
+        self._backend_timestamp = backend_timestamp
 
     def get_device_data(
         self,
@@ -1369,6 +1664,20 @@ class DeviceDataCache:
     async def clear(self) -> None:
         """Clear the cache."""
         self._central_values_cache.clear()
+        self._backend_timestamp = None
+
+
+def _add_record(
+    device_data: dict[str, dict[str, dict[str, Any]]],
+    record: tuple[str, str, str, Any],
+) -> None:
+    """Add a (interface, channel_address, parameter, value) record to device data."""
+    interface, channel_address, parameter, value = record
+    if (interface_data := device_data.get(interface)) is None:
+        interface_data = device_data[interface] = {}
+    if (channel_data := interface_data.get(channel_address)) is None:
+        channel_data = interface_data[channel_address] = {}
+    channel_data[parameter] = value
 
 
 class BasePersistentCache(ABC):
@@ -1384,8 +1693,23 @@ class BasePersistentCache(ABC):
         self._cache_dir: Final[str] = f"{central.config.storage_folder}/cache"
         self._filename: Final[str] = f"{central.name}_{filename}"
         self._persistant_cache: Final[dict[str, Any]] = persistant_cache
+        self._binary: Final[bool] = central.config.cache_format == HmCacheFormat.BINARY
         self.last_save: datetime = INIT_DATETIME
 
+    @property
+    def _file_path(self) -> str:
+        """Return the path of the file in the configured format."""
+        return os.path.join(
+            self._cache_dir, _get_cache_filename(self._filename, self._binary)
+        )
+
+    @property
+    def _other_file_path(self) -> str:
+        """Return the path of the file in the other format."""
+        return os.path.join(
+            self._cache_dir, _get_cache_filename(self._filename, not self._binary)
+        )
+
     async def save(self) -> HmDataOperationResult:
         """
         Save current name data in NAMES to disk.
@@ -1397,12 +1721,7 @@ class BasePersistentCache(ABC):
 
             self.last_save = datetime.now()
             if self._central.config.use_caches:
-                with open(
-                    file=os.path.join(self._cache_dir, self._filename),
-                    mode="w",
-                    encoding=DEFAULT_ENCODING,
-                ) as fptr:
-                    json.dump(self._persistant_cache, fptr)
+                self._save_file()
                 return HmDataOperationResult.SAVE_SUCCESS
 
             _LOGGER.debug("save: not saving cache for %s", self._central.name)
@@ -1413,20 +1732,29 @@ class BasePersistentCache(ABC):
     async def load(self) -> HmDataOperationResult:
         """
         Load file from disk into dict.
+        A file in the other format is migrated to the configured format.
         """
 
         def _load() -> HmDataOperationResult:
             if not check_or_create_directory(self._cache_dir):
                 return HmDataOperationResult.NO_LOAD
-            if not os.path.exists(os.path.join(self._cache_dir, self._filename)):
+            if os.path.exists(self._file_path):
+                data = _load_cache_file(self._file_path, binary=self._binary)
+            elif os.path.exists(self._other_file_path):
+                _LOGGER.debug(
+                    "load: Migrating %s to the %s format",
+                    self._other_file_path,
+                    self._central.config.cache_format,
+                )
+                data = _load_cache_file(self._other_file_path, binary=not self._binary)
+            else:
                 return HmDataOperationResult.NO_LOAD
-            with open(
-                file=os.path.join(self._cache_dir, self._filename),
-                mode="r",
-                encoding=DEFAULT_ENCODING,
-            ) as fptr:
-                self._persistant_cache.clear()
-                self._persistant_cache.update(json.load(fptr))
+            self._persistant_cache.clear()
+            self._persistant_cache.update(data)
+            if self._central.config.use_caches and os.path.exists(
+                self._other_file_path
+            ):
+                self._save_file()
             return HmDataOperationResult.LOAD_SUCCESS
 
         return await self._central.async_add_executor_job(_load)
@@ -1438,12 +1766,38 @@ class BasePersistentCache(ABC):
 
         def _clear() -> None:
             check_or_create_directory(self._cache_dir)
-            if os.path.exists(os.path.join(self._cache_dir, self._filename)):
-                os.unlink(os.path.join(self._cache_dir, self._filename))
+            for file_path in (self._file_path, self._other_file_path):
+                if os.path.exists(file_path):
+                    os.unlink(file_path)
             self._persistant_cache.clear()
 
         await self._central.async_add_executor_job(_clear)
 
+    def _save_file(self) -> None:
+        """Save the cache in the configured format and remove the other file."""
+        if self._binary:
+            serializer.dump_binary_file(
+                self._persistant_cache, file_path=self._file_path
+            )
+        else:
+            serializer.dump_file(self._persistant_cache, file_path=self._file_path)
+        if os.path.exists(self._other_file_path):
+            os.unlink(self._other_file_path)
+
+
+def _get_cache_filename(filename: str, binary: bool) -> str:
+    """Return the filename of a cache in the JSON or binary format."""
+    if binary:
+        return f"{os.path.splitext(filename)[0]}{FILE_BINARY_CACHE_EXTENSION}"
+    return filename
+
+
+def _load_cache_file(file_path: str, binary: bool) -> Any:
+    """Return the content of a cache file in the JSON or binary format."""
+    if binary:
+        return serializer.load_binary_file(file_path=file_path)
+    return serializer.load_file(file_path=file_path)
+
 
 class DeviceDescriptionCache(BasePersistentCache):
     """Cache for device/channel names."""
@@ -1839,7 +2193,12 @@ def cleanup_cache_dirs(instance_name: str, storage_folder: str) -> None:
             os.unlink(os.path.join(cache_dir, file_name))
 
     for file_to_delete in files_to_delete:
-        _delete_file(file_name=f"{instance_name}_{file_to_delete}")
+        for binary in (False, True):
+            _delete_file(
+                file_name=_get_cache_filename(
+                    f"{instance_name}_{file_to_delete}", binary=binary
+                )
+            )
 
 
 @dataclass
@@ -0,0 +1,107 @@
+"""
+Circuit breaker module.
+Fails calls to an unreachable backend fast (e.g. while the CCU reboots)
+instead of letting them wait for the timeout one after another.
+"""
+from __future__ import annotations
+
+import logging
+import time
+from typing import Final
+
+from hahomematic import config
+from hahomematic.backport import StrEnum
+from hahomematic.exceptions import NoConnection
+
+_LOGGER = logging.getLogger(__name__)
+
+# Connection checks and (de-)init always reach the backend.
+# Their outcome closes or opens the circuit.
+_PROBE_METHODS: Final = frozenset({"clientServerInitialized", "init", "ping"})
+
+
+class CircuitState(StrEnum):
+    """Enum with the states of a circuit breaker."""
+
+    CLOSED: Final = "closed"
+    HALF_OPEN: Final = "half_open"
+    OPEN: Final = "open"
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker of an interface.
+    Opens after config.CIRCUIT_BREAKER_FAILURE_THRESHOLD consecutive connection
+    failures or if tripped by the connection check. While open, calls fail
+    with NoConnection. After config.CIRCUIT_BREAKER_COOL_DOWN seconds
+    a single call is let through as probe (half open). Its success closes
+    the circuit, its failure opens the circuit again.
+    """
+
+    def __init__(self, name: str):
+        """Init the circuit breaker."""
+        self.name: Final = name
+        self._failures: int = 0
+        self._opened_at: float | None = None
+        self._probe_in_flight: bool = False
+        self.rejected: int = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Return the state of the circuit."""
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if time.monotonic() - self._opened_at < config.CIRCUIT_BREAKER_COOL_DOWN:
+            return CircuitState.OPEN
+        return CircuitState.HALF_OPEN
+
+    @property
+    def is_open(self) -> bool:
+        """Return if calls are rejected."""
+        return self.state == CircuitState.OPEN
+
+    def check(self, method: str) -> bool:
+        """
+        Raise NoConnection, if the call must not reach the backend.
+        Return True, if the call is the probe of the half open circuit.
+        """
+        if method in _PROBE_METHODS or (state := self.state) == CircuitState.CLOSED:
+            return False
+        if state == CircuitState.HALF_OPEN and not self._probe_in_flight:
+            _LOGGER.debug("check: Probing %s with %s", self.name, method)
+            self._probe_in_flight = True
+            return True
+        self.rejected += 1
+        raise NoConnection(f"Circuit breaker for {self.name} is open ({method})")
+
+    def record_success(self) -> None:
+        """Record a response of the backend."""
+        if self._opened_at is not None:
+            _LOGGER.info("record_success: Closing circuit breaker for %s", self.name)
+        self._failures = 0
+        self._opened_at = None
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a connection failure."""
+        self._failures += 1
+        if (
+            self._probe_in_flight
+            or self._failures >= config.CIRCUIT_BREAKER_FAILURE_THRESHOLD
+        ):
+            self.trip()
+
+    def end_probe(self) -> None:
+        """Let the next call probe, if the probe ended without an outcome."""
+        self._probe_in_flight = False
+
+    def trip(self) -> None:
+        """Open the circuit."""
+        if self._opened_at is None:
+            _LOGGER.warning(
+                "trip: Opening circuit breaker for %s for %is",
+                self.name,
+                config.CIRCUIT_BREAKER_COOL_DOWN,
+            )
+        self._opened_at = time.monotonic()
+        self._probe_in_flight = False
@@ -6,13 +6,19 @@ import asyncio
 from dataclasses import dataclass
 from datetime import datetime
 import importlib.resources
-import json
 import logging
 import os
 from typing import Any, Final, cast
+import xmlrpc.client
 
-from hahomematic import config
+from hahomematic import config, serializer
 import hahomematic.central_unit as hmcu
+from hahomematic.circuit_breaker import CircuitBreaker
+from hahomematic.command_scheduler import (
+    CommandPriority,
+    CommandScheduler,
+    CommandSchedulerStatistics,
+)
 from hahomematic.config import CHECK_INTERVAL
 from hahomematic.const import (
     ATTR_ADDRESS,
@@ -24,7 +30,7 @@ from hahomematic.const import (
     BACKEND_HOMEGEAR,
     BACKEND_LOCAL,
     BACKEND_PYDEVCCU,
-    DEFAULT_ENCODING,
+    HH_EVENT_PARAMSET_DESCRIPTIONS_FETCHED,
     HM_ADDRESS,
     HM_NAME,
     HM_PARAMSETS,
@@ -32,10 +38,13 @@ from hahomematic.const import (
     HM_TYPE,
     HM_VIRTUAL_REMOTE_TYPES,
     IF_BIDCOS_RF_NAME,
+    IF_HMIP_RF_NAME,
     IF_NAMES,
     INIT_DATETIME,
     LOCAL_INTERFACE,
     LOCAL_SERIAL,
+    PARAM_CARRIER_SENSE_LEVEL,
+    PARAM_DUTY_CYCLE_LEVEL,
     PARAMSET_KEY_MASTER,
     PARAMSET_KEY_VALUES,
     PROXY_DE_INIT_FAILED,
@@ -53,19 +62,36 @@ from hahomematic.exceptions import (
     BaseHomematicException,
     HaHomematicException,
     NoConnection,
+    ProxyException,
 )
 from hahomematic.helpers import (
+    HubDataDelta,
+    HubDataSnapshot,
     ProgramData,
     SystemVariableData,
     build_headers,
     build_xml_rpc_uri,
     get_channel_no,
+    get_device_address,
 )
 from hahomematic.json_rpc_client import JsonRpcAioHttpClient
-from hahomematic.xml_rpc_proxy import XmlRpcProxy
+from hahomematic.rpc_metrics import MethodMetrics, RpcMetrics
+from hahomematic.single_flight import SingleFlight, SingleFlightStatistics
+from hahomematic.xml_rpc_proxy import AioXmlRpcProxy, BaseXmlRpcProxy, XmlRpcProxy
 
 _LOGGER = logging.getLogger(__name__)
 
+# Interfaces, whose commands are paced by the duty cycle.
+_DUTY_CYCLE_INTERFACES: Final[tuple[str, ...]] = (IF_HMIP_RF_NAME, IF_BIDCOS_RF_NAME)
+# Fault code and texts of backends, that do not know system.multicall.
+_FAULT_CODE_METHOD_NOT_FOUND: Final = -32601
+_MULTICALL_UNSUPPORTED_MARKERS: Final[tuple[str, ...]] = (
+    "system.multicall",
+    "unknown method",
+    "method not found",
+    "not supported",
+)
+
 
 class Client(ABC):
     """
@@ -83,8 +109,10 @@ class Client(ABC):
         # This is the actual interface_id used for init
         self.interface_id: Final[str] = client_config.interface_id
         # for all device related interaction
-        self._proxy: Final[XmlRpcProxy] = client_config.xml_rpc_proxy
-        self._proxy_read: Final[XmlRpcProxy] = client_config.xml_rpc_proxy_read
+        self._proxy: Final[BaseXmlRpcProxy] = client_config.xml_rpc_proxy
+        self._proxy_read: Final[BaseXmlRpcProxy] = client_config.xml_rpc_proxy_read
+        # shared with the proxies
+        self.circuit_breaker: Final[CircuitBreaker] = client_config.circuit_breaker
         self._json_rpc_client: Final[
             JsonRpcAioHttpClient
         ] = self.central.json_rpc_client
@@ -93,12 +121,50 @@ class Client(ABC):
         self._attr_available: bool = True
         self.last_updated: datetime = INIT_DATETIME
         self._connection_error_count: int = 0
+        self._multicall_supported: bool = True
+        self._sema_fetch_paramset_descriptions: Final = asyncio.Semaphore(
+            config.PARAMSET_DESCRIPTIONS_MAX_CONCURRENCY
+        )
+        # concurrent identical reads share one call
+        self._single_flight: Final[SingleFlight] = SingleFlight()
+        self._command_scheduler: Final[CommandScheduler | None] = (
+            CommandScheduler(interface_id=self.interface_id, send=self._send_command)
+            if self.central.config.use_command_scheduler
+            and client_config.interface in _DUTY_CYCLE_INTERFACES
+            else None
+        )
 
     @property
     def available(self) -> bool:
         """Return the availability of the client."""
         return self._attr_available
 
+    @property
+    def single_flight_statistics(self) -> SingleFlightStatistics:
+        """Return the counters of the shared reads."""
+        return self._single_flight.statistics
+
+    @property
+    def rpc_metrics(self) -> dict[str, MethodMetrics]:
+        """Return the metrics of the XML-RPC calls by method."""
+        return self.config.rpc_metrics.snapshot()
+
+    @property
+    def command_scheduler_statistics(self) -> CommandSchedulerStatistics | None:
+        """Return the counters of the command scheduler, if commands are paced."""
+        if self._command_scheduler is None:
+            return None
+        return self._command_scheduler.statistics
+
+    def set_rf_level(self, parameter: str, value: Any) -> None:
+        """Pass the duty cycle / carrier sense level of the interface."""
+        if self._command_scheduler is None:
+            return
+        if parameter == PARAM_DUTY_CYCLE_LEVEL:
+            self._command_scheduler.set_duty_cycle_level(value)
+        elif parameter == PARAM_CARRIER_SENSE_LEVEL:
+            self._command_scheduler.set_carrier_sense_level(value)
+
     @property
     @abstractmethod
     def model(self) -> str:
@@ -204,6 +270,8 @@ class Client(ABC):
 
     def stop(self) -> None:
         """Stop depending services."""
+        if self._command_scheduler:
+            self._command_scheduler.clear()
         self._proxy.stop()
         self._proxy_read.stop()
 
@@ -211,6 +279,13 @@ class Client(ABC):
     async def fetch_all_device_data(self) -> None:
         """fetch all device data from CCU."""
 
+    async def fetch_changed_device_data(self) -> bool:
+        """
+        Fetch the device data, that changed since the last fetch.
+        Return False, if not supported or the full device data is required.
+        """
+        return False
+
     @abstractmethod
     async def fetch_device_details(self) -> None:
         """Fetch names from backend."""
@@ -227,6 +302,7 @@ class Client(ABC):
             self._connection_error_count += 1
 
         if self._connection_error_count > 3:
+            self.circuit_breaker.trip()
             self._mark_all_devices_forced_availability(
                 forced_availability=HmForcedDeviceAvailability.FORCE_FALSE
             )
@@ -276,8 +352,18 @@ class Client(ABC):
         """Execute a program on CCU / Homegear."""
 
     @abstractmethod
-    async def set_system_variable(self, name: str, value: Any) -> None:
-        """Set a system variable on CCU / Homegear."""
+    async def set_system_variable(self, name: str, value: Any) -> bool:
+        """Set a system variable on CCU / Homegear. Return the success."""
+
+    async def set_system_variables(self, values: dict[str, Any]) -> dict[str, bool]:
+        """
+        Set several system variables on CCU / Homegear.
+        Return the success by name.
+        """
+        return {
+            name: await self.set_system_variable(name=name, value=value)
+            for name, value in values.items()
+        }
 
     @abstractmethod
     async def delete_system_variable(self, name: str) -> None:
@@ -313,6 +399,40 @@ class Client(ABC):
     async def get_serial(self) -> str:
         """Get the serial of the backend."""
 
+    async def fetch_device_details_rooms_functions(
+        self,
+    ) -> tuple[dict[str, set[str]], dict[str, set[str]]]:
+        """Fetch names from backend and return the rooms and functions."""
+        await self.fetch_device_details()
+        return await self.get_all_rooms(), await self.get_all_functions()
+
+    async def get_hub_data(
+        self, include_internal_sysvars: bool, include_internal_programs: bool
+    ) -> HubDataSnapshot:
+        """Get all system variables and programs from CCU / Homegear."""
+        return HubDataSnapshot(
+            variables=await self.get_all_system_variables(
+                include_internal=include_internal_sysvars
+            ),
+            programs=await self.get_all_programs(
+                include_internal=include_internal_programs
+            ),
+        )
+
+    async def get_hub_data_since(
+        self,
+        since: int,
+        known_sysvar_ids: set[str],
+        known_program_ids: set[str],
+        include_internal_sysvars: bool,
+        include_internal_programs: bool,
+    ) -> HubDataDelta | None:
+        """
+        Get the changes of system variables and programs since the backend time.
+        Return None, if not supported.
+        """
+        return None
+
     def get_virtual_remote(self) -> HmDevice | None:
         """Get the virtual remote for the Client."""
         for device_type in HM_VIRTUAL_REMOTE_TYPES:
@@ -380,9 +500,14 @@ class Client(ABC):
                 call_source,
             )
             if paramset_key == PARAMSET_KEY_VALUES:
-                return await self._proxy_read.getValue(channel_address, parameter)
+                return await self._single_flight.run(
+                    key=(channel_address, paramset_key, parameter),
+                    func=lambda: self._proxy_read.getValue(channel_address, parameter),
+                )
             paramset = (
-                await self._proxy_read.getParamset(channel_address, PARAMSET_KEY_MASTER)
+                await self._get_paramset(
+                    address=channel_address, paramset_key=PARAMSET_KEY_MASTER
+                )
                 or {}
             )
             return paramset.get(parameter)
@@ -397,6 +522,98 @@ class Client(ABC):
             )
             raise HaHomematicException from hhe
 
+    async def get_values(
+        self,
+        requests: list[tuple[str, str, str]],
+        call_source: HmCallSource = HmCallSource.MANUAL_OR_SCHEDULED,
+    ) -> list[Any]:
+        """
+        Return the values of (channel_address, paramset_key, parameter) from CCU.
+        The values are fetched by system.multicall. A failed read is returned
+        as BaseHomematicException at the position of the request.
+        """
+        _LOGGER.debug(
+            "get_values: %i values, source:%s",
+            len(requests),
+            call_source,
+        )
+        calls: list[tuple[str, tuple[Any, ...]]] = []
+        positions: list[int] = []
+        master_positions: dict[str, int] = {}
+        for channel_address, paramset_key, parameter in requests:
+            if paramset_key == PARAMSET_KEY_VALUES:
+                positions.append(len(calls))
+                calls.append(("getValue", (channel_address, parameter)))
+                continue
+            # The MASTER paramset is read only once per channel.
+            if channel_address not in master_positions:
+                master_positions[channel_address] = len(calls)
+                calls.append(
+                    ("getParamset", (channel_address, PARAMSET_KEY_MASTER))
+                )
+            positions.append(master_positions[channel_address])
+
+        results = await self._multicall(proxy=self._proxy_read, calls=calls)
+        values: list[Any] = []
+        for (_, paramset_key, parameter), position in zip(requests, positions):
+            result = results[position]
+            if paramset_key != PARAMSET_KEY_VALUES and not isinstance(
+                result, BaseHomematicException
+            ):
+                result = (result or {}).get(parameter)
+            values.append(result)
+        return values
+
+    async def _multicall(
+        self, proxy: BaseXmlRpcProxy, calls: list[tuple[str, tuple[Any, ...]]]
+    ) -> list[Any]:
+        """
+        Execute (method_name, params) calls by system.multicall
+        in batches of config.MULTICALL_BATCH_SIZE.
+        Faults of single calls are returned as ProxyException.
+        Falls back to single calls, if the backend does not support multicall.
+        """
+        results: list[Any] = []
+        for start in range(0, len(calls), config.MULTICALL_BATCH_SIZE):
+            batch = calls[start : start + config.MULTICALL_BATCH_SIZE]
+            if self._multicall_supported:
+                try:
+                    batch_results = await proxy.system.multicall(
+                        [
+                            {"methodName": method_name, "params": list(params)}
+                            for method_name, params in batch
+                        ]
+                    )
+                    results.extend(
+                        _get_multicall_result(result) for result in batch_results
+                    )
+                    continue
+                except ProxyException as pex:
+                    if not _is_multicall_unsupported(pex):
+                        _LOGGER.debug(
+                            "multicall failed with %s [%s]", pex.name, pex.args
+                        )
+                        results.extend(pex for _ in batch)
+                        continue
+                    _LOGGER.debug(
+                        "multicall: Not supported by %s. Using single calls: %s",
+                        self.interface_id,
+                        pex.args,
+                    )
+                    self._multicall_supported = False
+                except BaseHomematicException as hhe:
+                    _LOGGER.debug(
+                        "multicall failed with %s [%s]", hhe.name, hhe.args
+                    )
+                    results.extend(hhe for _ in batch)
+                    continue
+            for method_name, params in batch:
+                try:
+                    results.append(await getattr(proxy, method_name)(*params))
+                except BaseHomematicException as hhe:
+                    results.append(hhe)
+        return results
+
     async def _set_value(
         self,
         channel_address: str,
@@ -430,21 +647,52 @@ class Client(ABC):
         rx_mode: str | None = None,
     ) -> None:
         """Set single value on paramset VALUES."""
-        if paramset_key == PARAMSET_KEY_VALUES:
-            await self._set_value(
-                channel_address=channel_address,
+        if self._command_scheduler:
+            await self._command_scheduler.schedule(
+                address=channel_address,
+                paramset_key=paramset_key,
                 parameter=parameter,
                 value=value,
                 rx_mode=rx_mode,
+                priority=_get_command_priority(paramset_key=paramset_key),
             )
             return
-        await self.put_paramset(
+        await self._send_command(
             address=channel_address,
             paramset_key=paramset_key,
-            value={parameter: value},
+            parameter=parameter,
+            value=value,
             rx_mode=rx_mode,
         )
 
+    async def _send_command(
+        self,
+        address: str,
+        paramset_key: str,
+        parameter: str | None,
+        value: Any,
+        rx_mode: str | None,
+    ) -> None:
+        """Send a value or a paramset (without parameter) to the CCU."""
+        if parameter is None:
+            await self._put_paramset(
+                address=address, paramset_key=paramset_key, value=value, rx_mode=rx_mode
+            )
+        elif paramset_key == PARAMSET_KEY_VALUES:
+            await self._set_value(
+                channel_address=address,
+                parameter=parameter,
+                value=value,
+                rx_mode=rx_mode,
+            )
+        else:
+            await self._put_paramset(
+                address=address,
+                paramset_key=paramset_key,
+                value={parameter: value},
+                rx_mode=rx_mode,
+            )
+
     async def get_paramset(self, address: str, paramset_key: str) -> Any:
         """
         Return a paramset from CCU.
@@ -457,7 +705,7 @@ class Client(ABC):
                 address,
                 paramset_key,
             )
-            return await self._proxy_read.getParamset(address, paramset_key)
+            return await self._get_paramset(address=address, paramset_key=paramset_key)
         except BaseHomematicException as hhe:
             _LOGGER.debug(
                 "get_paramset failed with %s [%s]: %s, %s",
@@ -468,6 +716,13 @@ class Client(ABC):
             )
             raise HaHomematicException from hhe
 
+    async def _get_paramset(self, address: str, paramset_key: str) -> Any:
+        """Return a paramset from CCU, shared with identical reads in flight."""
+        return await self._single_flight.run(
+            key=(address, paramset_key, None),
+            func=lambda: self._proxy_read.getParamset(address, paramset_key),
+        )
+
     async def put_paramset(
         self,
         address: str,
@@ -480,6 +735,28 @@ class Client(ABC):
         Address is usually the channel_address,
         but for bidcos devices there is a master paramset at the device.
         """
+        if self._command_scheduler:
+            await self._command_scheduler.schedule(
+                address=address,
+                paramset_key=paramset_key,
+                parameter=None,
+                value=value,
+                rx_mode=rx_mode,
+                priority=_get_command_priority(paramset_key=paramset_key),
+            )
+            return
+        await self._put_paramset(
+            address=address, paramset_key=paramset_key, value=value, rx_mode=rx_mode
+        )
+
+    async def _put_paramset(
+        self,
+        address: str,
+        paramset_key: str,
+        value: Any,
+        rx_mode: str | None = None,
+    ) -> None:
+        """Set paramsets on the CCU."""
         try:
             if rx_mode:
                 await self._proxy.putParamset(address, paramset_key, value, rx_mode)
@@ -534,9 +811,57 @@ class Client(ABC):
         """
         Fetch paramsets for provided device description.
         """
-        data = await self.get_paramset_descriptions(
-            device_description=device_description
+        await self.fetch_all_paramset_descriptions(
+            device_descriptions=[device_description]
         )
+
+    async def fetch_all_paramset_descriptions(
+        self, device_descriptions: list[dict[str, Any]]
+    ) -> None:
+        """
+        Fetch paramsets for provided device descriptions.
+        The devices are fetched in chunks with a limited number of concurrent
+        requests per interface. The progress is reported as system event.
+        """
+        chunks = _get_device_chunks(device_descriptions=device_descriptions)
+        device_count = sum(count for _, count in chunks)
+        fetched_device_count = 0
+
+        async def fetch_chunk(
+            chunk_descriptions: list[dict[str, Any]], chunk_device_count: int
+        ) -> None:
+            """Fetch the paramsets of a chunk and report the progress."""
+            nonlocal fetched_device_count
+            async with self._sema_fetch_paramset_descriptions:
+                data = await self._get_paramset_descriptions_of(
+                    device_descriptions=chunk_descriptions, only_relevant=True
+                )
+            self._add_paramset_descriptions(data=data)
+            fetched_device_count += chunk_device_count
+            if (
+                self.central.callback_system_event is not None
+                and callable(self.central.callback_system_event)
+            ):
+                # pylint: disable=not-callable
+                self.central.callback_system_event(
+                    HH_EVENT_PARAMSET_DESCRIPTIONS_FETCHED,
+                    self.interface_id,
+                    fetched_device_count,
+                    device_count,
+                )
+
+        await asyncio.gather(
+            *(
+                fetch_chunk(
+                    chunk_descriptions=chunk_descriptions,
+                    chunk_device_count=chunk_device_count,
+                )
+                for chunk_descriptions, chunk_device_count in chunks
+            )
+        )
+
+    def _add_paramset_descriptions(self, data: dict[str, dict[str, Any]]) -> None:
+        """Add fetched paramset descriptions to the central."""
         for address, paramsets in data.items():
             _LOGGER.debug("fetch_paramset_descriptions for %s", address)
             for paramset_key, paramset_description in paramsets.items():
@@ -551,12 +876,50 @@ class Client(ABC):
         self, device_description: dict[str, Any], only_relevant: bool = True
     ) -> dict[str, dict[str, Any]]:
         """Get paramsets for provided device description."""
-        if not device_description:
-            return {}
+        return await self._get_paramset_descriptions_of(
+            device_descriptions=[device_description], only_relevant=only_relevant
+        )
+
+    async def _get_paramset_descriptions_of(
+        self, device_descriptions: list[dict[str, Any]], only_relevant: bool
+    ) -> dict[str, dict[str, Any]]:
+        """Get paramsets for provided device descriptions."""
         paramsets: dict[str, dict[str, Any]] = {}
+        requests: list[tuple[str, str]] = []
+        for device_description in device_descriptions:
+            if not device_description:
+                continue
+            address = device_description[HM_ADDRESS]
+            paramsets[address] = {}
+            _LOGGER.debug("get_paramset_descriptions for %s", address)
+            requests.extend(
+                (address, paramset_key)
+                for paramset_key in self._get_relevant_paramset_keys(
+                    device_description=device_description,
+                    only_relevant=only_relevant,
+                )
+            )
+
+        results = await self._get_paramset_descriptions(requests=requests)
+        for (address, paramset_key), result in zip(requests, results):
+            if isinstance(result, BaseHomematicException):
+                _LOGGER.warning(
+                    "get_paramsets failed with %s [%s] for %s address %s.",
+                    result.name,
+                    result.args,
+                    paramset_key,
+                    address,
+                )
+                continue
+            paramsets[address][paramset_key] = result
+        return paramsets
+
+    def _get_relevant_paramset_keys(
+        self, device_description: dict[str, Any], only_relevant: bool
+    ) -> list[str]:
+        """Return the paramset keys to fetch for the device description."""
         address = device_description[HM_ADDRESS]
-        paramsets[address] = {}
-        _LOGGER.debug("get_paramset_descriptions for %s", address)
+        paramset_keys: list[str] = []
         for paramset_key in device_description.get(HM_PARAMSETS, []):
             if (device_channel := get_channel_no(address)) is None:
                 # No paramsets at root device
@@ -577,19 +940,20 @@ class Client(ABC):
                 )
             ):
                 continue
-            try:
-                paramsets[address][paramset_key] = await self._get_paramset_description(
-                    address=address, paramset_key=paramset_key
-                )
-            except BaseHomematicException as hhe:
-                _LOGGER.warning(
-                    "get_paramsets failed with %s [%s] for %s address %s.",
-                    hhe.name,
-                    hhe.args,
-                    paramset_key,
-                    address,
-                )
-        return paramsets
+            paramset_keys.append(paramset_key)
+        return paramset_keys
+
+    async def _get_paramset_descriptions(
+        self, requests: list[tuple[str, str]]
+    ) -> list[Any]:
+        """Get paramset descriptions of (address, paramset_key) from CCU."""
+        return await self._multicall(
+            proxy=self._proxy_read,
+            calls=[
+                ("getParamsetDescription", (address, paramset_key))
+                for address, paramset_key in requests
+            ],
+        )
 
     async def _get_paramset_description(self, address: str, paramset_key: str) -> Any:
         """Get paramset description from CCU."""
@@ -599,14 +963,9 @@ class Client(ABC):
         self, device_descriptions: list[dict[str, Any]]
     ) -> dict[str, dict[str, Any]]:
         """Get all paramset descriptions for provided device descriptions."""
-        all_paramsets: dict[str, dict[str, Any]] = {}
-        for device_description in device_descriptions:
-            all_paramsets.update(
-                await self.get_paramset_descriptions(
-                    device_description=device_description, only_relevant=False
-                )
-            )
-        return all_paramsets
+        return await self._get_paramset_descriptions_of(
+            device_descriptions=device_descriptions, only_relevant=False
+        )
 
     async def update_paramset_descriptions(self, device_address: str) -> None:
         """
@@ -652,40 +1011,99 @@ class ClientCCU(Client):
         """
         Get all names via JSON-RPS and store in data.NAMES.
         """
-        if json_result := await self._json_rpc_client.get_device_details():
-            for device in json_result:
+        self._add_device_details(
+            device_details=await self._json_rpc_client.get_device_details()
+        )
+
+    async def fetch_device_details_rooms_functions(
+        self,
+    ) -> tuple[dict[str, set[str]], dict[str, set[str]]]:
+        """
+        Fetch names from backend and return the rooms and functions.
+        All are fetched within one JSON-RPC batch.
+        """
+        (
+            device_details,
+            channel_ids_room,
+            channel_ids_function,
+        ) = await self._json_rpc_client.get_device_details_rooms_functions()
+        self._add_device_details(device_details=device_details)
+        return (
+            self._get_names_by_address(names_by_channel_id=channel_ids_room),
+            self._get_names_by_address(names_by_channel_id=channel_ids_function),
+        )
+
+    def _add_device_details(self, device_details: list[dict[str, Any]]) -> None:
+        """Add the names, channel_ids and interfaces of the device details."""
+        if not device_details:
+            _LOGGER.debug(
+                "fetch_names_json: Unable to fetch device details via JSON-RPC."
+            )
+            return
+        for device in device_details:
+            self.central.device_details.add_name(
+                address=device[ATTR_ADDRESS], name=device[ATTR_NAME]
+            )
+            self.central.device_details.add_device_channel_id(
+                address=device[ATTR_ADDRESS], channel_id=device[ATTR_ID]
+            )
+            for channel in device.get(ATTR_CHANNELS, []):
                 self.central.device_details.add_name(
-                    address=device[ATTR_ADDRESS], name=device[ATTR_NAME]
+                    address=channel[ATTR_ADDRESS], name=channel[ATTR_NAME]
                 )
                 self.central.device_details.add_device_channel_id(
-                    address=device[ATTR_ADDRESS], channel_id=device[ATTR_ID]
+                    address=channel[ATTR_ADDRESS], channel_id=channel[ATTR_ID]
                 )
-                for channel in device.get(ATTR_CHANNELS, []):
-                    self.central.device_details.add_name(
-                        address=channel[ATTR_ADDRESS], name=channel[ATTR_NAME]
-                    )
-                    self.central.device_details.add_device_channel_id(
-                        address=channel[ATTR_ADDRESS], channel_id=channel[ATTR_ID]
-                    )
-                self.central.device_details.add_interface(
-                    device[ATTR_ADDRESS], device[ATTR_INTERFACE]
-                )
-        else:
-            _LOGGER.debug(
-                "fetch_names_json: Unable to fetch device details via JSON-RPC."
+            self.central.device_details.add_interface(
+                device[ATTR_ADDRESS], device[ATTR_INTERFACE]
             )
 
     async def fetch_all_device_data(self) -> None:
         """fetch all device data from CCU."""
+        # Fetched first, so that changes while fetching are part of the next delta.
+        backend_timestamp = await self._json_rpc_client.get_backend_time()
+        try:
+            if count := await self.central.device_data.add_device_data_records(
+                records=self._json_rpc_client.iter_all_device_data(),
+                backend_timestamp=backend_timestamp,
+            ):
+                _LOGGER.debug("fetch_all_device_data: Streamed %i datapoints.", count)
+                return
+        except BaseHomematicException as hhe:
+            _LOGGER.debug(
+                "fetch_all_device_data: Streaming failed: %s [%s]. "
+                "Fetching at once",
+                hhe.name,
+                hhe.args,
+            )
         if device_data := await self._json_rpc_client.get_all_device_data():
             _LOGGER.debug("fetch_all_device_data: Fetched all device data.")
-            self.central.device_data.add_device_data(device_data=device_data)
+            self.central.device_data.add_device_data(
+                device_data=device_data, backend_timestamp=backend_timestamp
+            )
         else:
             _LOGGER.debug(
                 "fetch_all_device_data: "
                 "Unable to get all device data via JSON-RPC RegaScript."
             )
 
+    async def fetch_changed_device_data(self) -> bool:
+        """Fetch the device data, that changed since the last fetch, from CCU."""
+        if (since := self.central.device_data.backend_timestamp) is None:
+            return False
+        if (
+            delta := await self._json_rpc_client.get_device_data_since(since=since)
+        ) is None:
+            return False
+        backend_timestamp, records = delta
+        _LOGGER.debug(
+            "fetch_changed_device_data: Fetched %i changed datapoints.", len(records)
+        )
+        self.central.device_data.merge_device_data(
+            records=records, backend_timestamp=backend_timestamp
+        )
+        return True
+
     async def _check_connection_availability(self) -> bool:
         """Check if _proxy is still initialized."""
         try:
@@ -701,9 +1119,16 @@ class ClientCCU(Client):
         """Execute a program on CCU."""
         await self._json_rpc_client.execute_program(pid=pid)
 
-    async def set_system_variable(self, name: str, value: Any) -> None:
-        """Set a system variable on CCU / Homegear."""
-        await self._json_rpc_client.set_system_variable(name=name, value=value)
+    async def set_system_variable(self, name: str, value: Any) -> bool:
+        """Set a system variable on CCU / Homegear. Return the success."""
+        return await self._json_rpc_client.set_system_variable(name=name, value=value)
+
+    async def set_system_variables(self, values: dict[str, Any]) -> dict[str, bool]:
+        """
+        Set several system variables on CCU within one script.
+        Return the success by name.
+        """
+        return await self._json_rpc_client.set_system_variables(values=values)
 
     async def delete_system_variable(self, name: str) -> None:
         """Delete a system variable from CCU / Homegear."""
@@ -731,31 +1156,61 @@ class ClientCCU(Client):
             include_internal=include_internal
         )
 
+    async def get_hub_data(
+        self, include_internal_sysvars: bool, include_internal_programs: bool
+    ) -> HubDataSnapshot:
+        """
+        Get all system variables, programs and the CCU time
+        within one JSON-RPC batch.
+        """
+        return await self._json_rpc_client.get_hub_data(
+            include_internal_sysvars=include_internal_sysvars,
+            include_internal_programs=include_internal_programs,
+        )
+
+    async def get_hub_data_since(
+        self,
+        since: int,
+        known_sysvar_ids: set[str],
+        known_program_ids: set[str],
+        include_internal_sysvars: bool,
+        include_internal_programs: bool,
+    ) -> HubDataDelta | None:
+        """Get the changes of system variables and programs since the CCU time."""
+        return await self._json_rpc_client.get_hub_data_since(
+            since=since,
+            known_sysvar_ids=known_sysvar_ids,
+            known_program_ids=known_program_ids,
+            include_internal_sysvars=include_internal_sysvars,
+            include_internal_programs=include_internal_programs,
+        )
+
     async def get_all_rooms(self) -> dict[str, set[str]]:
         """Get all rooms from CCU."""
-        rooms: dict[str, set[str]] = {}
-        device_channel_ids = self.central.device_details.device_channel_ids
-        channel_ids_room = await self._json_rpc_client.get_all_channel_ids_room()
-        for address, channel_id in device_channel_ids.items():
-            if names := channel_ids_room.get(channel_id):
-                if address not in rooms:
-                    rooms[address] = set()
-                rooms[address].update(names)
-        return rooms
+        return self._get_names_by_address(
+            names_by_channel_id=await self._json_rpc_client.get_all_channel_ids_room()
+        )
 
     async def get_all_functions(self) -> dict[str, set[str]]:
         """Get all functions from CCU."""
-        functions: dict[str, set[str]] = {}
-        device_channel_ids = self.central.device_details.device_channel_ids
-        channel_ids_function = (
-            await self._json_rpc_client.get_all_channel_ids_function()
+        return self._get_names_by_address(
+            names_by_channel_id=(
+                await self._json_rpc_client.get_all_channel_ids_function()
+            )
         )
+
+    def _get_names_by_address(
+        self, names_by_channel_id: dict[str, set[str]]
+    ) -> dict[str, set[str]]:
+        """Return the names of rooms / functions by device and channel address."""
+        names_by_address: dict[str, set[str]] = {}
+        device_channel_ids = self.central.device_details.device_channel_ids
         for address, channel_id in device_channel_ids.items():
-            if sections := channel_ids_function.get(channel_id):
-                if address not in functions:
-                    functions[address] = set()
-                functions[address].update(sections)
-        return functions
+            if names := names_by_channel_id.get(channel_id):
+                if address not in names_by_address:
+                    names_by_address[address] = set()
+                names_by_address[address].update(names)
+        return names_by_address
 
     async def get_serial(self) -> str:
         """Get the serial of the backend."""
@@ -816,12 +1271,14 @@ class ClientHomegear(Client):
         """Execute a program on Homegear."""
         return None
 
-    async def set_system_variable(self, name: str, value: Any) -> None:
-        """Set a system variable on CCU / Homegear."""
+    async def set_system_variable(self, name: str, value: Any) -> bool:
+        """Set a system variable on CCU / Homegear. Return the success."""
         try:
             await self._proxy.setSystemVariable(name, value)
+            return True
         except BaseHomematicException as hhe:
             _LOGGER.warning("set_system_variable failed: %s [%s]", hhe.name, hhe.args)
+        return False
 
     async def delete_system_variable(self, name: str) -> None:
         """Delete a system variable from CCU / Homegear."""
@@ -935,8 +1392,9 @@ class ClientLocal(Client):
     async def execute_program(self, pid: str) -> None:
         """Execute a program on CCU / Homegear."""
 
-    async def set_system_variable(self, name: str, value: Any) -> None:
-        """Set a system variable on CCU / Homegear."""
+    async def set_system_variable(self, name: str, value: Any) -> bool:
+        """Set a system variable on CCU / Homegear. Return the success."""
+        return True
 
     async def delete_system_variable(self, name: str) -> None:
         """Delete a system variable from CCU / Homegear."""
@@ -1019,6 +1477,14 @@ class ClientLocal(Client):
         """Return a value from CCU."""
         return None
 
+    async def get_values(
+        self,
+        requests: list[tuple[str, str, str]],
+        call_source: HmCallSource = HmCallSource.MANUAL_OR_SCHEDULED,
+    ) -> list[Any]:
+        """Return the values of (channel_address, paramset_key, parameter)."""
+        return [None for _ in requests]
+
     async def set_value(
         self,
         channel_address: str,
@@ -1061,6 +1527,17 @@ class ClientLocal(Client):
 
         return self._paramset_descriptions_cache.get(address, {}).get(paramset_key)
 
+    async def _get_paramset_descriptions(
+        self, requests: list[tuple[str, str]]
+    ) -> list[Any]:
+        """Get paramset descriptions of (address, paramset_key)."""
+        return [
+            await self._get_paramset_description(
+                address=address, paramset_key=paramset_key
+            )
+            for address, paramset_key in requests
+        ]
+
     async def put_paramset(
         self,
         address: str,
@@ -1112,13 +1589,9 @@ class ClientLocal(Client):
         package_path = str(importlib.resources.files(package=package))
 
         def _load() -> Any | None:
-
-            with open(
-                file=os.path.join(package_path, resource, filename),
-                mode="r",
-                encoding=DEFAULT_ENCODING,
-            ) as fptr:
-                return json.load(fptr)
+            return serializer.load_file(
+                file_path=os.path.join(package_path, resource, filename)
+            )
 
         return await self.central.async_add_executor_job(_load)
 
@@ -1160,24 +1633,46 @@ class _ClientConfig:
             username=central.config.username,
             password=central.config.password,
         )
-        self.xml_rpc_proxy: Final[XmlRpcProxy] = XmlRpcProxy(
-            max_workers=1,
-            thread_name_prefix=f"XmlRpcProxy for {self.interface_id}",
-            uri=self.xml_rpc_uri,
-            headers=self.xml_rpc_headers,
-            tls=central.config.tls,
-            verify_tls=central.config.verify_tls,
+        # shared by both proxies of the interface
+        self.rpc_metrics: Final[RpcMetrics] = RpcMetrics(name=self.interface_id)
+        self.circuit_breaker: Final[CircuitBreaker] = CircuitBreaker(
+            name=self.interface_id
         )
-        self.xml_rpc_proxy_read: Final[XmlRpcProxy] = XmlRpcProxy(
+        self.xml_rpc_proxy: Final[BaseXmlRpcProxy] = self._create_proxy(
+            name=f"XmlRpcProxy for {self.interface_id}"
+        )
+        self.xml_rpc_proxy_read: Final[BaseXmlRpcProxy] = self._create_proxy(
+            name=f"XmlRpcProxyRead for {self.interface_id}"
+        )
+        self.version: str = "0"
+        self.serial: str = "0"
+
+    def _create_proxy(self, name: str) -> BaseXmlRpcProxy:
+        """
+        Create a XML-RPC proxy.
+        The aiohttp based proxy requires the client session of the central.
+        """
+        central_config = self.central.config
+        if central_config.use_async_xml_rpc_proxy and central_config.client_session:
+            return AioXmlRpcProxy(
+                client_session=central_config.client_session,
+                uri=self.xml_rpc_uri,
+                headers=self.xml_rpc_headers,
+                tls=central_config.tls,
+                verify_tls=central_config.verify_tls,
+                metrics=self.rpc_metrics,
+                circuit_breaker=self.circuit_breaker,
+            )
+        return XmlRpcProxy(
             max_workers=1,
-            thread_name_prefix=f"XmlRpcProxyRead for {self.interface_id}",
+            thread_name_prefix=name,
             uri=self.xml_rpc_uri,
             headers=self.xml_rpc_headers,
-            tls=central.config.tls,
-            verify_tls=central.config.verify_tls,
+            tls=central_config.tls,
+            verify_tls=central_config.verify_tls,
+            metrics=self.rpc_metrics,
+            circuit_breaker=self.circuit_breaker,
         )
-        self.version: str = "0"
-        self.serial: str = "0"
 
     async def get_client(self) -> Client:
         """Identify the used client."""
@@ -1204,6 +1699,71 @@ class _ClientConfig:
             raise NoConnection(f"Unable to connect {noc.args}.") from noc
 
 
+def _get_command_priority(paramset_key: str) -> CommandPriority:
+    """Return the priority of a command. Config changes are sent last."""
+    if paramset_key == PARAMSET_KEY_MASTER:
+        return CommandPriority.LOW
+    return CommandPriority.NORMAL
+
+
+def _get_device_chunks(
+    device_descriptions: list[dict[str, Any]]
+) -> list[tuple[list[dict[str, Any]], int]]:
+    """
+    Split device descriptions into chunks of complete devices,
+    that fit roughly into one multicall batch.
+    Return (device_descriptions, device_count) per chunk.
+    """
+    devices: dict[str, list[dict[str, Any]]] = {}
+    for device_description in device_descriptions:
+        if not device_description:
+            continue
+        devices.setdefault(
+            get_device_address(device_description[HM_ADDRESS]), []
+        ).append(device_description)
+
+    chunks: list[tuple[list[dict[str, Any]], int]] = []
+    chunk_descriptions: list[dict[str, Any]] = []
+    chunk_device_count = 0
+    request_count = 0
+    for descriptions in devices.values():
+        chunk_descriptions.extend(descriptions)
+        chunk_device_count += 1
+        # The number of paramsets is the upper bound of the requests.
+        request_count += sum(
+            len(description.get(HM_PARAMSETS, [])) for description in descriptions
+        )
+        if request_count >= config.MULTICALL_BATCH_SIZE:
+            chunks.append((chunk_descriptions, chunk_device_count))
+            chunk_descriptions = []
+            chunk_device_count = 0
+            request_count = 0
+    if chunk_descriptions:
+        chunks.append((chunk_descriptions, chunk_device_count))
+    return chunks
+
+
+def _is_multicall_unsupported(pex: ProxyException) -> bool:
+    """Return, if the backend rejected system.multicall as unknown method."""
+    if not isinstance(fault := pex.__cause__, xmlrpc.client.Fault):
+        return False
+    fault_string = str(fault.faultString).lower()
+    return fault.faultCode == _FAULT_CODE_METHOD_NOT_FOUND or any(
+        marker in fault_string for marker in _MULTICALL_UNSUPPORTED_MARKERS
+    )
+
+
+def _get_multicall_result(result: Any) -> Any:
+    """Return the result of a single call within a multicall."""
+    if isinstance(result, dict) and "faultCode" in result:
+        return ProxyException(
+            xmlrpc.client.Fault(result["faultCode"], result.get("faultString", ""))
+        )
+    if isinstance(result, list) and len(result) == 1:
+        return result[0]
+    return ProxyException(f"Unexpected multicall result {result}")
+
+
 class InterfaceConfig:
     """interface config for a Client."""
 
@@ -1245,10 +1805,7 @@ async def create_client(
 
 def get_client(interface_id: str) -> Client | None:
     """Return client by interface_id"""
-    for central in hmcu.CENTRAL_INSTANCES.values():
-        if central.has_client(interface_id=interface_id):
-            return central.get_client(interface_id=interface_id)
-    return None
+    return hmcu.get_client_by_route(interface_id=interface_id)
 
 
 @dataclass
@@ -0,0 +1,251 @@
+"""
+Command scheduler module.
+Paces outbound commands of a RF interface by its duty cycle,
+so bulk commands don't push the CCU into the duty cycle lockout.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from enum import IntEnum
+import heapq
+import itertools
+import logging
+import time
+from typing import Any, Final
+
+from hahomematic import config
+from hahomematic.const import RX_MODE_BURST, RX_MODE_WAKEUP
+
+_LOGGER = logging.getLogger(__name__)
+
+# Token costs of a command by rx_mode. BURST commands wake up all devices
+# in range and WAKEUP commands are repeated until the device responds.
+_RX_MODE_COSTS: Final[dict[str | None, float]] = {
+    RX_MODE_BURST: 3.0,
+    RX_MODE_WAKEUP: 2.0,
+}
+_DEFAULT_COST: Final = 1.0
+# The refill rate never drops below this share of config.COMMAND_RATE,
+# so queued commands are sent eventually.
+_MIN_RATE_FACTOR: Final = 0.05
+
+
+class CommandPriority(IntEnum):
+    """Priority of a command. Lower values are sent first."""
+
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+@dataclass
+class CommandSchedulerStatistics:
+    """Counters of the command scheduler."""
+
+    sent: int = 0
+    collapsed: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    max_wait: float = 0.0
+    total_wait: float = 0.0
+
+    @property
+    def mean_wait(self) -> float:
+        """Return the mean wait time of the sent commands."""
+        return self.total_wait / self.sent if self.sent else 0.0
+
+
+@dataclass
+class _Command:
+    """Queued command."""
+
+    address: str
+    paramset_key: str
+    parameter: str | None
+    value: Any
+    rx_mode: str | None
+    priority: CommandPriority
+    enqueued_at: float
+    waiters: list[asyncio.Future] = field(default_factory=list)
+
+
+class CommandScheduler:
+    """
+    Per interface scheduler for commands (address, paramset_key, parameter).
+    A command without parameter writes a paramset (dict of values).
+    Commands are queued by priority and sent, when the token bucket
+    holds the cost of the command. The bucket is refilled with
+    config.COMMAND_RATE tokens per second, reduced by the duty cycle and
+    carrier sense levels (percent) of the interface.
+    A queued command to the same parameter is replaced by the new value,
+    queued paramsets are merged.
+    """
+
+    def __init__(
+        self,
+        interface_id: str,
+        send: Callable[[str, str, str | None, Any, str | None], Awaitable[None]],
+    ):
+        """Init the command scheduler."""
+        self._interface_id: Final = interface_id
+        self._send: Final = send
+        self._queue: Final[list[tuple[int, int, tuple[str, str, str | None]]]] = []
+        self._commands: Final[dict[tuple[str, str, str | None], _Command]] = {}
+        self._counter: Final = itertools.count()
+        self._tokens: float = float(config.COMMAND_BURST)
+        self._refilled_at: float = time.monotonic()
+        self._duty_cycle_level: float = 0.0
+        self._carrier_sense_level: float = 0.0
+        self._worker: asyncio.Task | None = None
+        self.statistics: Final[CommandSchedulerStatistics] = (
+            CommandSchedulerStatistics()
+        )
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of queued commands."""
+        return len(self._commands)
+
+    @property
+    def rate(self) -> float:
+        """Return the current refill rate in tokens per second."""
+        level = max(self._duty_cycle_level, self._carrier_sense_level)
+        factor = max(1.0 - level / 100.0, _MIN_RATE_FACTOR)
+        return float(config.COMMAND_RATE) * factor
+
+    def set_duty_cycle_level(self, level: Any) -> None:
+        """Update the duty cycle level (percent) of the interface."""
+        if isinstance(level, (int, float)):
+            self._refill()
+            self._duty_cycle_level = float(level)
+
+    def set_carrier_sense_level(self, level: Any) -> None:
+        """Update the carrier sense level (percent) of the interface."""
+        if isinstance(level, (int, float)):
+            self._refill()
+            self._carrier_sense_level = float(level)
+
+    async def schedule(
+        self,
+        address: str,
+        paramset_key: str,
+        parameter: str | None,
+        value: Any,
+        rx_mode: str | None = None,
+        priority: CommandPriority = CommandPriority.NORMAL,
+    ) -> None:
+        """Queue a command and wait until it (or a newer value) is sent."""
+        loop = asyncio.get_running_loop()
+        waiter: asyncio.Future = loop.create_future()
+        key = (address, paramset_key, parameter)
+        if (command := self._commands.get(key)) is not None:
+            if parameter is None:
+                # the newer parameters are sent last
+                command.value = {
+                    k: v for k, v in command.value.items() if k not in value
+                } | value
+            else:
+                command.value = value
+            command.rx_mode = rx_mode
+            command.waiters.append(waiter)
+            self.statistics.collapsed += 1
+            if priority < command.priority:
+                command.priority = priority
+                heapq.heappush(self._queue, (priority, next(self._counter), key))
+        else:
+            self._commands[key] = _Command(
+                address=address,
+                paramset_key=paramset_key,
+                parameter=parameter,
+                value=value,
+                rx_mode=rx_mode,
+                priority=priority,
+                enqueued_at=time.monotonic(),
+                waiters=[waiter],
+            )
+            heapq.heappush(self._queue, (priority, next(self._counter), key))
+        self._update_queue_depth()
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._run())
+        await waiter
+
+    def clear(self) -> None:
+        """Cancel all queued commands."""
+        if self._worker:
+            self._worker.cancel()
+            self._worker = None
+        for command in self._commands.values():
+            for waiter in command.waiters:
+                waiter.cancel()
+        self._commands.clear()
+        self._queue.clear()
+        self._update_queue_depth()
+
+    async def _run(self) -> None:
+        """Send the queued commands."""
+        while self._queue:
+            priority, _, key = heapq.heappop(self._queue)
+            if (command := self._commands.get(key)) is None or (
+                priority != command.priority
+            ):
+                # Stale entry of a command with raised priority.
+                continue
+            cost = _RX_MODE_COSTS.get(command.rx_mode, _DEFAULT_COST)
+            await self._acquire(cost)
+            del self._commands[key]
+            self._update_queue_depth()
+            wait = time.monotonic() - command.enqueued_at
+            self.statistics.sent += 1
+            self.statistics.total_wait += wait
+            self.statistics.max_wait = max(self.statistics.max_wait, wait)
+            try:
+                await self._send(
+                    command.address,
+                    command.paramset_key,
+                    command.parameter,
+                    command.value,
+                    command.rx_mode,
+                )
+            except Exception as ex:  # pylint: disable=broad-except
+                _LOGGER.warning(
+                    "run: Unable to send command %s for %s: %s",
+                    key,
+                    self._interface_id,
+                    ex.args,
+                )
+            for waiter in command.waiters:
+                if not waiter.done():
+                    waiter.set_result(None)
+
+    async def _acquire(self, cost: float) -> None:
+        """Wait until the bucket holds the cost and take it."""
+        cost = min(cost, float(config.COMMAND_BURST))
+        self._refill()
+        while self._tokens < cost:
+            delay = (cost - self._tokens) / self.rate
+            _LOGGER.debug(
+                "acquire: Waiting %.2fs for duty cycle of %s",
+                delay,
+                self._interface_id,
+            )
+            await asyncio.sleep(delay)
+            self._refill()
+        self._tokens -= cost
+
+    def _refill(self) -> None:
+        """Refill the bucket with the tokens since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(
+            self._tokens + (now - self._refilled_at) * self.rate,
+            float(config.COMMAND_BURST),
+        )
+        self._refilled_at = now
+
+    def _update_queue_depth(self) -> None:
+        """Update the queue depth counters."""
+        self.statistics.queue_depth = len(self._commands)
+        self.statistics.max_queue_depth = max(
+            self.statistics.max_queue_depth, self.statistics.queue_depth
+        )
@@ -4,12 +4,38 @@ Global configuration parameters.
 from __future__ import annotations
 
 from hahomematic.const import (
+    DEFAULT_CIRCUIT_BREAKER_COOL_DOWN,
+    DEFAULT_CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    DEFAULT_COMMAND_BURST,
+    DEFAULT_COMMAND_RATE,
     DEFAULT_CONNECTION_CHECKER_INTERVAL,
+    DEFAULT_EVENT_QUEUE_CAPACITY,
+    DEFAULT_HUB_FULL_REFRESH_INTERVAL,
+    DEFAULT_HUB_POLL_MAX_INTERVAL,
+    DEFAULT_HUB_POLL_MIN_INTERVAL,
+    DEFAULT_JSON_SESSION_RENEW_INTERVAL,
+    DEFAULT_MULTICALL_BATCH_SIZE,
+    DEFAULT_PARAMSET_DESCRIPTIONS_MAX_CONCURRENCY,
     DEFAULT_RECONNECT_WAIT,
+    DEFAULT_RPC_SLOW_CALL_THRESHOLD,
     DEFAULT_TIMEOUT,
+    DEFAULT_XML_RPC_PROXY_MAX_CONCURRENCY,
 )
 
 CHECK_INTERVAL = DEFAULT_CONNECTION_CHECKER_INTERVAL * 20
+CIRCUIT_BREAKER_COOL_DOWN = DEFAULT_CIRCUIT_BREAKER_COOL_DOWN
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = DEFAULT_CIRCUIT_BREAKER_FAILURE_THRESHOLD
+COMMAND_BURST = DEFAULT_COMMAND_BURST
+COMMAND_RATE = DEFAULT_COMMAND_RATE
 CONNECTION_CHECKER_INTERVAL = DEFAULT_CONNECTION_CHECKER_INTERVAL
+EVENT_QUEUE_CAPACITY = DEFAULT_EVENT_QUEUE_CAPACITY
+HUB_FULL_REFRESH_INTERVAL = DEFAULT_HUB_FULL_REFRESH_INTERVAL
+HUB_POLL_MAX_INTERVAL = DEFAULT_HUB_POLL_MAX_INTERVAL
+HUB_POLL_MIN_INTERVAL = DEFAULT_HUB_POLL_MIN_INTERVAL
+JSON_SESSION_RENEW_INTERVAL = DEFAULT_JSON_SESSION_RENEW_INTERVAL
+MULTICALL_BATCH_SIZE = DEFAULT_MULTICALL_BATCH_SIZE
+PARAMSET_DESCRIPTIONS_MAX_CONCURRENCY = DEFAULT_PARAMSET_DESCRIPTIONS_MAX_CONCURRENCY
 RECONNECT_WAIT = DEFAULT_RECONNECT_WAIT
+RPC_SLOW_CALL_THRESHOLD = DEFAULT_RPC_SLOW_CALL_THRESHOLD
 TIMEOUT = DEFAULT_TIMEOUT
+XML_RPC_PROXY_MAX_CONCURRENCY = DEFAULT_XML_RPC_PROXY_MAX_CONCURRENCY
@@ -7,16 +7,49 @@ from typing import Final
 
 from hahomematic.backport import StrEnum
 
+DEFAULT_CIRCUIT_BREAKER_COOL_DOWN: Final = (
+    30  # seconds until an open circuit breaker lets a probe call through
+)
+DEFAULT_CIRCUIT_BREAKER_FAILURE_THRESHOLD: Final = (
+    3  # consecutive connection failures that open the circuit breaker
+)
+DEFAULT_COMMAND_BURST: Final = 10  # token bucket size of the command scheduler
+DEFAULT_COMMAND_RATE: Final = (
+    5  # commands per second of a RF interface without duty cycle load
+)
 DEFAULT_CONNECTION_CHECKER_INTERVAL: Final = (
     15  # check if connection is available via rpc ping every:
 )
 DEFAULT_ENCODING: Final = "UTF-8"
+DEFAULT_EVENT_QUEUE_CAPACITY: Final = 10000  # max. events waiting for the loop
+DEFAULT_HUB_FULL_REFRESH_INTERVAL: Final = (
+    600  # seconds between full refreshes of sysvars and programs
+)
+DEFAULT_HUB_POLL_MAX_INTERVAL: Final = (
+    120  # ceiling of the adaptive hub polling interval (seconds)
+)
+DEFAULT_HUB_POLL_MIN_INTERVAL: Final = (
+    5  # floor of the adaptive hub polling interval (seconds)
+)
+DEFAULT_JSON_SESSION_RENEW_INTERVAL: Final = (
+    90  # renew the JSON-RPC session in the background every
+)
+DEFAULT_MULTICALL_BATCH_SIZE: Final = 50  # max. calls within a system.multicall
+DEFAULT_PARAMSET_DESCRIPTIONS_MAX_CONCURRENCY: Final = (
+    2  # max. concurrent paramset description fetches per interface
+)
 DEFAULT_RECONNECT_WAIT: Final = (
     120  # wait with reconnect after a first ping was successful
 )
+DEFAULT_RPC_SLOW_CALL_THRESHOLD: Final = (
+    5.0  # log RPC calls taking longer than (seconds)
+)
 DEFAULT_TIMEOUT: Final = 60  # default timeout for a connection
 DEFAULT_TLS: Final = False
 DEFAULT_VERIFY_TLS: Final = False
+DEFAULT_XML_RPC_PROXY_MAX_CONCURRENCY: Final = (
+    3  # max. concurrent requests per interface of the aiohttp XML-RPC proxy
+)
 
 INIT_DATETIME: Final = datetime.strptime("01.01.1970 00:00:00", "%d.%m.%Y %H:%M:%S")
 IP_ANY_V4: Final = "0.0.0.0"
@@ -82,6 +115,7 @@ EVENT_SEQUENCE_OK: Final = "SEQUENCE_OK"
 EVENT_STICKY_UN_REACH: Final = "STICKY_UNREACH"
 EVENT_UN_REACH: Final = "UNREACH"
 
+FILE_BINARY_CACHE_EXTENSION: Final = ".bin"
 FILE_CUSTOM_UN_IGNORE_PARAMETERS: Final = "unignore"
 FILE_DEVICES: Final = "homematic_devices.json"
 FILE_PARAMSETS: Final = "homematic_paramsets.json"
@@ -120,19 +154,21 @@ HH_EVENT_ERROR: Final = "error"
 HH_EVENT_HUB_REFRESHED: Final = "hubEntityRefreshed"
 HH_EVENT_LIST_DEVICES: Final = "listDevices"
 HH_EVENT_NEW_DEVICES: Final = "newDevices"
+HH_EVENT_PARAMSET_DESCRIPTIONS_FETCHED: Final = "paramsetDescriptionsFetched"
 HH_EVENT_REPLACE_DEVICE: Final = "replaceDevice"
 HH_EVENT_RE_ADDED_DEVICE: Final = "readdedDevice"
 HH_EVENT_UPDATE_DEVICE: Final = "updateDevice"
 
 MAX_CACHE_AGE: Final = 60
-MAX_JSON_SESSION_AGE: Final = 90
 
 OPERATION_NONE: Final = 0
 OPERATION_READ: Final = 1
 OPERATION_WRITE: Final = 2
 OPERATION_EVENT: Final = 4
 
+PARAM_CARRIER_SENSE_LEVEL: Final = "CARRIER_SENSE_LEVEL"
 PARAM_CHANNEL_OPERATION_MODE: Final = "CHANNEL_OPERATION_MODE"
+PARAM_DUTY_CYCLE_LEVEL: Final = "DUTY_CYCLE_LEVEL"
 PARAM_TEMPERATURE_MAXIMUM: Final = "TEMPERATURE_MAXIMUM"
 PARAM_TEMPERATURE_MINIMUM: Final = "TEMPERATURE_MINIMUM"
 
@@ -152,11 +188,18 @@ PROXY_DE_INIT_SUCCESS: Final = 8
 PROXY_DE_INIT_SKIPPED: Final = 16
 
 REGA_SCRIPT_FETCH_ALL_DEVICE_DATA: Final = "fetch_all_device_data.fn"
+REGA_SCRIPT_FETCH_DEVICE_DATA_SINCE: Final = "fetch_device_data_since.fn"
+REGA_SCRIPT_FETCH_HUB_DATA_SINCE: Final = "fetch_hub_data_since.fn"
+REGA_SCRIPT_GET_BACKEND_TIME: Final = "get_backend_time.fn"
 REGA_SCRIPT_GET_SERIAL: Final = "get_serial.fn"
 REGA_SCRIPT_PATH: Final = "rega_scripts"
 REGA_SCRIPT_SET_SYSTEM_VARIABLE: Final = "set_system_variable.fn"
+REGA_SCRIPT_SET_SYSTEM_VARIABLES: Final = "set_system_variables.fn"
 REGA_SCRIPT_SYSTEM_VARIABLES_EXT_MARKER: Final = "get_system_variables_ext_marker.fn"
 
+RX_MODE_BURST: Final = "BURST"
+RX_MODE_WAKEUP: Final = "WAKEUP"
+
 SYSVAR_HASEXTMARKER: Final = "hasExtMarker"
 SYSVAR_ID: Final = "id"
 SYSVAR_ISINTERNAL: Final = "isInternal"
@@ -318,6 +361,13 @@ class HmDataOperationResult(IntEnum):
     NO_SAVE: Final = 21
 
 
+class HmCacheFormat(StrEnum):
+    """Enum with the formats of the persistent caches."""
+
+    BINARY: Final = "binary"
+    JSON: Final = "json"
+
+
 class HmEntityUsage(StrEnum):
     """Enum with information about usage in Home Assistant."""
 
@@ -440,31 +440,35 @@ class CeIpThermostat(BaseClimateEntity):
 
     async def set_hvac_mode(self, hvac_mode: HmHvacMode) -> None:
         """Set new target hvac mode."""
-        if hvac_mode == HmHvacMode.AUTO:
-            await self._e_control_mode.send_value(HMIP_MODE_AUTO)
-        elif hvac_mode in (HmHvacMode.HEAT, HmHvacMode.COOL):
-            await self._e_control_mode.send_value(HMIP_MODE_MANU)
-            await self.set_temperature(temperature=self._min_or_target_temperature)
-        elif hvac_mode == HmHvacMode.OFF:
-            await self._e_control_mode.send_value(HMIP_MODE_MANU)
-            await self.set_temperature(temperature=HM_OFF_TEMPERATURE)
-        # if switching hvac_mode then disable boost_mode
-        if self._e_boost_mode.value:
-            await self.set_preset_mode(HmPresetMode.NONE)
+        async with self.batch():
+            if hvac_mode == HmHvacMode.AUTO:
+                await self._e_control_mode.send_value(HMIP_MODE_AUTO)
+            elif hvac_mode in (HmHvacMode.HEAT, HmHvacMode.COOL):
+                await self._e_control_mode.send_value(HMIP_MODE_MANU)
+                await self.set_temperature(
+                    temperature=self._min_or_target_temperature
+                )
+            elif hvac_mode == HmHvacMode.OFF:
+                await self._e_control_mode.send_value(HMIP_MODE_MANU)
+                await self.set_temperature(temperature=HM_OFF_TEMPERATURE)
+            # if switching hvac_mode then disable boost_mode
+            if self._e_boost_mode.value:
+                await self.set_preset_mode(HmPresetMode.NONE)
 
     async def set_preset_mode(self, preset_mode: HmPresetMode) -> None:
         """Set new preset mode."""
-        if preset_mode == HmPresetMode.BOOST:
-            await self._e_boost_mode.send_value(True)
-        elif preset_mode == HmPresetMode.NONE:
-            await self._e_boost_mode.send_value(False)
-        elif preset_mode in self._profile_names:
-            if self.hvac_mode != HmHvacMode.AUTO:
-                await self.set_hvac_mode(HmHvacMode.AUTO)
-            profile_idx = self._profiles.get(preset_mode)
-            await self._e_boost_mode.send_value(False)
-            if profile_idx:
-                await self._e_active_profile.send_value(profile_idx)
+        async with self.batch():
+            if preset_mode == HmPresetMode.BOOST:
+                await self._e_boost_mode.send_value(True)
+            elif preset_mode == HmPresetMode.NONE:
+                await self._e_boost_mode.send_value(False)
+            elif preset_mode in self._profile_names:
+                if self.hvac_mode != HmHvacMode.AUTO:
+                    await self.set_hvac_mode(HmHvacMode.AUTO)
+                profile_idx = self._profiles.get(preset_mode)
+                await self._e_boost_mode.send_value(False)
+                if profile_idx:
+                    await self._e_active_profile.send_value(profile_idx)
 
     async def enable_away_mode_by_calendar(
         self, start: datetime, end: datetime, away_temperature: float
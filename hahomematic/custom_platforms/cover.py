@@ -191,18 +191,21 @@ class CeIpBlind(CeBlind):
 
     async def open_cover(self) -> None:
         """Open the cover and open the tilt."""
-        await super()._set_cover_tilt_level(level=HM_OPEN)
-        await self._set_cover_level(level=HM_OPEN)
+        async with self.batch():
+            await super()._set_cover_tilt_level(level=HM_OPEN)
+            await self._set_cover_level(level=HM_OPEN)
 
     async def close_cover(self) -> None:
         """Close the cover and close the tilt."""
-        await super()._set_cover_tilt_level(level=HM_CLOSED)
-        await self._set_cover_level(level=HM_CLOSED)
+        async with self.batch():
+            await super()._set_cover_tilt_level(level=HM_CLOSED)
+            await self._set_cover_level(level=HM_CLOSED)
 
     async def _set_cover_tilt_level(self, level: float) -> None:
         """Move the cover to a specific tilt level. Value range is 0.0 to 1.0."""
-        await super()._set_cover_tilt_level(level=level)
-        await self.set_cover_position(position=self.current_cover_position or 0)
+        async with self.batch():
+            await super()._set_cover_tilt_level(level=level)
+            await self.set_cover_position(position=self.current_cover_position or 0)
 
 
 class CeGarage(CustomEntity):
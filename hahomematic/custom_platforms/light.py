@@ -134,28 +134,30 @@ class BaseHmLight(CustomEntity):
         ramp_time: float | None = None
         on_time: float | None = None
 
-        if HM_ARG_RAMP_TIME in kwargs:
-            ramp_time = float(cast(float, kwargs[HM_ARG_RAMP_TIME]))
-            await self.set_ramp_time_value(ramp_time=ramp_time)
-
-        if HM_ARG_ON_TIME in kwargs:
-            on_time = float(cast(float, kwargs[HM_ARG_ON_TIME]))
-            await self.set_on_time_value(on_time=on_time)
-
-        if brightness := cast(
-            int, (kwargs.get(HM_ARG_BRIGHTNESS, self.brightness)) or 255
-        ):
-            if brightness != self.brightness or kwargs:
-                level = brightness / 255.0
-                await self._e_level.send_value(level)
+        async with self.batch():
+            if HM_ARG_RAMP_TIME in kwargs:
+                ramp_time = float(cast(float, kwargs[HM_ARG_RAMP_TIME]))
+                await self.set_ramp_time_value(ramp_time=ramp_time)
+
+            if HM_ARG_ON_TIME in kwargs:
+                on_time = float(cast(float, kwargs[HM_ARG_ON_TIME]))
+                await self.set_on_time_value(on_time=on_time)
+
+            if brightness := cast(
+                int, (kwargs.get(HM_ARG_BRIGHTNESS, self.brightness)) or 255
+            ):
+                if brightness != self.brightness or kwargs:
+                    level = brightness / 255.0
+                    await self._e_level.send_value(level)
 
     async def turn_off(self, **kwargs: dict[str, Any] | None) -> None:
         """Turn the light off."""
-        if HM_ARG_RAMP_TIME in kwargs:
-            ramp_time = float(cast(float, kwargs[HM_ARG_RAMP_TIME]))
-            await self.set_ramp_time_value(ramp_time=ramp_time)
+        async with self.batch():
+            if HM_ARG_RAMP_TIME in kwargs:
+                ramp_time = float(cast(float, kwargs[HM_ARG_RAMP_TIME]))
+                await self.set_ramp_time_value(ramp_time=ramp_time)
 
-        await self._e_level.send_value(HM_DIMMER_OFF)
+            await self._e_level.send_value(HM_DIMMER_OFF)
 
     async def set_on_time_value(self, on_time: float) -> None:
         """Set the on time value in seconds."""
@@ -258,27 +260,28 @@ class CeColorDimmer(CeDimmer):
 
     async def turn_on(self, **kwargs: Any) -> None:
         """Turn the light on."""
-        if HM_ARG_HS_COLOR in kwargs:
-            # disable effect
-            if self.effect != HM_EFFECT_OFF:
-                await self._e_effect.send_value(0)
-            khue, ksaturation = kwargs[HM_ARG_HS_COLOR]
-            hue = khue / 360
-            saturation = ksaturation / 100
-            if saturation < 0.1:  # Special case (white)
-                color = 200
-            else:
-                color = int(round(max(min(hue, 1), 0) * 199))
-
-            await self._e_color.send_value(color)
-
-        if HM_ARG_EFFECT in kwargs:
-            effect = str(kwargs[HM_ARG_EFFECT])
-            effect_idx = self._effect_list.index(effect)
-            if effect_idx is not None:
-                await self._e_effect.send_value(effect_idx)
-
-        await super().turn_on(**kwargs)
+        async with self.batch():
+            if HM_ARG_HS_COLOR in kwargs:
+                # disable effect
+                if self.effect != HM_EFFECT_OFF:
+                    await self._e_effect.send_value(0)
+                khue, ksaturation = kwargs[HM_ARG_HS_COLOR]
+                hue = khue / 360
+                saturation = ksaturation / 100
+                if saturation < 0.1:  # Special case (white)
+                    color = 200
+                else:
+                    color = int(round(max(min(hue, 1), 0) * 199))
+
+                await self._e_color.send_value(color)
+
+            if HM_ARG_EFFECT in kwargs:
+                effect = str(kwargs[HM_ARG_EFFECT])
+                effect_idx = self._effect_list.index(effect)
+                if effect_idx is not None:
+                    await self._e_effect.send_value(effect_idx)
+
+            await super().turn_on(**kwargs)
 
 
 class CeColorTempDimmer(CeDimmer):
@@ -306,14 +309,14 @@ class CeColorTempDimmer(CeDimmer):
 
     async def turn_on(self, **kwargs: Any) -> None:
         """Turn the light on."""
+        async with self.batch():
+            if HM_ARG_COLOR_TEMP in kwargs:
+                color_level = (HM_MAX_MIREDS - kwargs[HM_ARG_COLOR_TEMP]) / (
+                    HM_MAX_MIREDS - HM_MIN_MIREDS
+                )
+                await self._e_color_level.send_value(color_level)
 
-        if HM_ARG_COLOR_TEMP in kwargs:
-            color_level = (HM_MAX_MIREDS - kwargs[HM_ARG_COLOR_TEMP]) / (
-                HM_MAX_MIREDS - HM_MIN_MIREDS
-            )
-            await self._e_color_level.send_value(color_level)
-
-        await super().turn_on(**kwargs)
+            await super().turn_on(**kwargs)
 
 
 class CeIpFixedColorLight(BaseHmLight):
@@ -399,12 +402,13 @@ class CeIpFixedColorLight(BaseHmLight):
 
     async def turn_on(self, **kwargs: Any) -> None:
         """Turn the light on."""
-        if HM_ARG_HS_COLOR in kwargs:
-            hs_color = kwargs[HM_ARG_HS_COLOR]
-            simple_rgb_color = _convert_color(hs_color)
-            await self._e_color.send_value(simple_rgb_color)
+        async with self.batch():
+            if HM_ARG_HS_COLOR in kwargs:
+                hs_color = kwargs[HM_ARG_HS_COLOR]
+                simple_rgb_color = _convert_color(hs_color)
+                await self._e_color.send_value(simple_rgb_color)
 
-        await super().turn_on(**kwargs)
+            await super().turn_on(**kwargs)
 
     async def set_on_time_value(self, on_time: float) -> None:
         """Set the on time value in seconds."""
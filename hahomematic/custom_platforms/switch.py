@@ -53,11 +53,14 @@ class CeSwitch(CustomEntity):
 
     async def turn_on(self, **kwargs: dict[str, Any] | None) -> None:
         """Turn the switch on."""
-        if HM_ARG_ON_TIME in kwargs and isinstance(self._e_on_time_value, HmAction):
-            on_time: float = float(cast(float, kwargs[HM_ARG_ON_TIME]))
-            await self._e_on_time_value.send_value(on_time)
-
-        await self._e_state.turn_on()
+        async with self.batch():
+            if HM_ARG_ON_TIME in kwargs and isinstance(
+                self._e_on_time_value, HmAction
+            ):
+                on_time: float = float(cast(float, kwargs[HM_ARG_ON_TIME]))
+                await self._e_on_time_value.send_value(on_time)
+
+            await self._e_state.turn_on()
 
     async def turn_off(self) -> None:
         """Turn the switch off."""
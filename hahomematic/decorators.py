@@ -65,48 +65,6 @@ def callback_system_event(name: str) -> Callable:
     return decorator_callback_system_event
 
 
-def callback_event(func: Callable) -> Callable:
-    """
-    Check if callback_event is set and call it AFTER original function.
-    """
-
-    @wraps(func)
-    async def async_wrapper_callback_event(*args: Any) -> Any:
-        """Wrapper for callback event."""
-        return_value = await func(*args)
-        exec_callback_entity_event(*args)
-        return return_value
-
-    @wraps(func)
-    def wrapper_callback_event(*args: Any) -> Any:
-        """Wrapper for callback event."""
-        return_value = func(*args)
-        exec_callback_entity_event(*args)
-        return return_value
-
-    def exec_callback_entity_event(*args: Any) -> None:
-        """Execute the callback for an entity event."""
-        try:
-            # We don't want to pass the function itself
-            args = args[1:]
-            interface_id = args[0]
-            client = hmcl.get_client(interface_id=interface_id)
-        except Exception as err:
-            _LOGGER.warning(
-                "exec_callback_entity_event failed: "
-                "Unable to reduce args for callback_event."
-            )
-            raise HaHomematicException("args-exception callback_event") from err
-        if client:
-            client.last_updated = datetime.now()
-            if client.central.callback_entity_event is not None:
-                client.central.callback_entity_event(*args)
-
-    if asyncio.iscoroutinefunction(func):
-        return async_wrapper_callback_event
-    return wrapper_callback_event
-
-
 G = TypeVar("G")  # think about variance
 S = TypeVar("S")
 
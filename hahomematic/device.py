@@ -635,16 +635,9 @@ class ValueCache:
         self._attr_value_cache: Final[dict[str, dict[str, dict[str, CacheEntry]]]] = {}
 
     async def init_base_entities(self) -> None:
-        """Load data by get_value"""
+        """Load data by get_values"""
         try:
-            for entity in self._get_base_entities():
-                value = await self.get_value(
-                    channel_address=entity.channel_address,
-                    paramset_key=entity.paramset_key,
-                    parameter=entity.parameter,
-                    call_source=HmCallSource.HM_INIT,
-                )
-                entity.update_value(value=value)
+            await self._init_values(entities=self._get_base_entities())
         except BaseHomematicException as bhe:
             _LOGGER.debug(
                 "init_base_entities: Failed to init cache for channel0 %s, %s [%s]",
@@ -653,6 +646,63 @@ class ValueCache:
                 bhe,
             )
 
+    async def _init_values(
+        self, entities: set[GenericEntity] | set[GenericEvent]
+    ) -> None:
+        """
+        Init the values of the entities.
+        Values, that are not cached, are loaded with one call to get_values.
+        """
+        async with self._sema_get_or_load_value:
+            entities_to_load: list[GenericEntity | GenericEvent] = []
+            for entity in entities:
+                if (
+                    cached_value := self._get_value_from_cache(
+                        channel_address=entity.channel_address,
+                        paramset_key=entity.paramset_key,
+                        parameter=entity.parameter,
+                        max_age_seconds=MAX_CACHE_AGE,
+                    )
+                ) != NO_CACHE_ENTRY:
+                    entity.update_value(
+                        value=NO_CACHE_ENTRY
+                        if cached_value == self._NO_VALUE_CACHE_ENTRY
+                        else cached_value
+                    )
+                else:
+                    entities_to_load.append(entity)
+            if not entities_to_load:
+                return
+
+            values = await self._attr_device.client.get_values(
+                requests=[
+                    (entity.channel_address, entity.paramset_key, entity.parameter)
+                    for entity in entities_to_load
+                ],
+                call_source=HmCallSource.HM_INIT,
+            )
+            for entity, value in zip(entities_to_load, values):
+                if isinstance(value, BaseHomematicException):
+                    _LOGGER.debug(
+                        "_init_values: Failed to get data for %s, %s, %s: %s",
+                        self._attr_device.device_type,
+                        entity.channel_address,
+                        entity.parameter,
+                        value,
+                    )
+                    value = self._NO_VALUE_CACHE_ENTRY
+                self._add_entry_to_cache(
+                    channel_address=entity.channel_address,
+                    paramset_key=entity.paramset_key,
+                    parameter=entity.parameter,
+                    value=value,
+                )
+                entity.update_value(
+                    value=NO_CACHE_ENTRY
+                    if value == self._NO_VALUE_CACHE_ENTRY
+                    else value
+                )
+
     def _get_base_entities(self) -> set[GenericEntity]:
         """Get entities of channel 0 and master."""
         entities: list[GenericEntity] = []
@@ -666,16 +716,9 @@ class ValueCache:
         return set(entities)
 
     async def init_readable_events(self) -> None:
-        """Load data by get_value"""
+        """Load data by get_values"""
         try:
-            for event in self._get_readable_events():
-                value = await self.get_value(
-                    channel_address=event.channel_address,
-                    paramset_key=event.paramset_key,
-                    parameter=event.parameter,
-                    call_source=HmCallSource.HM_INIT,
-                )
-                event.update_value(value=value)
+            await self._init_values(entities=self._get_readable_events())
         except BaseHomematicException as bhe:
             _LOGGER.debug(
                 "init_base_events: Failed to init cache for channel0 %s, %s [%s]",
@@ -717,6 +760,10 @@ class ValueCache:
                     else cached_value
                 )
 
+            if self._attr_device.client.circuit_breaker.is_open:
+                # The entity keeps its last value until the backend is back.
+                return NO_CACHE_ENTRY
+
             value: Any = self._NO_VALUE_CACHE_ENTRY
             try:
                 value = await self._attr_device.client.get_value(
@@ -733,17 +780,28 @@ class ValueCache:
                     parameter,
                     bhe,
                 )
-            if paramset_key not in self._attr_value_cache:
-                self._attr_value_cache[paramset_key] = {}
-            if channel_address not in self._attr_value_cache[paramset_key]:
-                self._attr_value_cache[paramset_key][channel_address] = {}
             # write value to cache even if an exception has occurred
             # to avoid repetitive calls to CCU within max_age_seconds
-            self._attr_value_cache[paramset_key][channel_address][
-                parameter
-            ] = CacheEntry(value=value, last_update=datetime.now())
+            self._add_entry_to_cache(
+                channel_address=channel_address,
+                paramset_key=paramset_key,
+                parameter=parameter,
+                value=value,
+            )
             return NO_CACHE_ENTRY if value == self._NO_VALUE_CACHE_ENTRY else value
 
+    def _add_entry_to_cache(
+        self, channel_address: str, paramset_key: str, parameter: str, value: Any
+    ) -> None:
+        """Add a value to the cache."""
+        if paramset_key not in self._attr_value_cache:
+            self._attr_value_cache[paramset_key] = {}
+        if channel_address not in self._attr_value_cache[paramset_key]:
+            self._attr_value_cache[paramset_key][channel_address] = {}
+        self._attr_value_cache[paramset_key][channel_address][parameter] = CacheEntry(
+            value=value, last_update=datetime.now()
+        )
+
     def _get_value_from_cache(
         self,
         channel_address: str,
@@ -5,6 +5,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
 from datetime import datetime
 import logging
 from typing import Any, Final, Generic, TypeVar, Union, cast
@@ -49,6 +50,8 @@ from hahomematic.const import (
     PARAMSET_KEY_VALUES,
     SYSVAR_ADDRESS,
     TYPE_BOOL,
+    TYPE_FLOAT,
+    TYPE_INTEGER,
     HmCallSource,
     HmEntityUsage,
     HmEventType,
@@ -58,6 +61,7 @@ import hahomematic.custom_platforms as hm_custom_entity
 import hahomematic.custom_platforms.entity_definition as hmed
 from hahomematic.decorators import config_property, value_property
 import hahomematic.device as hmd
+from hahomematic.event_aggregator import EventAggregate
 from hahomematic.exceptions import HaHomematicException
 from hahomematic.helpers import (
     EntityNameData,
@@ -73,6 +77,8 @@ from hahomematic.helpers import (
     parse_sys_var,
     updated_within_seconds,
 )
+from hahomematic.send_debouncer import SendDebouncer
+from hahomematic.write_batch import WriteBatch, get_write_batch, write_batch
 
 HM_EVENT_SCHEMA = vol.Schema(
     {
@@ -544,6 +550,9 @@ class GenericEntity(BaseParameterEntity[ParameterT]):
     """
 
     wrapped: bool = False
+    # None: use send_value_debounce of the central config for numeric entities
+    _send_debounce_window: float | None = None
+    _send_debouncer: SendDebouncer | None = None
 
     @config_property
     def channel_operation_mode(self) -> str | None:
@@ -555,6 +564,13 @@ class GenericEntity(BaseParameterEntity[ParameterT]):
             return str(cop.value)
         return None
 
+    @property
+    def event_aggregate(self) -> EventAggregate | None:
+        """Return last, min, max and mean, if the events are rate limited."""
+        return self._central.get_event_aggregate(
+            channel_address=self._attr_channel_address, parameter=self._attr_parameter
+        )
+
     @property
     def _force_enabled(self) -> bool | None:
         """Return, if the entity/event must be enabled."""
@@ -597,15 +613,60 @@ class GenericEntity(BaseParameterEntity[ParameterT]):
                     self.get_event_data(new_value),
                 )
 
+    def set_send_debounce_window(self, window: float) -> None:
+        """
+        Set the window in seconds for the last write wins of send_value.
+        0 sends all values.
+        """
+        self._send_debounce_window = window
+        self._send_debouncer = None
+
     async def send_value(self, value: Any) -> None:
-        """send value to ccu."""
+        """
+        send value to ccu.
+        Within a write batch, the value is sent on exit of the batch.
+        Rapid values are debounced, if a send debounce window is set.
+        """
+        if (
+            self._attr_paramset_key == PARAMSET_KEY_VALUES
+            and (batch := get_write_batch()) is not None
+        ):
+            batch.add(
+                client=self._client,
+                channel_address=self._attr_channel_address,
+                parameter=self._attr_parameter,
+                value=self._convert_value(value),
+            )
+            return
+        if (debouncer := self._get_send_debouncer()) is not None:
+            await debouncer.send(self._convert_value(value))
+            return
+        await self._send_value(self._convert_value(value))
+
+    async def _send_value(self, value: Any) -> None:
+        """Send the converted value to ccu."""
         await self._client.set_value(
             channel_address=self._attr_channel_address,
             paramset_key=self._attr_paramset_key,
             parameter=self._attr_parameter,
-            value=self._convert_value(value),
+            value=value,
         )
 
+    def _get_send_debouncer(self) -> SendDebouncer | None:
+        """Return the send debouncer, if a window is set."""
+        if self._send_debouncer is None:
+            if (window := self._send_debounce_window) is None:
+                window = (
+                    self._central.config.send_value_debounce
+                    if self._attr_type in (TYPE_FLOAT, TYPE_INTEGER)
+                    else 0.0
+                )
+            if window > 0:
+                self._send_debouncer = SendDebouncer(
+                    window=window, send=self._send_value
+                )
+        return self._send_debouncer
+
     def _get_entity_name(self) -> EntityNameData:
         """Create the name for the entity."""
         return get_entity_name(
@@ -770,6 +831,13 @@ class CustomEntity(BaseEntity):
                 return HmEntityUsage.CE_SECONDARY
         return HmEntityUsage.CE_PRIMARY
 
+    def batch(self) -> AbstractAsyncContextManager[WriteBatch]:
+        """
+        Return a context, that collects the VALUES writes of the data entities
+        and sends the writes of a channel as one putParamset on exit.
+        """
+        return write_batch()
+
     async def put_paramset(
         self, paramset_key: str, value: Any, rx_mode: str | None = None
     ) -> None:
@@ -1026,13 +1094,18 @@ class GenericSystemVariable(GenericHubEntity):
             self._attr_value = value
             self.update_entity()
 
+    def get_send_value(self, value: Any) -> Any | None:
+        """Return the value for CCU/Homegear or None, if the value is invalid."""
+        return parse_sys_var(self.data_type, value)
+
     async def send_variable(self, value: Any) -> None:
         """Set variable value on CCU/Homegear."""
+        if (send_value := self.get_send_value(value)) is None:
+            return
         if client := self.central.get_primary_client():
-            await client.set_system_variable(
-                name=self.ccu_var_name, value=parse_sys_var(self.data_type, value)
-            )
-        self.update_value(value=value)
+            await client.set_system_variable(name=self.ccu_var_name, value=send_value)
+        self.update_value(value=send_value)
+        self.central.notify_sysvar_write()
 
 
 class GenericEvent(BaseParameterEntity[Any]):
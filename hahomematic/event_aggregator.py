@@ -0,0 +1,190 @@
+"""
+Event aggregator module.
+Limits the rate of events of chatty parameters
+(e.g. POWER of power meters) and aggregates the suppressed values.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+import logging
+from typing import Any, Final
+
+from hahomematic.helpers import get_device_address
+
+_LOGGER = logging.getLogger(__name__)
+
+# Device type to match all device types in the aggregation config.
+ALL_DEVICE_TYPES: Final = "*"
+
+
+@dataclass
+class EventAggregate:
+    """Values of an event parameter within an aggregation window."""
+
+    last: Any
+    count: int
+    min: float | None = None
+    max: float | None = None
+    mean: float | None = None
+
+
+class _Window:
+    """Aggregation window of a (channel_address, parameter)."""
+
+    def __init__(self, interface_id: str, last: Any) -> None:
+        self.interface_id: Final = interface_id
+        self.last: Any = last
+        self.count: int = 0
+        self.suppressed: int = 0
+        self.numeric: bool = True
+        self.min: float = 0.0
+        self.max: float = 0.0
+        self.sum: float = 0.0
+
+    def add(self, value: Any, suppressed: bool = True) -> None:
+        """Add a value to the window."""
+        self.last = value
+        if suppressed:
+            self.suppressed += 1
+        if self.numeric and _is_numeric(value):
+            self.min = min(self.min, value) if self.count else value
+            self.max = max(self.max, value) if self.count else value
+            self.sum += value
+        else:
+            self.numeric = False
+        self.count += 1
+
+    def get_aggregate(self) -> EventAggregate:
+        """Return the aggregate of the window."""
+        if not self.numeric or self.count == 0:
+            return EventAggregate(last=self.last, count=self.count)
+        return EventAggregate(
+            last=self.last,
+            count=self.count,
+            min=self.min,
+            max=self.max,
+            mean=self.sum / self.count,
+        )
+
+
+def _is_numeric(value: Any) -> bool:
+    """Return if the value can be aggregated."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class EventAggregator:
+    """
+    Rate limit and aggregation of events by (device_type, parameter).
+    The first event of a parameter is passed immediately and opens
+    a window of the configured interval. Events within the window are
+    suppressed. At the end of the window the last value is emitted,
+    if events have been suppressed, and the next window is opened.
+    last, min, max and mean of the window are available as EventAggregate.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        intervals: Mapping[tuple[str, str], float],
+        get_device_type: Callable[[str], str | None],
+        emit: Callable[[str, str, str, Any], None],
+    ):
+        """Init the event aggregator."""
+        self._loop: Final = loop
+        self._intervals: Final = dict(intervals)
+        self._get_device_type: Final = get_device_type
+        self._emit: Final = emit
+        self._interval_cache: Final[dict[tuple[str, str], float | None]] = {}
+        self._windows: Final[dict[tuple[str, str], _Window]] = {}
+        self._timers: Final[dict[tuple[str, str], asyncio.TimerHandle]] = {}
+        self._aggregates: Final[dict[tuple[str, str], EventAggregate]] = {}
+
+    def aggregate(
+        self, interface_id: str, channel_address: str, parameter: str, value: Any
+    ) -> bool:
+        """
+        Add an event to the aggregation.
+        Return True if the event is suppressed, False if it must be emitted.
+        Must be run in the event loop.
+        """
+        key = (channel_address, parameter)
+        if (interval := self._get_interval(channel_address, parameter)) is None:
+            return False
+        if (window := self._windows.get(key)) is not None:
+            window.add(value)
+            return True
+        window = self._windows[key] = _Window(interface_id=interface_id, last=value)
+        window.add(value, suppressed=False)
+        self._timers[key] = self._loop.call_later(interval, self._flush, key, interval)
+        return False
+
+    def get_aggregate(
+        self, channel_address: str, parameter: str
+    ) -> EventAggregate | None:
+        """Return the aggregate of the current or last window."""
+        key = (channel_address, parameter)
+        if (window := self._windows.get(key)) and window.count > 0:
+            return window.get_aggregate()
+        return self._aggregates.get(key)
+
+    def clear(self) -> None:
+        """Cancel all windows and forget the intervals of the devices."""
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
+        self._windows.clear()
+        self._interval_cache.clear()
+
+    def remove_device(self, device_address: str) -> None:
+        """Cancel the windows and forget the intervals of a removed device."""
+        for key in [
+            key
+            for key in self._interval_cache.keys() | self._aggregates.keys()
+            if get_device_address(key[0]) == device_address
+        ]:
+            if (timer := self._timers.pop(key, None)) is not None:
+                timer.cancel()
+            self._windows.pop(key, None)
+            self._aggregates.pop(key, None)
+            self._interval_cache.pop(key, None)
+
+    def _get_interval(self, channel_address: str, parameter: str) -> float | None:
+        """Return the interval for a (channel_address, parameter)."""
+        key = (channel_address, parameter)
+        if key in self._interval_cache:
+            return self._interval_cache[key]
+        if (
+            device_type := self._get_device_type(get_device_address(channel_address))
+        ) is None:
+            # Device is not created yet, so don't cache.
+            return None
+        interval = self._intervals.get(
+            (device_type, parameter), self._intervals.get((ALL_DEVICE_TYPES, parameter))
+        )
+        self._interval_cache[key] = interval
+        return interval
+
+    def _flush(self, key: tuple[str, str], interval: float) -> None:
+        """Close the window and emit the last value, if events were suppressed."""
+        if (window := self._windows.pop(key, None)) is None:
+            return
+        self._timers.pop(key, None)
+        if window.count > 0:
+            self._aggregates[key] = window.get_aggregate()
+        if window.suppressed == 0:
+            return
+        channel_address, parameter = key
+        # Open the next window, so the rate stays limited.
+        self._windows[key] = _Window(interface_id=window.interface_id, last=window.last)
+        self._timers[key] = self._loop.call_later(interval, self._flush, key, interval)
+        try:
+            self._emit(window.interface_id, channel_address, parameter, window.last)
+        except Exception as ex:  # pylint: disable=broad-except
+            _LOGGER.warning(
+                "flush failed: Unable to emit event for %s, %s: %s",
+                channel_address,
+                parameter,
+                ex.args,
+            )
@@ -0,0 +1,144 @@
+"""
+Event queue module.
+Decouples the XML-RPC server thread from the processing
+of events within the event loop of the central.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+import logging
+import threading
+import time
+from typing import Any, Final
+
+from hahomematic import config
+
+_LOGGER = logging.getLogger(__name__)
+
+# Max. number of events of an interface passed to the central in one batch.
+_DRAIN_BATCH_SIZE: Final = 100
+
+
+@dataclass
+class EventQueueStatistics:
+    """Counters of the event queue."""
+
+    enqueued: int = 0
+    coalesced: int = 0
+    dropped: int = 0
+    max_lag: float = 0.0
+
+
+class EventQueue:
+    """
+    Bounded queue for events (channel_address, parameter, value).
+    Each interface gets an equal share of the capacity and the interfaces
+    are drained round-robin, so a busy interface cannot starve the others.
+    If the share of an interface is exhausted, a new value replaces
+    the queued value of the same (channel_address, parameter).
+    Events without a queued predecessor are dropped in that case.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        process: Callable[[str, list[tuple[str, str, Any]]], None],
+        capacity: int | None = None,
+    ):
+        """Init the event queue."""
+        self._loop: Final[asyncio.AbstractEventLoop] = loop
+        self._process: Final = process
+        self._capacity: Final[int] = capacity or config.EVENT_QUEUE_CAPACITY
+        self._lock: Final = threading.Lock()
+        # queued entries: [channel_address, parameter, value, enqueued_at]
+        self._queues: Final[dict[str, deque[list[Any]]]] = {}
+        # latest queued entry by (channel_address, parameter) per interface
+        self._latest: Final[dict[str, dict[tuple[str, str], list[Any]]]] = {}
+        self._size: int = 0
+        self._drain_scheduled: bool = False
+        self.statistics: Final[EventQueueStatistics] = EventQueueStatistics()
+
+    @property
+    def size(self) -> int:
+        """Return the number of queued events."""
+        return self._size
+
+    def put(self, interface_id: str, events: list[tuple[str, str, Any]]) -> None:
+        """Add events of an interface. Can be called from any thread."""
+        enqueued_at = time.monotonic()
+        with self._lock:
+            if (queue := self._queues.get(interface_id)) is None:
+                queue = self._queues[interface_id] = deque()
+                self._latest[interface_id] = {}
+            latest = self._latest[interface_id]
+            share = max(self._capacity // len(self._queues), 1)
+            for channel_address, parameter, value in events:
+                key = (channel_address, parameter)
+                if len(queue) >= share:
+                    if (entry := latest.get(key)) is not None:
+                        entry[2] = value
+                        self.statistics.coalesced += 1
+                    else:
+                        self.statistics.dropped += 1
+                    continue
+                entry = [channel_address, parameter, value, enqueued_at]
+                queue.append(entry)
+                latest[key] = entry
+                self._size += 1
+                self.statistics.enqueued += 1
+            schedule_drain = self._size > 0 and not self._drain_scheduled
+            if schedule_drain:
+                self._drain_scheduled = True
+        if schedule_drain:
+            self._loop.call_soon_threadsafe(self._drain)
+
+    def clear(self) -> None:
+        """Remove all queued events."""
+        with self._lock:
+            self._queues.clear()
+            self._latest.clear()
+            self._size = 0
+
+    def _drain(self) -> None:
+        """
+        Pass one batch per interface to the central.
+        Must be run in the event loop. Reschedules itself
+        to give other tasks a chance, if events are left.
+        """
+        batches: list[tuple[str, list[list[Any]]]] = []
+        with self._lock:
+            for interface_id, queue in self._queues.items():
+                if not queue:
+                    continue
+                latest = self._latest[interface_id]
+                batch: list[list[Any]] = []
+                while queue and len(batch) < _DRAIN_BATCH_SIZE:
+                    entry = queue.popleft()
+                    key = (entry[0], entry[1])
+                    if latest.get(key) is entry:
+                        del latest[key]
+                    batch.append(entry)
+                self._size -= len(batch)
+                batches.append((interface_id, batch))
+            events_left = self._size > 0
+            self._drain_scheduled = events_left
+
+        now = time.monotonic()
+        for interface_id, batch in batches:
+            self.statistics.max_lag = max(self.statistics.max_lag, now - batch[0][3])
+            try:
+                self._process(
+                    interface_id,
+                    [(entry[0], entry[1], entry[2]) for entry in batch],
+                )
+            except Exception as ex:  # pylint: disable=broad-except
+                _LOGGER.warning(
+                    "drain failed: Unable to process events of %s: %s",
+                    interface_id,
+                    ex.args,
+                )
+        if events_left:
+            self._loop.call_soon(self._drain)
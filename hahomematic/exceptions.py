@@ -51,3 +51,11 @@ class HaHomematicException(BaseHomematicException):
     def __init__(self, *args: Any) -> None:
         """Init the HaHomematicException."""
         super().__init__("HaHomematicException", *args)
+
+
+class ClientException(BaseHomematicException):
+    """hahomematic ClientException exception."""
+
+    def __init__(self, *args: Any) -> None:
+        """Init the ClientException."""
+        super().__init__("ClientException", *args)
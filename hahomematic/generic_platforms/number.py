@@ -5,6 +5,7 @@ number platform (https://www.home-assistant.io/integrations/number/).
 from __future__ import annotations
 
 import logging
+from typing import Any
 
 from hahomematic.const import HM_VALUE, HmPlatform
 from hahomematic.entity import GenericEntity, GenericSystemVariable, ParameterT
@@ -80,18 +81,20 @@ class HmSysvarNumber(GenericSystemVariable):
     _attr_platform = HmPlatform.HUB_NUMBER
     _attr_is_extended = True
 
-    async def send_variable(self, value: float) -> None:
-        """Set the value of the entity."""
-        if value is not None and self.max is not None and self.min is not None:
-            if self.min <= float(value) <= self.max:
-                await super().send_variable(value)
-            else:
-                _LOGGER.warning(
-                    "sysvar.number failed: Invalid value: %s (min: %s, max: %s)",
-                    value,
-                    self.min,
-                    self.max,
-                )
-            return
-        if value is not None:
-            await super().send_variable(value)
+    def get_send_value(self, value: Any) -> Any | None:
+        """Return the value for CCU/Homegear or None, if the value is invalid."""
+        if value is None:
+            return None
+        if (
+            self.max is not None
+            and self.min is not None
+            and not self.min <= float(value) <= self.max
+        ):
+            _LOGGER.warning(
+                "sysvar.number failed: Invalid value: %s (min: %s, max: %s)",
+                value,
+                self.min,
+                self.max,
+            )
+            return None
+        return super().get_send_value(value)
@@ -5,7 +5,7 @@ select platform (https://www.home-assistant.io/integrations/select/).
 from __future__ import annotations
 
 import logging
-from typing import Union
+from typing import Any, Union
 
 from hahomematic.const import HmPlatform
 from hahomematic.decorators import value_property
@@ -64,20 +64,19 @@ class HmSysvarSelect(GenericSystemVariable):
             return self._attr_value_list[int(self._attr_value)]
         return None
 
-    async def send_variable(self, value: int | str) -> None:
-        """Set the value of the entity."""
+    def get_send_value(self, value: Any) -> Any | None:
+        """Return the value for CCU/Homegear or None, if the value is invalid."""
         # We allow setting the value via index as well, just in case.
         if isinstance(value, int) and self._attr_value_list:
             if 0 <= value < len(self._attr_value_list):
-                await super().send_variable(value)
-                return None
+                return super().get_send_value(value)
         elif self._attr_value_list:
             if value in self._attr_value_list:
-                await super().send_variable(self._attr_value_list.index(value))
-                return None
+                return super().get_send_value(self._attr_value_list.index(value))
 
         _LOGGER.warning(
             "Value not in value_list for %s/%s.",
             self.name,
             self.unique_identifier,
         )
+        return None
@@ -487,6 +487,27 @@ class SystemVariableData(HubData):
     max_value: float | int | None = None
     min_value: float | int | None = None
     extended_sysvar: bool = False
+    vid: str | None = None
+
+
+@dataclass
+class HubDataSnapshot:
+    """Dataclass for all system variables and programs."""
+
+    variables: list[SystemVariableData]
+    programs: list[ProgramData]
+    backend_timestamp: int | None = None
+
+
+@dataclass
+class HubDataDelta:
+    """Dataclass for the changes of system variables and programs."""
+
+    backend_timestamp: int
+    variables: list[SystemVariableData]
+    programs: list[ProgramData]
+    deleted_sysvar_ids: list[str]
+    deleted_program_ids: list[str]
 
 
 class EntityNameData:
@@ -2,13 +2,19 @@
 from __future__ import annotations
 
 import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime
 import logging
+import time
 from typing import Final
 
+from hahomematic import config
 import hahomematic.central_unit as hmcu
+import hahomematic.client as hmcl
 from hahomematic.const import (
     BACKEND_CCU,
     HH_EVENT_HUB_REFRESHED,
+    INIT_DATETIME,
     SYSVAR_HM_TYPE_FLOAT,
     SYSVAR_HM_TYPE_INTEGER,
     SYSVAR_TYPE_ALARM,
@@ -17,6 +23,7 @@ from hahomematic.const import (
     SYSVAR_TYPE_STRING,
 )
 from hahomematic.entity import GenericSystemVariable
+from hahomematic.exceptions import BaseHomematicException
 from hahomematic.generic_platforms.binary_sensor import HmSysvarBinarySensor
 from hahomematic.generic_platforms.button import HmProgramButton
 from hahomematic.generic_platforms.number import HmSysvarNumber
@@ -24,7 +31,12 @@ from hahomematic.generic_platforms.select import HmSysvarSelect
 from hahomematic.generic_platforms.sensor import HmSysvarSensor
 from hahomematic.generic_platforms.switch import HmSysvarSwitch
 from hahomematic.generic_platforms.text import HmSysvarText
-from hahomematic.helpers import ProgramData, SystemVariableData
+from hahomematic.helpers import (
+    HubDataDelta,
+    ProgramData,
+    SystemVariableData,
+    updated_within_seconds,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,6 +46,180 @@ EXCLUDED = [
 ]
 
 
+@dataclass
+class HubPollingStatistics:
+    """Decisions of the hub polling scheduler."""
+
+    polls: int = 0
+    polls_with_changes: int = 0
+    writes: int = 0
+    # polls after which the interval was shortened / extended
+    faster: int = 0
+    slower: int = 0
+    # interval of the next poll in seconds
+    interval: float = 0.0
+    # changes by sysvar name and by program id
+    sysvar_changes: dict[str, int] = field(default_factory=dict)
+    program_changes: dict[str, int] = field(default_factory=dict)
+
+
+class HubPollingScheduler:
+    """
+    Poll sysvars and programs with an adaptive interval.
+    The interval is halved after a poll with changes and doubled after
+    a poll without changes, within the floor and ceiling of the config.
+    While sysvars or programs change periodically, the interval is not
+    extended beyond their period. A write of a system variable lets the
+    next poll follow after the floor.
+    """
+
+    def __init__(self, hub: HmHub) -> None:
+        """Init the hub polling scheduler."""
+        self._hub: Final[HmHub] = hub
+        self.statistics: Final[HubPollingStatistics] = HubPollingStatistics()
+        # monotonic time of the last change and avg. period between changes
+        self._last_changes: Final[dict[tuple[str, str], float]] = {}
+        self._change_periods: Final[dict[tuple[str, str], float]] = {}
+        self._changed: bool = False
+        self._write_pending: bool = False
+        self._wake_up: Final = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def is_running(self) -> bool:
+        """Return if the scheduler is polling."""
+        return self._task is not None and not self._task.done()
+
+    def start(
+        self,
+        include_internal_sysvars: bool = True,
+        include_internal_programs: bool = False,
+    ) -> None:
+        """Start polling. Must be called from within the event loop."""
+        if self.is_running:
+            return
+        self.statistics.interval = float(config.HUB_POLL_MIN_INTERVAL)
+        self._task = asyncio.get_running_loop().create_task(
+            self._poll(
+                include_internal_sysvars=include_internal_sysvars,
+                include_internal_programs=include_internal_programs,
+            )
+        )
+
+    def stop(self) -> None:
+        """Stop polling."""
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    def notify_write(self) -> None:
+        """Poll soon, after a system variable has been written."""
+        self.statistics.writes += 1
+        self._write_pending = True
+        self._wake_up.set()
+
+    def record_sysvar_change(self, name: str) -> None:
+        """Record the change of a system variable."""
+        self._record_change(
+            key=("sysvar", name), changes=self.statistics.sysvar_changes
+        )
+
+    def record_program_change(self, pid: str) -> None:
+        """Record the change of a program."""
+        self._record_change(
+            key=("program", pid), changes=self.statistics.program_changes
+        )
+
+    def _record_change(self, key: tuple[str, str], changes: dict[str, int]) -> None:
+        """Count the change and update the period between changes."""
+        changes[key[1]] = changes.get(key[1], 0) + 1
+        self._changed = True
+        now = time.monotonic()
+        if (last_change := self._last_changes.get(key)) is not None:
+            period = now - last_change
+            if (avg_period := self._change_periods.get(key)) is not None:
+                period = (avg_period + period) / 2
+            self._change_periods[key] = period
+        self._last_changes[key] = now
+
+    async def _poll(
+        self, include_internal_sysvars: bool, include_internal_programs: bool
+    ) -> None:
+        """Fetch the hub data in the current interval."""
+        while True:
+            await self._wait()
+            written = self._write_pending
+            self._write_pending = False
+            self._changed = False
+            try:
+                await self._hub.fetch_hub_data(
+                    include_internal_sysvars=include_internal_sysvars,
+                    include_internal_programs=include_internal_programs,
+                )
+            except BaseHomematicException as ex:
+                _LOGGER.warning(
+                    "poll: Unable to fetch hub data: %s [%s]",
+                    type(ex).__name__,
+                    ex.args,
+                )
+            self._adapt_interval(changed=self._changed, written=written)
+
+    async def _wait(self) -> None:
+        """Wait for the interval. A write shortens the wait to the floor."""
+        self._wake_up.clear()
+        if not self._write_pending:
+            try:
+                await asyncio.wait_for(
+                    self._wake_up.wait(), timeout=self.statistics.interval
+                )
+            except asyncio.TimeoutError:
+                return
+        await asyncio.sleep(config.HUB_POLL_MIN_INTERVAL)
+
+    def _adapt_interval(self, changed: bool, written: bool) -> None:
+        """Set the interval of the next poll."""
+        statistics = self.statistics
+        statistics.polls += 1
+        if changed:
+            statistics.polls_with_changes += 1
+        if written:
+            interval = float(config.HUB_POLL_MIN_INTERVAL)
+        elif changed:
+            interval = statistics.interval / 2
+        else:
+            interval = min(statistics.interval * 2, self._get_change_period())
+        interval = min(
+            max(interval, config.HUB_POLL_MIN_INTERVAL), config.HUB_POLL_MAX_INTERVAL
+        )
+        if interval < statistics.interval:
+            statistics.faster += 1
+        elif interval > statistics.interval:
+            statistics.slower += 1
+        statistics.interval = interval
+        _LOGGER.debug(
+            "adapt_interval: Next hub poll of %s in %.1fs (changed: %s, written: %s)",
+            self._hub.name,
+            interval,
+            changed,
+            written,
+        )
+
+    def _get_change_period(self) -> float:
+        """
+        Return the shortest period of the sysvars and programs,
+        that are still changing, or the ceiling.
+        """
+        now = time.monotonic()
+        return min(
+            (
+                period
+                for key, period in self._change_periods.items()
+                if now - self._last_changes[key] <= 2 * period
+            ),
+            default=float(config.HUB_POLL_MAX_INTERVAL),
+        )
+
+
 class HmHub:
     """The HomeMatic hub. (CCU/HomeGear)."""
 
@@ -42,24 +228,152 @@ class HmHub:
         self._sema_fetch_sysvars = asyncio.Semaphore()
         self._sema_fetch_programs = asyncio.Semaphore()
         self._central: Final[hmcu.CentralUnit] = central
+        # Base of the next delta: backend time and includes of the last fetch
+        self._backend_timestamp: int | None = None
+        self._includes: tuple[bool, bool] | None = None
+        self._last_full_refresh: datetime = INIT_DATETIME
+        # Names of the received system variables by id
+        self._sysvar_names: dict[str, str] = {}
+        self.polling: Final[HubPollingScheduler] = HubPollingScheduler(hub=self)
+
+    @property
+    def name(self) -> str:
+        """Return the name of the central."""
+        return self._central.name
 
     async def fetch_sysvar_data(self, include_internal: bool = True) -> None:
-        """fetch sysvar data for the hub."""
+        """
+        fetch sysvar data for the hub.
+        This is always a full fetch and not routed by the delta of fetch_hub_data:
+        the delta covers sysvars and programs with the includes of the last
+        full refresh, so it can't serve a fetch of sysvars only. The base of the
+        delta is kept, the next delta just applies these changes again.
+        """
         async with self._sema_fetch_sysvars:
             if self._central.available:
                 await self._update_sysvar_entities(include_internal=include_internal)
 
     async def fetch_program_data(self, include_internal: bool = False) -> None:
-        """fetch program data for the hub."""
+        """
+        fetch program data for the hub.
+        Like fetch_sysvar_data always a full fetch, that keeps the base
+        of the delta of fetch_hub_data.
+        """
         async with self._sema_fetch_programs:
             if self._central.available:
                 await self._update_program_entities(include_internal=include_internal)
 
+    async def fetch_hub_data(
+        self,
+        include_internal_sysvars: bool = True,
+        include_internal_programs: bool = False,
+    ) -> None:
+        """
+        fetch sysvar and program data for the hub within one request.
+        Between full refreshes only the changes are fetched, if supported.
+        """
+        async with self._sema_fetch_sysvars, self._sema_fetch_programs:
+            if self._central.available and (client := self._get_client()):
+                includes = (include_internal_sysvars, include_internal_programs)
+                if await self._fetch_hub_data_delta(client=client, includes=includes):
+                    return
+                hub_data = await client.get_hub_data(
+                    include_internal_sysvars=include_internal_sysvars,
+                    include_internal_programs=include_internal_programs,
+                )
+                self._update_programs(programs=hub_data.programs)
+                self._update_sysvars(variables=hub_data.variables)
+                if hub_data.variables or hub_data.programs:
+                    self._backend_timestamp = hub_data.backend_timestamp
+                    self._includes = includes
+                    self._last_full_refresh = datetime.now()
+
+    async def _fetch_hub_data_delta(
+        self, client: hmcl.Client, includes: tuple[bool, bool]
+    ) -> bool:
+        """
+        Fetch and apply the changes since the last fetch.
+        Return False, if a full refresh is required.
+        """
+        if (
+            self._backend_timestamp is None
+            or includes != self._includes
+            or not updated_within_seconds(
+                last_update=self._last_full_refresh,
+                max_age_seconds=config.HUB_FULL_REFRESH_INTERVAL,
+            )
+        ):
+            return False
+        if (
+            delta := await client.get_hub_data_since(
+                since=self._backend_timestamp,
+                known_sysvar_ids=set(self._sysvar_names),
+                known_program_ids=set(self._central.program_entities),
+                include_internal_sysvars=includes[0],
+                include_internal_programs=includes[1],
+            )
+        ) is None:
+            return False
+        _LOGGER.debug(
+            "_fetch_hub_data_delta: %i sysvars and %i programs changed for %s",
+            len(delta.variables),
+            len(delta.programs),
+            self._central.name,
+        )
+        self._backend_timestamp = delta.backend_timestamp
+        self._apply_delta(delta=delta)
+        return True
+
+    def _apply_delta(self, delta: HubDataDelta) -> None:
+        """Apply the changes of system variables and programs."""
+        self._remove_program_entity(ids=delta.deleted_program_ids)
+        self._add_or_update_programs(programs=delta.programs)
+
+        removed_variable_names: set[str] = set()
+        for vid in delta.deleted_sysvar_ids:
+            if (name := self._sysvar_names.pop(vid, None)) is not None:
+                removed_variable_names.add(name)
+        for sysvar in delta.variables:
+            if sysvar.vid is None:
+                continue
+            # renamed
+            if (name := self._sysvar_names.get(sysvar.vid, sysvar.name)) != sysvar.name:
+                removed_variable_names.add(name)
+            self._sysvar_names[sysvar.vid] = sysvar.name
+            # recreated for another platform
+            if (
+                entity := self._central.sysvar_entities.get(sysvar.name)
+            ) and entity.is_extended is not sysvar.extended_sysvar:
+                removed_variable_names.add(sysvar.name)
+        if removed_variable_names:
+            self._remove_sysvar_entity(del_entities=removed_variable_names)
+
+        variables = delta.variables
+        if self._central.model is BACKEND_CCU:
+            variables = _clean_variables(variables)
+        self._add_or_update_sysvars(variables=variables)
+
+    def _get_client(self) -> hmcl.Client | None:
+        """Return the primary client, if its backend is reachable."""
+        if client := self._central.get_primary_client():
+            if client.circuit_breaker.is_open:
+                _LOGGER.debug(
+                    "_get_client: Backend of %s is not reachable", self._central.name
+                )
+                return None
+        return client
+
     async def _update_program_entities(self, include_internal: bool) -> None:
         """Retrieve all program data and update program values."""
-        programs: list[ProgramData] = []
-        if client := self._central.get_primary_client():
-            programs = await client.get_all_programs(include_internal=include_internal)
+        if client := self._get_client():
+            self._update_programs(
+                programs=await client.get_all_programs(
+                    include_internal=include_internal
+                )
+            )
+
+    def _update_programs(self, programs: list[ProgramData]) -> None:
+        """Update program values."""
         if not programs:
             _LOGGER.debug(
                 "_update_program_entities: No programs received for %s",
@@ -76,6 +390,10 @@ class HmHub:
         if missing_program_ids:
             self._remove_program_entity(ids=missing_program_ids)
 
+        self._add_or_update_programs(programs=programs)
+
+    def _add_or_update_programs(self, programs: list[ProgramData]) -> None:
+        """Update the entities of the programs. Create missing entities."""
         new_programs: list[HmProgramButton] = []
 
         for program_data in programs:
@@ -83,7 +401,10 @@ class HmHub:
                 program_data.pid
             )
             if entity:
+                state = (entity.is_active, entity.last_execute_time)
                 entity.update_data(data=program_data)
+                if state != (entity.is_active, entity.last_execute_time):
+                    self.polling.record_program_change(pid=program_data.pid)
             else:
                 new_programs.append(self._create_program(data=program_data))
 
@@ -96,11 +417,15 @@ class HmHub:
 
     async def _update_sysvar_entities(self, include_internal: bool = True) -> None:
         """Retrieve all variable data and update hmvariable values."""
-        variables: list[SystemVariableData] = []
-        if client := self._central.get_primary_client():
-            variables = await client.get_all_system_variables(
-                include_internal=include_internal
+        if client := self._get_client():
+            self._update_sysvars(
+                variables=await client.get_all_system_variables(
+                    include_internal=include_internal
+                )
             )
+
+    def _update_sysvars(self, variables: list[SystemVariableData]) -> None:
+        """Update hmvariable values."""
         if not variables:
             _LOGGER.debug(
                 "_update_entities: No sysvars received for %s",
@@ -113,6 +438,10 @@ class HmHub:
             self._central.name,
         )
 
+        self._sysvar_names = {
+            sysvar.vid: sysvar.name for sysvar in variables if sysvar.vid is not None
+        }
+
         # remove some variables in case of CCU Backend
         # - OldValue(s) are for internal calculations
         if self._central.model is BACKEND_CCU:
@@ -124,6 +453,10 @@ class HmHub:
         if missing_variable_names:
             self._remove_sysvar_entity(del_entities=missing_variable_names)
 
+        self._add_or_update_sysvars(variables=variables)
+
+    def _add_or_update_sysvars(self, variables: list[SystemVariableData]) -> None:
+        """Update the values of the system variables. Create missing entities."""
         new_sysvars: list[GenericSystemVariable] = []
 
         for sysvar in variables:
@@ -134,7 +467,10 @@ class HmHub:
                 name
             )
             if entity:
+                old_value = entity.value
                 entity.update_value(value)
+                if entity.value != old_value:
+                    self.polling.record_sysvar_change(name=name)
             else:
                 new_sysvars.append(self._create_system_variable(data=sysvar))
 
@@ -3,18 +3,22 @@ Implementation of an async json-rpc client.
 """
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator
 from datetime import datetime
-import json
 import logging
+import math
 import os
 from pathlib import Path
 import re
 import ssl
+import time
 from typing import Any, Final
+from urllib.parse import unquote
 
 from aiohttp import ClientConnectorError, ClientError, ClientSession
 
-from hahomematic import config
+from hahomematic import config, serializer
 from hahomematic.const import (
     ATTR_ERROR,
     ATTR_NAME,
@@ -23,7 +27,7 @@ from hahomematic.const import (
     ATTR_SESSION_ID,
     ATTR_USERNAME,
     DEFAULT_ENCODING,
-    MAX_JSON_SESSION_AGE,
+    INIT_DATETIME,
     PATH_JSON_RPC,
     PROGRAM_ID,
     PROGRAM_ISACTIVE,
@@ -31,9 +35,13 @@ from hahomematic.const import (
     PROGRAM_LASTEXECUTETIME,
     PROGRAM_NAME,
     REGA_SCRIPT_FETCH_ALL_DEVICE_DATA,
+    REGA_SCRIPT_FETCH_DEVICE_DATA_SINCE,
+    REGA_SCRIPT_FETCH_HUB_DATA_SINCE,
+    REGA_SCRIPT_GET_BACKEND_TIME,
     REGA_SCRIPT_GET_SERIAL,
     REGA_SCRIPT_PATH,
     REGA_SCRIPT_SET_SYSTEM_VARIABLE,
+    REGA_SCRIPT_SET_SYSTEM_VARIABLES,
     REGA_SCRIPT_SYSTEM_VARIABLES_EXT_MARKER,
     SYSVAR_HASEXTMARKER,
     SYSVAR_HM_TYPE_FLOAT,
@@ -49,16 +57,46 @@ from hahomematic.const import (
     SYSVAR_VALUE,
     SYSVAR_VALUE_LIST,
 )
-from hahomematic.exceptions import BaseHomematicException, HaHomematicException
+from hahomematic.exceptions import (
+    BaseHomematicException,
+    ClientException,
+    HaHomematicException,
+)
 from hahomematic.helpers import (
+    HubDataDelta,
+    HubDataSnapshot,
     ProgramData,
     SystemVariableData,
     get_tls_context,
     parse_sys_var,
+    updated_within_seconds,
+)
+from hahomematic.json_stream import (
+    DeviceDataDecoder,
+    JsonRpcResultDecoder,
+    split_datapoint_name,
 )
+from hahomematic.rpc_metrics import JSON_RPC, MethodMetrics, RpcMetrics
 
 _LOGGER = logging.getLogger(__name__)
 
+_METHOD_RUN_SCRIPT: Final = "ReGa.runScript"
+# Encoding of the URL encoded texts of ReGa scripts.
+_REGA_ENCODING: Final = "iso-8859-1"
+# Separator of the known ids of fetch_hub_data_since.fn.
+_REGA_ID_SEPARATOR: Final = "\t"
+# Statement of set_system_variables.fn, that sets one variable.
+_SET_SYSTEM_VARIABLE_STATEMENT: Final = (
+    'oSysvar = oSysvars.Get("{name}");\n'
+    'if (oSysvar) {{ Write(oSysvar.State({value})); }} else {{ Write("false"); }}\n'
+)
+# Texts, that can not be written into a string literal of a ReGa script.
+_UNSAFE_REGA_TEXT: Final = re.compile(
+    r'["\\\r\n]|<.*?>|&([a-z0-9]+|#[0-9]{1,6}|#x[0-9a-f]{1,6});'
+)
+# Size of the chunks, in which streamed responses are read.
+_STREAM_CHUNK_SIZE: Final = 65536
+
 
 class JsonRpcAioHttpClient:
     """Connection to CCU JSON-RPC Server."""
@@ -75,65 +113,95 @@ class JsonRpcAioHttpClient:
         """Session setup."""
         self._client_session: Final[ClientSession | None] = client_session
         self._session_id: str | None = None
-        self._last_session_id_refresh: datetime | None = None
+        self._sema_login: Final = asyncio.Lock()
+        self._session_keeper: asyncio.Task | None = None
+        self._batch_supported: bool = True
         self._username: Final[str] = username
         self._password: Final[str] = password
         self._tls: Final[bool] = tls
         self._tls_context: Final[ssl.SSLContext] = get_tls_context(verify_tls)
         self._url: Final[str] = f"{device_url}{PATH_JSON_RPC}"
         self._script_cache: dict[str, str] = {}
+        # ext markers by sysvar id and the sysvar ids, they were fetched for
+        self._ext_markers: dict[str, bool] | None = None
+        self._ext_marker_sysvar_ids: frozenset[str] = frozenset()
+        # a failed fetch of the ext markers is retried with the next full refresh
+        self._ext_markers_failed_at: datetime = INIT_DATETIME
+        self._rpc_metrics: Final[RpcMetrics] = RpcMetrics(name=JSON_RPC)
+
+    @property
+    def rpc_metrics(self) -> dict[str, MethodMetrics]:
+        """Return the metrics of the JSON-RPC calls by method."""
+        return self._rpc_metrics.snapshot()
 
     @property
     def is_activated(self) -> bool:
         """If session exists, then it is activated."""
         return self._session_id is not None
 
-    async def _login_or_renew(self) -> bool:
-        """Renew JSON-RPC session or perform login."""
-        if not self.is_activated:
-            self._session_id = await self._do_login()
-            self._last_session_id_refresh = datetime.now()
-            return self._session_id is not None
+    async def _get_session_id(self) -> str | None:
+        """
+        Return the session id. Concurrent calls share one login.
+        The session is renewed in the background after the login.
+        """
         if self._session_id:
-            self._session_id = await self._do_renew_login(self._session_id)
-        return self._session_id is not None
-
-    async def _do_renew_login(self, session_id: str) -> str | None:
-        """Renew JSON-RPC session or perform login."""
+            return self._session_id
+        async with self._sema_login:
+            if not self._session_id:
+                if session_id := await self._do_login():
+                    self._session_id = session_id
+                    self._start_session_keeper()
+            return self._session_id
+
+    def _invalidate_session(self, session_id: str) -> None:
+        """Forget an expired session. The next call logs in again."""
+        if self._session_id == session_id:
+            _LOGGER.debug("_invalidate_session: Session %s expired", session_id)
+            self._session_id = None
+            self._stop_session_keeper()
+
+    def _start_session_keeper(self) -> None:
+        """Start renewing the session in the background."""
+        self._stop_session_keeper()
+        self._session_keeper = asyncio.create_task(self._keep_session())
+
+    def _stop_session_keeper(self) -> None:
+        """Stop renewing the session."""
+        if self._session_keeper and self._session_keeper is not asyncio.current_task():
+            self._session_keeper.cancel()
+        self._session_keeper = None
+
+    async def _keep_session(self) -> None:
+        """Renew the session before it expires."""
+        while session_id := self._session_id:
+            await asyncio.sleep(config.JSON_SESSION_RENEW_INTERVAL)
+            if session_id == self._session_id and not await self._do_renew_login(
+                session_id=session_id
+            ):
+                self._invalidate_session(session_id=session_id)
+
+    async def _do_renew_login(self, session_id: str) -> bool:
+        """Renew JSON-RPC session."""
         try:
-            if self._updated_within_seconds():
-                return session_id
             method = "Session.renew"
             response = await self._do_post(
                 session_id=session_id,
                 method=method,
                 extra_params={ATTR_SESSION_ID: session_id},
             )
-            if response[ATTR_ERROR] is None and response[ATTR_RESULT]:
-                if response[ATTR_RESULT] is True:
-                    self._last_session_id_refresh = datetime.now()
-                    _LOGGER.debug(
-                        "_do_renew_login: Method: %s [%s]", method, session_id
-                    )
-                    return session_id
-            return await self._do_login()
-        except ClientError as cer:
+            if response[ATTR_ERROR] is None and response[ATTR_RESULT] is True:
+                _LOGGER.debug("_do_renew_login: Method: %s [%s]", method, session_id)
+                return True
+            _LOGGER.debug(
+                "_do_renew_login failed: Unable to renew session: %s",
+                response[ATTR_ERROR],
+            )
+        except BaseHomematicException as hhe:
             _LOGGER.error(
-                "_do_renew_login failed: "
-                "ClientError [%s] while renewing JSON-RPC session",
-                cer.args,
+                "_do_renew_login failed: %s [%s] while renewing JSON-RPC session",
+                hhe.name,
+                hhe.args,
             )
-            return None
-
-    def _updated_within_seconds(
-        self, max_age_seconds: int = MAX_JSON_SESSION_AGE
-    ) -> bool:
-        """Check if session id has been updated within 90 seconds."""
-        if self._last_session_id_refresh is None:
-            return False
-        delta = datetime.now() - self._last_session_id_refresh
-        if delta.seconds < max_age_seconds:
-            return True
         return False
 
     async def _do_login(self) -> str | None:
@@ -177,34 +245,64 @@ class JsonRpcAioHttpClient:
             )
             return None
 
-    async def _post(
+    async def _post_with_session(
         self,
         method: str,
-        extra_params: dict[str, str] | None = None,
-        use_default_params: bool = True,
-        keep_session: bool = True,
+        extra_params: dict[str, str] | None,
+        use_default_params: bool,
+        keep_session: bool,
     ) -> dict[str, Any] | Any:
-        """Reusable JSON-RPC POST function."""
+        """
+        POST within the kept session.
+        A request, that is rejected because the session expired,
+        is retried once with a new session.
+        """
         if keep_session:
-            await self._login_or_renew()
-            session_id = self._session_id
+            session_id = await self._get_session_id()
         else:
             session_id = await self._do_login()
 
         if not session_id:
-            _LOGGER.warning("_post failed: Error while logging in via JSON-RPC.")
+            _LOGGER.warning(
+                "_post_with_session failed: Error while logging in via JSON-RPC."
+            )
             return {"error": "Unable to open session.", "result": {}}
 
-        _LOGGER.debug("_post: Method: %s, [%s]", method, extra_params)
         response = await self._do_post(
             session_id=session_id,
             method=method,
             extra_params=extra_params,
             use_default_params=use_default_params,
         )
+        if keep_session and _is_session_expired(response):
+            self._invalidate_session(session_id=session_id)
+            if session_id := await self._get_session_id():
+                response = await self._do_post(
+                    session_id=session_id,
+                    method=method,
+                    extra_params=extra_params,
+                    use_default_params=use_default_params,
+                )
 
         if not keep_session:
             await self._do_logout(session_id=session_id)
+        return response
+
+    async def _post(
+        self,
+        method: str,
+        extra_params: dict[str, str] | None = None,
+        use_default_params: bool = True,
+        keep_session: bool = True,
+    ) -> dict[str, Any] | Any:
+        """Reusable JSON-RPC POST function."""
+        _LOGGER.debug("_post: Method: %s, [%s]", method, extra_params)
+        response = await self._post_with_session(
+            method=method,
+            extra_params=extra_params,
+            use_default_params=use_default_params,
+            keep_session=keep_session,
+        )
         if (error := response["error"]) is not None:
             raise HaHomematicException(f"post: error: {error}")
         return response
@@ -216,45 +314,164 @@ class JsonRpcAioHttpClient:
         keep_session: bool = True,
     ) -> dict[str, Any] | Any:
         """Reusable JSON-RPC POST_SCRIPT function."""
-        if keep_session:
-            await self._login_or_renew()
-            session_id = self._session_id
-        else:
-            session_id = await self._do_login()
+        if (
+            script_params := self._get_script_params(
+                script_name=script_name, extra_params=extra_params
+            )
+        ) is None:
+            return {
+                "error": f"Script file for {script_name} does not exist.",
+                "result": {},
+            }
 
-        if not session_id:
-            _LOGGER.warning("_post_script failed: Error while logging in via JSON-RPC.")
-            return {"error": "Unable to open session.", "result": {}}
+        response = await self._post_with_session(
+            method=_METHOD_RUN_SCRIPT,
+            extra_params=script_params,
+            use_default_params=True,
+            keep_session=keep_session,
+        )
+        _LOGGER.debug("_post_script: Method: %s [%s]", _METHOD_RUN_SCRIPT, script_name)
+        return _get_script_response(response=response)
 
+    def _get_script_params(
+        self, script_name: str, extra_params: dict[str, str] | None = None
+    ) -> dict[str, str] | None:
+        """Return the params of ReGa.runScript for a script."""
         if (script := self._get_script(script_name=script_name)) is None:
             _LOGGER.warning(
                 "_post_script failed: Script file for %s does not exist.", script_name
             )
-            return {
-                "error": f"Script file for {script_name} does not exist.",
-                "result": {},
-            }
+            return None
 
         if extra_params:
             for variable, value in extra_params.items():
                 script = script.replace(f"##{variable}##", value)
-
-        method = "ReGa.runScript"
-        response = await self._do_post(
-            session_id=session_id,
-            method=method,
-            extra_params={"script": script},
+        return {"script": script}
+
+    async def _post_batch(
+        self, calls: list[tuple[str, dict[str, str] | None]]
+    ) -> list[dict[str, Any] | Any]:
+        """
+        POST (method, extra_params) calls within the kept session.
+        The calls are sent as one JSON-RPC batch (array of requests).
+        If the backend does not answer batches, the calls are posted concurrently.
+        The responses are returned in the order of the calls and are not checked
+        for errors.
+        """
+        if self._batch_supported and (session_id := await self._get_session_id()):
+            result = await self._do_post_json(
+                data=[
+                    {
+                        "method": method,
+                        "params": _get_params(session_id, extra_params, True),
+                        "jsonrpc": "1.1",
+                        "id": call_id,
+                    }
+                    for call_id, (method, extra_params) in enumerate(calls)
+                ],
+                args=None,
+            )
+            if (responses := _get_batch_responses(result, len(calls))) is not None:
+                if not any(_is_session_expired(response) for response in responses):
+                    return responses
+                self._invalidate_session(session_id=session_id)
+            elif not _is_transport_error(result):
+                _LOGGER.debug(
+                    "_post_batch: Batches are not supported by %s. "
+                    "Posting concurrently",
+                    self._url,
+                )
+                self._batch_supported = False
+        return list(
+            await asyncio.gather(
+                *(
+                    self._post_with_session(
+                        method=method,
+                        extra_params=extra_params,
+                        use_default_params=True,
+                        keep_session=True,
+                    )
+                    for method, extra_params in calls
+                )
+            )
         )
-        if not response[ATTR_ERROR]:
-            response[ATTR_RESULT] = json.loads(response[ATTR_RESULT])
-        _LOGGER.debug("_post_script: Method: %s [%s]", method, script_name)
 
-        if not keep_session:
-            await self._do_logout(session_id=session_id)
+    async def _iter_script_output(self, script_name: str) -> AsyncIterator[str]:
+        """
+        Run a script within the kept session and yield its output piecewise,
+        while the response is read. A request, that is rejected because the
+        session expired, is retried once with a new session.
+        """
+        if (script_params := self._get_script_params(script_name=script_name)) is None:
+            raise HaHomematicException(f"Script file for {script_name} does not exist.")
+        for attempt in range(2):
+            if not (session_id := await self._get_session_id()):
+                raise HaHomematicException("Unable to open session.")
+            decoder = JsonRpcResultDecoder()
+            async for text in self._do_post_stream(
+                session_id=session_id, extra_params=script_params, decoder=decoder
+            ):
+                yield text
+            response = decoder.close()
+            if attempt == 0 and _is_session_expired(response):
+                self._invalidate_session(session_id=session_id)
+                continue
+            if (error := response[ATTR_ERROR]) is not None:
+                raise HaHomematicException(f"_iter_script_output: error: {error}")
+            return
 
-        if (error := response["error"]) is not None:
-            raise HaHomematicException(f"_post_script: error: {error}")
-        return response
+    async def _do_post_stream(
+        self,
+        session_id: str,
+        extra_params: dict[str, str],
+        decoder: JsonRpcResultDecoder,
+    ) -> AsyncIterator[str]:
+        """POST ReGa.runScript and yield the decoded result, while it is read."""
+        if not self._client_session:
+            raise HaHomematicException(
+                "_do_post_stream failed: ClientSession not initialized."
+            )
+        params = _get_params(session_id, extra_params, True)
+        payload = serializer.dumps(
+            {"method": _METHOD_RUN_SCRIPT, "params": params, "jsonrpc": "1.1", "id": 0}
+        )
+        headers = {
+            "Content-Type": "application/json",
+            "Content-Length": str(len(payload)),
+        }
+        started = time.monotonic()
+        bytes_received = 0
+        error = True
+        try:
+            async with self._client_session.post(
+                self._url,
+                data=payload,
+                headers=headers,
+                timeout=config.TIMEOUT,
+                ssl=self._tls_context if self._tls else None,
+            ) as response:
+                if response.status != 200:
+                    raise HaHomematicException(
+                        f"_do_post_stream failed: Status: {response.status}"
+                    )
+                async for chunk in response.content.iter_chunked(_STREAM_CHUNK_SIZE):
+                    bytes_received += len(chunk)
+                    if text := decoder.feed(chunk):
+                        yield text
+            error = decoder.close()[ATTR_ERROR] is not None
+        except (ClientError, OSError, ValueError) as err:
+            raise HaHomematicException(
+                f"_do_post_stream failed: {err.__class__.__name__} [{err}]"
+            ) from err
+        finally:
+            self._rpc_metrics.record(
+                method=_METHOD_RUN_SCRIPT,
+                latency=time.monotonic() - started,
+                args=params,
+                error=error,
+                bytes_sent=len(payload),
+                bytes_received=bytes_received,
+            )
 
     def _get_script(self, script_name: str) -> str | None:
         """Return a script from the script cache. Load if required."""
@@ -277,6 +494,16 @@ class JsonRpcAioHttpClient:
         use_default_params: bool = True,
     ) -> dict[str, Any] | Any:
         """Reusable JSON-RPC POST function."""
+        params = _get_params(session_id, extra_params, use_default_params)
+        return await self._do_post_json(
+            data={"method": method, "params": params, "jsonrpc": "1.1", "id": 0},
+            args=params,
+        )
+
+    async def _do_post_json(
+        self, data: dict[str, Any] | list[dict[str, Any]], args: Any
+    ) -> dict[str, Any] | Any:
+        """POST a JSON-RPC request or a batch of requests."""
         if not self._client_session:
             no_session = "_do_post failed: ClientSession not initialized."
             _LOGGER.warning(no_session)
@@ -290,12 +517,12 @@ class JsonRpcAioHttpClient:
             _LOGGER.warning(no_password)
             return {"error": str(no_password), "result": {}}
 
-        params = _get_params(session_id, extra_params, use_default_params)
-
+        started = time.monotonic()
+        payload = b""
+        bytes_received = 0
+        result: dict[str, Any] | Any = None
         try:
-            payload = json.dumps(
-                {"method": method, "params": params, "jsonrpc": "1.1", "id": 0}
-            ).encode("utf-8")
+            payload = serializer.dumps(data)
 
             headers = {
                 "Content-Type": "application/json",
@@ -314,9 +541,12 @@ class JsonRpcAioHttpClient:
                 response = await self._client_session.post(
                     self._url, data=payload, headers=headers, timeout=config.TIMEOUT
                 )
+            bytes_received = response.content_length or 0
             if response.status == 200:
+                body = await response.read()
+                bytes_received = len(body)
                 try:
-                    return await response.json(encoding="utf-8")
+                    result = serializer.loads(body)
                 except ValueError as ver:
                     _LOGGER.error(
                         "_do_post failed: ValueError [%s] Unable to parse JSON. "
@@ -324,30 +554,74 @@ class JsonRpcAioHttpClient:
                         ver.args,
                     )
                     # Workaround for bug in CCU
-                    return json.loads(
-                        (await response.json(encoding="utf-8")).replace("\\", "")
-                    )
+                    result = serializer.loads(body.replace(b"\\", b""))
             else:
                 _LOGGER.warning("_do_post failed: Status: %i", response.status)
-                return {"error": response.status, "result": {}}
+                result = {"error": response.status, "result": {}}
         except ClientConnectorError as err:
             _LOGGER.error("_do_post failed: ClientConnectorError")
-            return {"error": str(err), "result": {}}
+            result = {"error": str(err), "result": {}}
         except ClientError as cce:
             _LOGGER.error("_do_post failed: ClientError")
-            return {"error": str(cce), "result": {}}
+            result = {"error": str(cce), "result": {}}
         except TypeError as ter:
             _LOGGER.error("_do_post failed: TypeError")
-            return {"error": str(ter), "result": {}}
+            result = {"error": str(ter), "result": {}}
         except OSError as oer:
             _LOGGER.error("_do_post failed: OSError")
-            return {"error": str(oer), "result": {}}
+            result = {"error": str(oer), "result": {}}
         except Exception as ex:
             raise HaHomematicException from ex
+        finally:
+            self._record_metrics(
+                data=data,
+                args=args,
+                result=result,
+                latency=time.monotonic() - started,
+                bytes_sent=len(payload),
+                bytes_received=bytes_received,
+            )
+        return result
+
+    def _record_metrics(
+        self,
+        data: dict[str, Any] | list[dict[str, Any]],
+        args: Any,
+        result: dict[str, Any] | Any,
+        latency: float,
+        bytes_sent: int,
+        bytes_received: int,
+    ) -> None:
+        """
+        Record the metrics of a request. The calls of a batch are recorded
+        by method with the latency of the batch and an equal share of its bytes.
+        """
+        if isinstance(data, dict):
+            self._rpc_metrics.record(
+                method=data["method"],
+                latency=latency,
+                args=args,
+                error=_is_failed(result),
+                bytes_sent=bytes_sent,
+                bytes_received=bytes_received,
+            )
+            return
+        responses = _get_batch_responses(result, len(data))
+        for call_id, request in enumerate(data):
+            self._rpc_metrics.record(
+                method=request["method"],
+                latency=latency,
+                args=request["params"],
+                error=_is_failed(responses[call_id]) if responses else True,
+                bytes_sent=bytes_sent // len(data),
+                bytes_received=bytes_received // len(data),
+            )
 
     async def logout(self) -> None:
         """Logout of CCU."""
-        await self._do_logout(self._session_id)
+        self._stop_session_keeper()
+        session_id, self._session_id = self._session_id, None
+        await self._do_logout(session_id)
 
     async def _do_logout(self, session_id: str | None) -> None:
         """Logout of CCU."""
@@ -396,8 +670,8 @@ class JsonRpcAioHttpClient:
         except BaseHomematicException as hhe:
             _LOGGER.warning("execute_program failed: %s [%s]", hhe.name, hhe.args)
 
-    async def set_system_variable(self, name: str, value: Any) -> None:
-        """Set a system variable on CCU / Homegear."""
+    async def set_system_variable(self, name: str, value: Any) -> bool:
+        """Set a system variable on CCU / Homegear. Return the success."""
         _LOGGER.debug("set_system_variable: Setting System variable via JSON-RPC")
         try:
             params = {
@@ -414,7 +688,7 @@ class JsonRpcAioHttpClient:
                         "Value (%s) contains html tags. This is not allowed.",
                         value,
                     )
-                    return
+                    return False
                 response = await self._post_script(
                     script_name=REGA_SCRIPT_SET_SYSTEM_VARIABLE, extra_params=params
                 )
@@ -427,8 +701,51 @@ class JsonRpcAioHttpClient:
                     "set_system_variable: Result while setting variable: %s",
                     str(res),
                 )
+            return True
         except BaseHomematicException as hhe:
             _LOGGER.warning("set_system_variable failed: %s [%s]", hhe.name, hhe.args)
+        return False
+
+    async def set_system_variables(self, values: dict[str, Any]) -> dict[str, bool]:
+        """
+        Set several system variables on CCU within one script.
+        Return the success by name.
+        """
+        _LOGGER.debug(
+            "set_system_variables: Setting %i System variables via JSON-RPC",
+            len(values),
+        )
+        results: dict[str, bool] = {name: False for name in values}
+        names: list[str] = []
+        statements: list[str] = []
+        for name, value in values.items():
+            try:
+                if _UNSAFE_REGA_TEXT.search(name):
+                    raise ClientException(
+                        f"Name of {name} can not be written by a script."
+                    )
+                literal = _get_rega_literal(value)
+            except ClientException as cex:
+                _LOGGER.warning(
+                    "set_system_variables failed: %s [%s]", cex.name, cex.args
+                )
+                continue
+            names.append(name)
+            statements.append(
+                _SET_SYSTEM_VARIABLE_STATEMENT.format(name=name, value=literal)
+            )
+        if not statements:
+            return results
+        try:
+            response = await self._post_script(
+                script_name=REGA_SCRIPT_SET_SYSTEM_VARIABLES,
+                extra_params={"statements": 'Write(",");\n'.join(statements)},
+            )
+            for name, result in zip(names, response[ATTR_RESULT] or []):
+                results[name] = result is True
+        except BaseHomematicException as hhe:
+            _LOGGER.warning("set_system_variables failed: %s [%s]", hhe.name, hhe.args)
+        return results
 
     async def delete_system_variable(self, name: str) -> None:
         """Delete a system variable from CCU / Homegear."""
@@ -472,97 +789,202 @@ class JsonRpcAioHttpClient:
         self, include_internal: bool
     ) -> list[SystemVariableData]:
         """Get all system variables from CCU / Homegear."""
-        variables: list[SystemVariableData] = []
         _LOGGER.debug(
             "get_all_system_variables: Getting all system variables via JSON-RPC"
         )
-        try:
-            response = await self._post(
-                "SysVar.getAll",
+        sysvars, ext_markers, _ = await self._post_sysvar_batch(calls=[])
+        return _get_system_variables(
+            json_result=sysvars,
+            ext_markers=ext_markers,
+            include_internal=include_internal,
+        )
+
+    async def get_hub_data(
+        self, include_internal_sysvars: bool, include_internal_programs: bool
+    ) -> HubDataSnapshot:
+        """
+        Get all system variables, programs and the backend time
+        from CCU / Homegear within one batch.
+        """
+        _LOGGER.debug("get_hub_data: Getting sysvars and programs via JSON-RPC")
+        backend_time_calls: list[tuple[str, dict[str, str] | None]] = []
+        if backend_time_params := self._get_script_params(
+            script_name=REGA_SCRIPT_GET_BACKEND_TIME
+        ):
+            backend_time_calls.append((_METHOD_RUN_SCRIPT, backend_time_params))
+        sysvars, ext_markers, responses = await self._post_sysvar_batch(
+            calls=[*backend_time_calls, ("Program.getAll", None)]
+        )
+        program_response = responses.pop()
+        backend_timestamp = (
+            _get_backend_timestamp(
+                json_result=_get_batch_result(
+                    response=responses.pop(), name="get_backend_time", is_script=True
+                )
             )
-            if json_result := response[ATTR_RESULT]:
-                ext_markers = await self._get_system_variables_ext_markers()
-                for var in json_result:
-                    is_internal = var[SYSVAR_ISINTERNAL]
-                    if include_internal is False and is_internal is True:
-                        continue
-                    var_id = var[SYSVAR_ID]
-                    name = var[SYSVAR_NAME]
-                    org_data_type = var[SYSVAR_TYPE]
-                    raw_value = var[SYSVAR_VALUE]
-                    if org_data_type == SYSVAR_TYPE_NUMBER:
-                        data_type = (
-                            SYSVAR_HM_TYPE_FLOAT
-                            if "." in raw_value
-                            else SYSVAR_HM_TYPE_INTEGER
-                        )
-                    else:
-                        data_type = org_data_type
-                    extended_sysvar = ext_markers.get(var_id, False)
-                    unit = var[SYSVAR_UNIT]
-                    value_list: list[str] | None = None
-                    if val_list := var.get(SYSVAR_VALUE_LIST):
-                        value_list = val_list.split(";")
-                    try:
-                        value = parse_sys_var(data_type=data_type, raw_value=raw_value)
-                        max_value = None
-                        if raw_max_value := var.get(SYSVAR_MAX_VALUE):
-                            max_value = parse_sys_var(
-                                data_type=data_type, raw_value=raw_max_value
-                            )
-                        min_value = None
-                        if raw_min_value := var.get(SYSVAR_MIN_VALUE):
-                            min_value = parse_sys_var(
-                                data_type=data_type, raw_value=raw_min_value
-                            )
-                        variables.append(
-                            SystemVariableData(
-                                name=name,
-                                data_type=data_type,
-                                unit=unit,
-                                value=value,
-                                value_list=value_list,
-                                max_value=max_value,
-                                min_value=min_value,
-                                extended_sysvar=extended_sysvar,
-                            )
-                        )
-                    except ValueError as verr:
-                        _LOGGER.error(
-                            "get_all_system_variables failed: "
-                            "ValueError [%s] Failed to parse SysVar %s ",
-                            verr.args,
-                            name,
-                        )
+            if backend_time_calls
+            else None
+        )
+        return HubDataSnapshot(
+            variables=_get_system_variables(
+                json_result=sysvars,
+                ext_markers=ext_markers,
+                include_internal=include_internal_sysvars,
+            ),
+            programs=_get_programs(
+                json_result=_get_batch_result(
+                    response=program_response, name="get_all_programs"
+                ),
+                include_internal=include_internal_programs,
+            ),
+            backend_timestamp=backend_timestamp,
+        )
 
-        except BaseHomematicException as hhe:
-            _LOGGER.warning(
-                "get_all_system_variables failed: %s [%s]", hhe.name, hhe.args
+    async def _post_sysvar_batch(
+        self, calls: list[tuple[str, dict[str, str] | None]]
+    ) -> tuple[Any, dict[str, bool], list[dict[str, Any] | Any]]:
+        """
+        POST further calls and SysVar.getAll within one batch.
+        Return the sysvars, their ext markers and the responses of the calls.
+        The calls are sent before SysVar.getAll, so a backend time among them
+        is not newer than the sysvars.
+        The ext markers are only fetched with the first batch.
+        """
+        ext_marker_calls: list[tuple[str, dict[str, str] | None]] = []
+        if (
+            self._ext_markers is None
+            and not self._is_ext_marker_fetch_backing_off()
+            and (
+                ext_marker_params := self._get_script_params(
+                    script_name=REGA_SCRIPT_SYSTEM_VARIABLES_EXT_MARKER
+                )
+            )
+        ):
+            ext_marker_calls.append((_METHOD_RUN_SCRIPT, ext_marker_params))
+        responses = await self._post_batch(
+            calls=[*calls, ("SysVar.getAll", None), *ext_marker_calls]
+        )
+        ext_marker_response = responses.pop() if ext_marker_calls else None
+        sysvars = _get_batch_result(
+            response=responses.pop(), name="get_all_system_variables"
+        )
+        if ext_marker_calls:
+            ext_marker_result = _get_batch_result(
+                response=ext_marker_response,
+                name="get_system_variables_ext_markers",
+                is_script=True,
+            )
+            if sysvars is not None:
+                self._set_ext_markers(sysvars=sysvars, json_result=ext_marker_result)
+        return sysvars, await self._get_cached_ext_markers(sysvars=sysvars), responses
+
+    async def _get_cached_ext_markers(self, sysvars: Any) -> dict[str, bool]:
+        """
+        Return the ext markers of the sysvars of SysVar.getAll.
+        get_system_variables_ext_marker.fn iterates all sysvars on the CCU,
+        so the markers are cached. They are only fetched again, if sysvars
+        have been added or removed, or after clear_ext_markers.
+        After a failed fetch, the markers are not fetched again
+        within config.HUB_FULL_REFRESH_INTERVAL.
+        """
+        if sysvars is None:
+            return {}
+        if not self._is_ext_marker_fetch_backing_off() and (
+            self._ext_markers is None
+            or _get_sysvar_ids(sysvars=sysvars) != self._ext_marker_sysvar_ids
+        ):
+            _LOGGER.debug(
+                "_get_cached_ext_markers: Sysvars changed. Fetching ext markers"
             )
+            try:
+                response = await self._post_script(
+                    script_name=REGA_SCRIPT_SYSTEM_VARIABLES_EXT_MARKER
+                )
+                self._set_ext_markers(
+                    sysvars=sysvars, json_result=response[ATTR_RESULT]
+                )
+            except BaseHomematicException as hhe:
+                self._ext_markers_failed_at = datetime.now()
+                _LOGGER.warning(
+                    "get_system_variables_ext_markers failed: %s [%s]",
+                    hhe.name,
+                    hhe.args,
+                )
+        return self._ext_markers or {}
 
-        return variables
+    def _is_ext_marker_fetch_backing_off(self) -> bool:
+        """Return, if the last fetch of the ext markers failed recently."""
+        return updated_within_seconds(
+            last_update=self._ext_markers_failed_at,
+            max_age_seconds=config.HUB_FULL_REFRESH_INTERVAL,
+        )
 
-    async def _get_system_variables_ext_markers(self) -> dict[str, Any]:
-        """Get all system variables from CCU / Homegear."""
-        ext_markers: dict[str, Any] = {}
+    def _set_ext_markers(self, sysvars: Any, json_result: Any) -> None:
+        """Cache the ext markers of a get_system_variables_ext_marker.fn result."""
+        if json_result is None:
+            self._ext_markers_failed_at = datetime.now()
+            return
+        self._ext_markers = _get_ext_markers(json_result=json_result)
+        self._ext_marker_sysvar_ids = _get_sysvar_ids(sysvars=sysvars)
+
+    def _merge_ext_markers(self, delta: HubDataDelta) -> None:
+        """Update the cached ext markers with the changed sysvars."""
+        if self._ext_markers is None:
+            return
+        sysvar_ids = set(self._ext_marker_sysvar_ids)
+        for sysvar in delta.variables:
+            if sysvar.vid is not None:
+                self._ext_markers[sysvar.vid] = sysvar.extended_sysvar
+                sysvar_ids.add(sysvar.vid)
+        for vid in delta.deleted_sysvar_ids:
+            self._ext_markers.pop(vid, None)
+            sysvar_ids.discard(vid)
+        self._ext_marker_sysvar_ids = frozenset(sysvar_ids)
+
+    def clear_ext_markers(self) -> None:
+        """Fetch the ext markers of the sysvars again with the next call."""
+        self._ext_markers = None
+        self._ext_marker_sysvar_ids = frozenset()
+        self._ext_markers_failed_at = INIT_DATETIME
+
+    async def get_hub_data_since(
+        self,
+        since: int,
+        known_sysvar_ids: set[str],
+        known_program_ids: set[str],
+        include_internal_sysvars: bool,
+        include_internal_programs: bool,
+    ) -> HubDataDelta | None:
+        """
+        Get the system variables and programs, that changed since the backend
+        time or that are not known, and the known ids, that were deleted.
+        """
         _LOGGER.debug(
-            "get_system_variables_ext_markers: "
-            "Getting system variables ext markersvia JSON-RPC"
+            "get_hub_data_since: Getting sysvars and programs since %i via JSON-RPC",
+            since,
         )
         try:
             response = await self._post_script(
-                script_name=REGA_SCRIPT_SYSTEM_VARIABLES_EXT_MARKER
+                script_name=REGA_SCRIPT_FETCH_HUB_DATA_SINCE,
+                extra_params={
+                    "since": str(since),
+                    "known_sysvar_ids": _join_rega_ids(known_sysvar_ids),
+                    "known_program_ids": _join_rega_ids(known_program_ids),
+                    "include_internal_sysvars": str(include_internal_sysvars).lower(),
+                    "include_internal_programs": str(include_internal_programs).lower(),
+                },
             )
             if json_result := response[ATTR_RESULT]:
-                for data in json_result:
-                    ext_markers[data[SYSVAR_ID]] = data[SYSVAR_HASEXTMARKER]
-
+                delta = _get_hub_data_delta(
+                    json_result=json_result,
+                    include_internal_sysvars=include_internal_sysvars,
+                    include_internal_programs=include_internal_programs,
+                )
+                self._merge_ext_markers(delta=delta)
+                return delta
         except BaseHomematicException as hhe:
-            _LOGGER.warning(
-                "get_system_variables_ext_markers failed: %s [%s]", hhe.name, hhe.args
-            )
-
-        return ext_markers
+            _LOGGER.warning("get_hub_data_since failed: %s [%s]", hhe.name, hhe.args)
+        return None
 
     async def get_all_channel_ids_room(self) -> dict[str, set[str]]:
         """Get all channel_ids per room from CCU / Homegear."""
@@ -572,15 +994,7 @@ class JsonRpcAioHttpClient:
             response = await self._post(
                 "Room.getAll",
             )
-            if json_result := response[ATTR_RESULT]:
-                for room in json_result:
-                    if room["id"] not in channel_ids_room:
-                        channel_ids_room[room["id"]] = set()
-                    channel_ids_room[room["id"]].add(room["name"])
-                    for channel_id in room["channelIds"]:
-                        if channel_id not in channel_ids_room:
-                            channel_ids_room[channel_id] = set()
-                        channel_ids_room[channel_id].add(room["name"])
+            channel_ids_room = _get_channel_ids(json_result=response[ATTR_RESULT])
         except BaseHomematicException as hhe:
             _LOGGER.warning(
                 "get_all_channel_ids_per_room failed: %s [%s]", hhe.name, hhe.args
@@ -598,15 +1012,7 @@ class JsonRpcAioHttpClient:
             response = await self._post(
                 "Subsection.getAll",
             )
-            if json_result := response[ATTR_RESULT]:
-                for function in json_result:
-                    if function["id"] not in channel_ids_function:
-                        channel_ids_function[function["id"]] = set()
-                    channel_ids_function[function["id"]].add(function["name"])
-                    for channel_id in function["channelIds"]:
-                        if channel_id not in channel_ids_function:
-                            channel_ids_function[channel_id] = set()
-                        channel_ids_function[channel_id].add(function["name"])
+            channel_ids_function = _get_channel_ids(json_result=response[ATTR_RESULT])
         except BaseHomematicException as hhe:
             _LOGGER.warning(
                 "get_all_channel_ids_per_function failed: %s [%s]", hhe.name, hhe.args
@@ -649,6 +1055,60 @@ class JsonRpcAioHttpClient:
 
         return device_details
 
+    async def get_device_details_rooms_functions(
+        self,
+    ) -> tuple[list[dict[str, Any]], dict[str, set[str]], dict[str, set[str]]]:
+        """
+        Get the device details and the channel_ids per room and function
+        of the backend within one batch.
+        """
+        _LOGGER.debug(
+            "get_device_details_rooms_functions: "
+            "Getting device details, rooms and functions via JSON-RPC"
+        )
+        details_response, room_response, function_response = await self._post_batch(
+            calls=[
+                ("Device.listAllDetail", None),
+                ("Room.getAll", None),
+                ("Subsection.getAll", None),
+            ]
+        )
+        return (
+            _get_batch_result(response=details_response, name="get_device_details")
+            or [],
+            _get_channel_ids(
+                json_result=_get_batch_result(
+                    response=room_response, name="get_all_channel_ids_per_room"
+                )
+            ),
+            _get_channel_ids(
+                json_result=_get_batch_result(
+                    response=function_response,
+                    name="get_all_channel_ids_per_function",
+                )
+            ),
+        )
+
+    async def iter_all_device_data(self) -> AsyncIterator[tuple[str, str, str, Any]]:
+        """
+        Yield (interface, channel_address, parameter, value) of all datapoints
+        of the backend, while the response is read.
+        """
+        _LOGGER.debug("iter_all_device_data: Streaming all device data via JSON-RPC")
+        decoder = DeviceDataDecoder()
+        try:
+            async for text in self._iter_script_output(
+                script_name=REGA_SCRIPT_FETCH_ALL_DEVICE_DATA
+            ):
+                for record in decoder.feed(text):
+                    yield record
+            for record in decoder.close():
+                yield record
+        except ValueError as ver:
+            raise HaHomematicException(
+                f"iter_all_device_data failed: Unable to decode [{ver}]"
+            ) from ver
+
     async def get_all_device_data(self) -> dict[str, dict[str, dict[str, Any]]]:
         """Get the all device data of the backend."""
         all_device_data: dict[str, dict[str, dict[str, Any]]] = {}
@@ -664,6 +1124,42 @@ class JsonRpcAioHttpClient:
 
         return all_device_data
 
+    async def get_backend_time(self) -> int | None:
+        """Get the time of the backend in seconds since the epoch."""
+        _LOGGER.debug("get_backend_time: Getting the backend time via JSON-RPC")
+        try:
+            response = await self._post_script(script_name=REGA_SCRIPT_GET_BACKEND_TIME)
+            return _get_backend_timestamp(json_result=response[ATTR_RESULT])
+        except BaseHomematicException as hhe:
+            _LOGGER.warning("get_backend_time failed: %s [%s]", hhe.name, hhe.args)
+        return None
+
+    async def get_device_data_since(
+        self, since: int
+    ) -> tuple[int, list[tuple[str, str, str, Any]]] | None:
+        """
+        Get (interface, channel_address, parameter, value) of the datapoints,
+        that changed since the backend time, and the current backend time.
+        """
+        _LOGGER.debug(
+            "get_device_data_since: Getting device data since %i via JSON-RPC", since
+        )
+        try:
+            response = await self._post_script(
+                script_name=REGA_SCRIPT_FETCH_DEVICE_DATA_SINCE,
+                extra_params={"since": str(since)},
+            )
+            if json_result := response[ATTR_RESULT]:
+                data: list[list[Any]] = json_result["data"]
+                return int(json_result["now"]), [
+                    (*split_datapoint_name(name=name), value) for name, value in data
+                ]
+        except BaseHomematicException as hhe:
+            _LOGGER.warning(
+                "get_device_data_since failed: %s [%s]", hhe.name, hhe.args
+            )
+        return None
+
     async def get_all_programs(self, include_internal: bool) -> list[ProgramData]:
         """Get the all programs of the backend."""
         all_programs: list[ProgramData] = []
@@ -672,26 +1168,9 @@ class JsonRpcAioHttpClient:
             response = await self._post(
                 method="Program.getAll",
             )
-            if json_result := response[ATTR_RESULT]:
-                for prog in json_result:
-                    is_internal = prog[PROGRAM_ISINTERNAL]
-                    if include_internal is False and is_internal is True:
-                        continue
-                    pid = prog[PROGRAM_ID]
-                    name = prog[PROGRAM_NAME]
-                    is_active = prog[PROGRAM_ISACTIVE]
-                    last_execute_time = prog[PROGRAM_LASTEXECUTETIME]
-
-                    all_programs.append(
-                        ProgramData(
-                            pid=pid,
-                            name=name,
-                            is_active=is_active,
-                            is_internal=is_internal,
-                            last_execute_time=last_execute_time,
-                        )
-                    )
-
+            all_programs = _get_programs(
+                json_result=response[ATTR_RESULT], include_internal=include_internal
+            )
         except BaseHomematicException as hhe:
             _LOGGER.warning("get_all_programs failed: %s [%s]", hhe.name, hhe.args)
 
@@ -725,6 +1204,235 @@ def _get_params(
     return params
 
 
+def _get_backend_timestamp(json_result: Any) -> int | None:
+    """Return the backend time of a get_backend_time.fn result."""
+    if json_result:
+        return int(json_result["now"])
+    return None
+
+
+def _get_batch_result(
+    response: dict[str, Any] | Any, name: str, is_script: bool = False
+) -> Any:
+    """Return the result of a batch response or None, if the call failed."""
+    try:
+        if is_script:
+            response = _get_script_response(response=response)
+        elif (error := response[ATTR_ERROR]) is not None:
+            raise HaHomematicException(f"post: error: {error}")
+        return response[ATTR_RESULT]
+    except (BaseHomematicException, ValueError) as err:
+        _LOGGER.warning("%s failed: %s", name, err.args)
+    return None
+
+
+def _get_channel_ids(json_result: Any) -> dict[str, set[str]]:
+    """Return the names of rooms / functions by their id and their channel_ids."""
+    channel_ids: dict[str, set[str]] = {}
+    for item in json_result or []:
+        if item["id"] not in channel_ids:
+            channel_ids[item["id"]] = set()
+        channel_ids[item["id"]].add(item["name"])
+        for channel_id in item["channelIds"]:
+            if channel_id not in channel_ids:
+                channel_ids[channel_id] = set()
+            channel_ids[channel_id].add(item["name"])
+    return channel_ids
+
+
+def _get_ext_markers(json_result: Any) -> dict[str, Any]:
+    """Return the ext markers by sysvar id."""
+    ext_markers: dict[str, Any] = {}
+    for data in json_result or []:
+        ext_markers[data[SYSVAR_ID]] = data[SYSVAR_HASEXTMARKER]
+    return ext_markers
+
+
+def _get_sysvar_ids(sysvars: list[dict[str, Any]]) -> frozenset[str]:
+    """Return the ids of the sysvars of a SysVar.getAll result."""
+    return frozenset(var[SYSVAR_ID] for var in sysvars)
+
+
+def _get_programs(json_result: Any, include_internal: bool) -> list[ProgramData]:
+    """Return the programs of a Program.getAll result."""
+    all_programs: list[ProgramData] = []
+    for prog in json_result or []:
+        is_internal = prog[PROGRAM_ISINTERNAL]
+        if include_internal is False and is_internal is True:
+            continue
+        pid = prog[PROGRAM_ID]
+        name = prog[PROGRAM_NAME]
+        is_active = prog[PROGRAM_ISACTIVE]
+        last_execute_time = prog[PROGRAM_LASTEXECUTETIME]
+
+        all_programs.append(
+            ProgramData(
+                pid=pid,
+                name=name,
+                is_active=is_active,
+                is_internal=is_internal,
+                last_execute_time=last_execute_time,
+            )
+        )
+    return all_programs
+
+
+def _get_system_variables(
+    json_result: Any, ext_markers: dict[str, Any], include_internal: bool
+) -> list[SystemVariableData]:
+    """Return the system variables of a SysVar.getAll result."""
+    variables: list[SystemVariableData] = []
+    for var in json_result or []:
+        is_internal = var[SYSVAR_ISINTERNAL]
+        if include_internal is False and is_internal is True:
+            continue
+        var_id = var[SYSVAR_ID]
+        name = var[SYSVAR_NAME]
+        org_data_type = var[SYSVAR_TYPE]
+        raw_value = var[SYSVAR_VALUE]
+        if org_data_type == SYSVAR_TYPE_NUMBER:
+            data_type = (
+                SYSVAR_HM_TYPE_FLOAT if "." in raw_value else SYSVAR_HM_TYPE_INTEGER
+            )
+        else:
+            data_type = org_data_type
+        extended_sysvar = ext_markers.get(var_id, False)
+        unit = var[SYSVAR_UNIT]
+        value_list: list[str] | None = None
+        if val_list := var.get(SYSVAR_VALUE_LIST):
+            value_list = val_list.split(";")
+        try:
+            value = parse_sys_var(data_type=data_type, raw_value=raw_value)
+            max_value = None
+            if raw_max_value := var.get(SYSVAR_MAX_VALUE):
+                max_value = parse_sys_var(data_type=data_type, raw_value=raw_max_value)
+            min_value = None
+            if raw_min_value := var.get(SYSVAR_MIN_VALUE):
+                min_value = parse_sys_var(data_type=data_type, raw_value=raw_min_value)
+            variables.append(
+                SystemVariableData(
+                    name=name,
+                    data_type=data_type,
+                    unit=unit,
+                    value=value,
+                    value_list=value_list,
+                    max_value=max_value,
+                    min_value=min_value,
+                    extended_sysvar=extended_sysvar,
+                    vid=var_id,
+                )
+            )
+        except ValueError as verr:
+            _LOGGER.error(
+                "get_all_system_variables failed: "
+                "ValueError [%s] Failed to parse SysVar %s ",
+                verr.args,
+                name,
+            )
+    return variables
+
+
+def _get_rega_literal(value: Any) -> str:
+    """Return the literal of a value in a ReGa script. Raise, if not possible."""
+    if isinstance(value, bool):
+        return str(value).lower()
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float) and math.isfinite(value):
+        return f"{value:f}"
+    if isinstance(value, str) and not _UNSAFE_REGA_TEXT.search(value):
+        return f'"{value}"'
+    raise ClientException(f"Value ({value}) can not be written by a script.")
+
+
+def _join_rega_ids(ids: set[str]) -> str:
+    """Return the ids separated and enclosed by the separator for a ReGa script."""
+    joined_ids = _REGA_ID_SEPARATOR.join(sorted(ids))
+    return f"{_REGA_ID_SEPARATOR}{joined_ids}{_REGA_ID_SEPARATOR}"
+
+
+def _get_hub_data_delta(
+    json_result: dict[str, Any],
+    include_internal_sysvars: bool,
+    include_internal_programs: bool,
+) -> HubDataDelta:
+    """Return the changes of the result of fetch_hub_data_since.fn."""
+    sysvars: list[dict[str, Any]] = []
+    for var in json_result["sysvars"]:
+        for key in (SYSVAR_NAME, SYSVAR_VALUE, SYSVAR_UNIT, SYSVAR_VALUE_LIST):
+            var[key] = unquote(var[key], encoding=_REGA_ENCODING)
+        if var[SYSVAR_TYPE] != SYSVAR_TYPE_NUMBER:
+            # like SysVar.getAll, only numbers have limits
+            del var[SYSVAR_MIN_VALUE], var[SYSVAR_MAX_VALUE]
+        elif "." not in var[SYSVAR_VALUE]:
+            # the limits of integers are written as floats
+            for key in (SYSVAR_MIN_VALUE, SYSVAR_MAX_VALUE):
+                var[key] = str(int(float(var[key])))
+        sysvars.append(var)
+    for prog in json_result["programs"]:
+        prog[PROGRAM_NAME] = unquote(prog[PROGRAM_NAME], encoding=_REGA_ENCODING)
+    return HubDataDelta(
+        backend_timestamp=int(json_result["now"]),
+        variables=_get_system_variables(
+            json_result=sysvars,
+            ext_markers={var[SYSVAR_ID]: var[SYSVAR_HASEXTMARKER] for var in sysvars},
+            include_internal=include_internal_sysvars,
+        ),
+        programs=_get_programs(
+            json_result=json_result["programs"],
+            include_internal=include_internal_programs,
+        ),
+        deleted_sysvar_ids=json_result["deletedSysvarIds"],
+        deleted_program_ids=json_result["deletedProgramIds"],
+    )
+
+
+def _get_batch_responses(
+    result: dict[str, Any] | Any, count: int
+) -> list[dict[str, Any]] | None:
+    """Return the responses of a batch by id or None, if it was not answered."""
+    if not isinstance(result, list) or len(result) != count:
+        return None
+    responses: dict[Any, dict[str, Any]] = {
+        response.get("id"): response
+        for response in result
+        if isinstance(response, dict)
+    }
+    if set(responses) != set(range(count)):
+        return None
+    return [responses[call_id] for call_id in range(count)]
+
+
+def _get_script_response(response: dict[str, Any] | Any) -> dict[str, Any] | Any:
+    """Decode the result of a script. Raise, if the script failed."""
+    if not response[ATTR_ERROR]:
+        response[ATTR_RESULT] = serializer.loads(response[ATTR_RESULT])
+    if (error := response["error"]) is not None:
+        raise HaHomematicException(f"_post_script: error: {error}")
+    return response
+
+
+def _is_failed(result: dict[str, Any] | Any) -> bool:
+    """Return, if a request got no result or an error."""
+    return result is None or (
+        isinstance(result, dict) and result.get(ATTR_ERROR) is not None
+    )
+
+
+def _is_transport_error(result: dict[str, Any] | Any) -> bool:
+    """Return if the request did not reach the backend."""
+    return isinstance(result, dict) and isinstance(result.get(ATTR_ERROR), str)
+
+
+def _is_session_expired(response: dict[str, Any] | Any) -> bool:
+    """Return if the CCU rejected the request because of an invalid session."""
+    if not isinstance(response, dict):
+        return False
+    if isinstance(error := response.get(ATTR_ERROR), dict):
+        return str(error.get("message", "")).startswith("access denied")
+    return False
+
+
 def _convert_to_values_cache(
     all_device_data: dict[str, Any]
 ) -> dict[str, dict[str, dict[str, Any]]]:
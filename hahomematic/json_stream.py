@@ -0,0 +1,190 @@
+"""
+JSON stream module.
+Incremental decoders for large JSON-RPC responses, that are fed with the
+chunks of the response body while it is read.
+"""
+from __future__ import annotations
+
+import codecs
+import logging
+import re
+from typing import Any, Final
+
+from hahomematic import serializer
+
+_LOGGER = logging.getLogger(__name__)
+
+# Start of the string value of result in a JSON-RPC response.
+_RESULT_STRING_START: Final = re.compile(r'"result"\s*:\s*"')
+# Length of a \uXXXX escape.
+_UNICODE_ESCAPE_LENGTH: Final = 6
+
+
+class JsonRpcResultDecoder:
+    """
+    Incremental decoder of a JSON-RPC response, whose result is a string
+    (e.g. the output of ReGa.runScript). feed returns the decoded text
+    of the result string as it arrives. close returns the response
+    without the result text, to check for errors.
+    """
+
+    def __init__(self) -> None:
+        """Init the result decoder."""
+        self._text_decoder: Final = codecs.getincrementaldecoder("utf-8")()
+        self._envelope: str = ""
+        self._buffer: str = ""
+        self._in_result: bool = False
+        self._result_done: bool = False
+
+    def feed(self, chunk: bytes) -> str:
+        """Feed a chunk of the response body. Return the decoded result text."""
+        return self._decode(self._text_decoder.decode(chunk))
+
+    def close(self) -> dict[str, Any]:
+        """Return the response. The text of a result string is replaced by ''."""
+        if rest := self._text_decoder.decode(b"", final=True):
+            self._decode(rest)
+        if self._in_result:
+            raise ValueError("Unterminated result string")
+        response: dict[str, Any] = serializer.loads(self._envelope)
+        return response
+
+    def _decode(self, text: str) -> str:
+        """Decode text of the response."""
+        if self._in_result:
+            self._buffer += text
+            return self._decode_result()
+        self._envelope += text
+        if self._result_done or not (
+            match := _RESULT_STRING_START.search(self._envelope)
+        ):
+            return ""
+        self._buffer = self._envelope[match.end() :]
+        self._envelope = self._envelope[: match.end()]
+        self._in_result = True
+        return self._decode_result()
+
+    def _decode_result(self) -> str:
+        """Decode the buffered part of the result string."""
+        buffer = self._buffer
+        if (end := _find_string_end(buffer)) is not None:
+            self._in_result = False
+            self._result_done = True
+            self._buffer = ""
+            self._envelope += buffer[end:]
+            return _unescape(buffer[:end])
+        cut = _find_safe_cut(buffer)
+        self._buffer = buffer[cut:]
+        return _unescape(buffer[:cut])
+
+
+class DeviceDataDecoder:
+    """
+    Incremental decoder of the output of fetch_all_device_data.fn.
+    The script writes a JSON object with a line per datapoint:
+    {"<interface>.<channel_address>.<parameter>":<value>,
+    The keys are URL encoded.
+    """
+
+    def __init__(self) -> None:
+        """Init the device data decoder."""
+        self._buffer: str = ""
+        self._started: bool = False
+
+    def feed(self, text: str) -> list[tuple[str, str, str, Any]]:
+        """
+        Feed the script output.
+        Return (interface, channel_address, parameter, value) of complete lines.
+        """
+        self._buffer += text
+        if (end := self._buffer.rfind("\n")) == -1:
+            return []
+        lines = self._buffer[:end]
+        self._buffer = self._buffer[end + 1 :]
+        return self._decode_lines(lines)
+
+    def close(self) -> list[tuple[str, str, str, Any]]:
+        """Return the records of the last line."""
+        lines = self._buffer.rstrip()
+        self._buffer = ""
+        if not lines.endswith("}"):
+            raise ValueError("Incomplete device data")
+        return self._decode_lines(lines[:-1])
+
+    def _decode_lines(self, lines: str) -> list[tuple[str, str, str, Any]]:
+        """Decode lines with datapoints."""
+        if not self._started:
+            lines = lines.lstrip()
+            if not lines.startswith("{"):
+                raise ValueError("Device data is not a JSON object")
+            lines = lines[1:]
+            self._started = True
+        if not (lines := lines.strip().rstrip(",")):
+            return []
+        records: list[tuple[str, str, str, Any]] = []
+        for name, value in serializer.loads(f"{{{lines}}}").items():
+            records.append((*split_datapoint_name(name=name), value))
+        return records
+
+
+def split_datapoint_name(name: str) -> tuple[str, str, str]:
+    """Return interface, channel_address and parameter of a WriteURL datapoint name."""
+    interface, channel_address, parameter = name.replace("%3A", ":").split(".")[:3]
+    return interface, channel_address, parameter
+
+
+def _find_string_end(text: str) -> int | None:
+    """Return the position of the first unescaped quote."""
+    pos = text.find('"')
+    while pos != -1:
+        if _count_backslashes(text, pos) % 2 == 0:
+            return pos
+        pos = text.find('"', pos + 1)
+    return None
+
+
+def _find_safe_cut(text: str) -> int:
+    """Return the position before an incomplete escape at the end of text."""
+    length = len(text)
+    if (
+        pos := text.rfind("\\", max(0, length - _UNICODE_ESCAPE_LENGTH))
+    ) == -1 or _count_backslashes(text, pos + 1) % 2 == 0:
+        return length
+    # the backslash at pos starts an escape
+    if (kind := text[pos + 1 : pos + 2]) not in ("", "u"):
+        return length
+    if (
+        kind == "u"
+        and pos + _UNICODE_ESCAPE_LENGTH <= length
+        and not _is_high_surrogate(text[pos:])
+    ):
+        return length
+    # A high surrogate is decoded together with the following low surrogate.
+    if (
+        (start := pos - _UNICODE_ESCAPE_LENGTH) >= 0
+        and _is_high_surrogate(text[start:pos])
+        and _count_backslashes(text, start + 1) % 2 == 1
+    ):
+        return start
+    return pos
+
+
+def _is_high_surrogate(escape: str) -> bool:
+    """Return if the text starts with the escape of a high surrogate."""
+    return escape[:2] == "\\u" and "d800" <= escape[2:6].lower() <= "dbff"
+
+
+def _count_backslashes(text: str, pos: int) -> int:
+    """Return the number of backslashes directly before pos."""
+    count = 0
+    while pos > count and text[pos - count - 1] == "\\":
+        count += 1
+    return count
+
+
+def _unescape(text: str) -> str:
+    """Decode the escapes of a part of a JSON string."""
+    if "\\" not in text:
+        return text
+    result: str = serializer.loads(f'"{text}"')
+    return result
@@ -0,0 +1,120 @@
+"""
+RPC metrics module.
+Call counts, error counts, byte sizes and latency histograms
+of the XML-RPC and JSON-RPC calls by method.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass, field, replace
+import logging
+import threading
+from typing import Any, Final
+
+from hahomematic import config
+
+_LOGGER = logging.getLogger(__name__)
+
+JSON_RPC: Final = "JSON-RPC"
+
+# Upper bounds in seconds of the latency histogram buckets.
+# The last bucket counts the calls above the last bound.
+LATENCY_BUCKETS: Final[tuple[float, ...]] = (
+    0.01,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+# Keys of params, that must not be logged.
+_SECRET_KEYS: Final = frozenset({"_session_id_", "password", "username"})
+_MAX_LOGGED_ARGS_LENGTH: Final = 200
+
+
+@dataclass
+class MethodMetrics:
+    """Metrics of a RPC method."""
+
+    calls: int = 0
+    errors: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+    histogram: list[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1)
+    )
+
+    @property
+    def mean_latency(self) -> float:
+        """Return the mean latency in seconds."""
+        return self.total_latency / self.calls if self.calls else 0.0
+
+
+class RpcMetrics:
+    """
+    Metrics of the RPC calls of an interface or the JSON-RPC client.
+    Calls above config.RPC_SLOW_CALL_THRESHOLD seconds are logged
+    with their (masked) arguments.
+    Can be used from the proxy threads.
+    """
+
+    def __init__(self, name: str):
+        """Init the rpc metrics."""
+        self.name: Final = name
+        self._lock: Final = threading.Lock()
+        self._methods: Final[dict[str, MethodMetrics]] = {}
+
+    def record(
+        self,
+        method: str,
+        latency: float,
+        args: Any = None,
+        error: bool = False,
+        bytes_sent: int = 0,
+        bytes_received: int = 0,
+    ) -> None:
+        """Record a call."""
+        with self._lock:
+            if (metrics := self._methods.get(method)) is None:
+                metrics = self._methods[method] = MethodMetrics()
+            metrics.calls += 1
+            if error:
+                metrics.errors += 1
+            metrics.bytes_sent += bytes_sent
+            metrics.bytes_received += bytes_received
+            metrics.total_latency += latency
+            metrics.max_latency = max(metrics.max_latency, latency)
+            metrics.histogram[bisect_left(LATENCY_BUCKETS, latency)] += 1
+        if latency >= config.RPC_SLOW_CALL_THRESHOLD:
+            _LOGGER.warning(
+                "Slow call: %s took %.2fs on %s. Args: %s",
+                method,
+                latency,
+                self.name,
+                _format_args(args),
+            )
+
+    def snapshot(self) -> dict[str, MethodMetrics]:
+        """Return a copy of the metrics by method."""
+        with self._lock:
+            return {
+                method: replace(metrics, histogram=list(metrics.histogram))
+                for method, metrics in self._methods.items()
+            }
+
+
+def _format_args(args: Any) -> str:
+    """Return the args for the log without secrets."""
+    if isinstance(args, dict):
+        args = {
+            key: "***" if key in _SECRET_KEYS else value for key, value in args.items()
+        }
+    text = repr(args)
+    if len(text) > _MAX_LOGGED_ARGS_LENGTH:
+        return f"{text[:_MAX_LOGGED_ARGS_LENGTH]}..."
+    return text
@@ -0,0 +1,72 @@
+"""
+Send debouncer module.
+Last write wins for rapid streams of values of one entity
+(e.g. a slider, that is dragged).
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import logging
+import time
+from typing import Any, Final
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SendDebouncer:
+    """
+    Send the values of an entity with a minimum spacing of window seconds.
+    A value is sent immediately, if no value has been sent within the window.
+    Otherwise it becomes the pending value and replaces an older pending
+    value. Only the newest value is sent next.
+    Callers wait until their value or a superseding value has been sent.
+    """
+
+    def __init__(self, window: float, send: Callable[[Any], Awaitable[None]]):
+        """Init the send debouncer."""
+        self._window: Final = window
+        self._send: Final = send
+        self._pending_value: Any = None
+        self._pending_waiters: list[asyncio.Future] = []
+        self._sent_at: float = 0.0
+        self._worker: asyncio.Task | None = None
+        self.superseded: int = 0
+
+    @property
+    def window(self) -> float:
+        """Return the window in seconds."""
+        return self._window
+
+    async def send(self, value: Any) -> None:
+        """Send the value or let it supersede the pending value."""
+        loop = asyncio.get_running_loop()
+        waiter: asyncio.Future = loop.create_future()
+        if self._pending_waiters:
+            self.superseded += 1
+        self._pending_value = value
+        self._pending_waiters.append(waiter)
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._run())
+        await waiter
+
+    async def _run(self) -> None:
+        """Send the pending values."""
+        while self._pending_waiters:
+            if (delay := self._sent_at + self._window - time.monotonic()) > 0:
+                await asyncio.sleep(delay)
+            value, waiters = self._pending_value, self._pending_waiters
+            self._pending_value = None
+            self._pending_waiters = []
+            self._sent_at = time.monotonic()
+            try:
+                await self._send(value)
+            except Exception as ex:  # pylint: disable=broad-except
+                _LOGGER.debug("run: Unable to send value %s: %s", value, ex.args)
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_exception(ex)
+                continue
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(None)
@@ -0,0 +1,183 @@
+"""
+Serializer module.
+JSON encoding and decoding of the caches, exports and JSON-RPC payloads.
+Uses orjson or msgspec, if installed, and the stdlib json otherwise.
+The caches can also be stored in a binary format based on marshal.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+import importlib
+import json
+import logging
+import marshal
+import sys
+from typing import Any, Final
+
+_LOGGER = logging.getLogger(__name__)
+
+BACKEND_JSON: Final = "json"
+BACKEND_MSGSPEC: Final = "msgspec"
+BACKEND_ORJSON: Final = "orjson"
+
+# Raised by loads for invalid JSON with all backends.
+JSONDecodeError: Final = json.JSONDecodeError
+
+# Header of binary files. The marshal format depends on the Python version,
+# so files of other versions are rejected by the header.
+_BINARY_MAGIC: Final = b"HAHMCACHE"
+_BINARY_FORMAT_VERSION: Final = 1
+_BINARY_HEADER: Final = _BINARY_MAGIC + bytes(
+    (
+        _BINARY_FORMAT_VERSION,
+        marshal.version,
+        sys.version_info.major,
+        sys.version_info.minor,
+    )
+)
+
+
+class BinaryDecodeError(ValueError):
+    """Raised by load_binary_file for invalid or incompatible files."""
+
+
+@dataclass(frozen=True)
+class JsonBackend:
+    """Encode and decode functions of a JSON library."""
+
+    name: str
+    # dumps(obj, indent) returns UTF-8 encoded JSON.
+    dumps: Callable[[Any, bool], bytes]
+    loads: Callable[[bytes | str], Any]
+
+
+def _get_json_backend() -> JsonBackend:
+    """Return the backend of the stdlib json."""
+
+    def _dumps(obj: Any, indent: bool) -> bytes:
+        return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+    return JsonBackend(name=BACKEND_JSON, dumps=_dumps, loads=json.loads)
+
+
+def _get_orjson_backend() -> JsonBackend:
+    """Return the backend of orjson."""
+    orjson = importlib.import_module(BACKEND_ORJSON)
+    option: Final[int] = orjson.OPT_NON_STR_KEYS
+    option_indent: Final[int] = option | orjson.OPT_INDENT_2
+
+    def _dumps(obj: Any, indent: bool) -> bytes:
+        result: bytes = orjson.dumps(obj, option=option_indent if indent else option)
+        return result
+
+    return JsonBackend(name=BACKEND_ORJSON, dumps=_dumps, loads=orjson.loads)
+
+
+def _get_msgspec_backend() -> JsonBackend:
+    """Return the backend of msgspec."""
+    msgspec = importlib.import_module(BACKEND_MSGSPEC)
+    encoder: Final = msgspec.json.Encoder()
+    decoder: Final = msgspec.json.Decoder()
+
+    def _dumps(obj: Any, indent: bool) -> bytes:
+        result: bytes = encoder.encode(obj)
+        if indent:
+            result = msgspec.json.format(result, indent=2)
+        return result
+
+    def _loads(data: bytes | str) -> Any:
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError as der:
+            raise JSONDecodeError(str(der), "", 0) from der
+
+    return JsonBackend(name=BACKEND_MSGSPEC, dumps=_dumps, loads=_loads)
+
+
+def _get_available_backends() -> dict[str, JsonBackend]:
+    """Return the available backends in order of preference."""
+    backends: dict[str, JsonBackend] = {}
+    for get_backend in (_get_orjson_backend, _get_msgspec_backend):
+        try:
+            backend = get_backend()
+        except ImportError:
+            continue
+        backends[backend.name] = backend
+    backends[BACKEND_JSON] = _get_json_backend()
+    return backends
+
+
+AVAILABLE_BACKENDS: Final[dict[str, JsonBackend]] = _get_available_backends()
+_backend: JsonBackend = next(iter(AVAILABLE_BACKENDS.values()))
+_LOGGER.debug("Using %s for JSON", _backend.name)
+
+
+def get_backend() -> str:
+    """Return the name of the used backend."""
+    return _backend.name
+
+
+def set_backend(name: str) -> None:
+    """Use an available backend."""
+    global _backend  # pylint: disable=global-statement
+    if (backend := AVAILABLE_BACKENDS.get(name)) is None:
+        raise ValueError(f"JSON backend {name} is not available")
+    _backend = backend
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Return obj as UTF-8 encoded JSON."""
+    return _backend.dumps(obj, indent)
+
+
+def loads(data: bytes | str) -> Any:
+    """Return the object of the JSON. Raise JSONDecodeError, if invalid."""
+    return _backend.loads(data)
+
+
+def dump_file(obj: Any, file_path: str, indent: bool = False) -> None:
+    """Save obj as JSON file."""
+    with open(file=file_path, mode="wb") as fptr:
+        fptr.write(dumps(obj, indent=indent))
+
+
+def load_file(file_path: str) -> Any:
+    """Return the object of a JSON file."""
+    with open(file=file_path, mode="rb") as fptr:
+        return loads(fptr.read())
+
+
+def dump_binary_file(obj: Any, file_path: str) -> None:
+    """
+    Save obj in the binary format.
+    Equal strings are interned, so marshal writes them only once.
+    """
+    with open(file=file_path, mode="wb") as fptr:
+        fptr.write(_BINARY_HEADER)
+        marshal.dump(_intern_strings(obj), fptr)
+
+
+def load_binary_file(file_path: str) -> Any:
+    """Return the object of a binary file. Raise BinaryDecodeError, if invalid."""
+    with open(file=file_path, mode="rb") as fptr:
+        data = fptr.read()
+    if not data.startswith(_BINARY_HEADER):
+        raise BinaryDecodeError(f"Incompatible header of binary file {file_path}")
+    try:
+        return marshal.loads(memoryview(data)[len(_BINARY_HEADER) :])
+    except (EOFError, TypeError, ValueError) as err:
+        raise BinaryDecodeError(f"Invalid binary file {file_path}") from err
+
+
+def _intern_strings(obj: Any) -> Any:
+    """Return a copy of dicts and lists with interned strings."""
+    if isinstance(obj, str):
+        return sys.intern(obj)
+    if isinstance(obj, dict):
+        return {
+            _intern_strings(key): _intern_strings(value) for key, value in obj.items()
+        }
+    if isinstance(obj, (list, tuple)):
+        return [_intern_strings(item) for item in obj]
+    return obj
@@ -0,0 +1,61 @@
+"""
+Single flight module.
+Concurrent identical reads share one backend call and one result.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from functools import partial
+import logging
+from typing import Any, Final
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class SingleFlightStatistics:
+    """Counters of the single flight."""
+
+    calls: int = 0
+    deduplicated: int = 0
+
+
+class SingleFlight:
+    """
+    Execute calls by key, so that only one call per key is in flight.
+    Callers of a key, that is already in flight, wait for the result
+    (or the exception) of the running call instead of executing their own.
+    The cancellation of a caller does not cancel the shared call.
+    """
+
+    def __init__(self) -> None:
+        """Init the single flight."""
+        self._in_flight: Final[dict[Hashable, asyncio.Task]] = {}
+        self.statistics: Final[SingleFlightStatistics] = SingleFlightStatistics()
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of calls in flight."""
+        return len(self._in_flight)
+
+    async def run(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the result of func, shared with concurrent callers of key."""
+        if (task := self._in_flight.get(key)) is None:
+            self.statistics.calls += 1
+            task = asyncio.ensure_future(func())
+            self._in_flight[key] = task
+            task.add_done_callback(partial(self._remove, key))
+        else:
+            self.statistics.deduplicated += 1
+            _LOGGER.debug("run: Sharing call in flight for %s", key)
+        return await asyncio.shield(task)
+
+    def _remove(self, key: Hashable, task: asyncio.Task) -> None:
+        """Remove a finished call."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # Retrieve the exception, in case all callers have been cancelled.
+            task.exception()
@@ -2,16 +2,15 @@
 from __future__ import annotations
 
 from copy import copy
-import json
 import logging
 import os
 import random
 from typing import Any, Final
 
+from hahomematic import serializer
 import hahomematic.central_unit as hmcu
 import hahomematic.client as hmcl
 from hahomematic.const import (
-    DEFAULT_ENCODING,
     HM_ADDRESS,
     HM_CHILDREN,
     HM_PARENT,
@@ -105,12 +104,9 @@ class DeviceExporter:
         def _save() -> HmDataOperationResult:
             if not check_or_create_directory(file_dir):
                 return HmDataOperationResult.NO_SAVE
-            with open(
-                file=os.path.join(file_dir, filename),
-                mode="w",
-                encoding=DEFAULT_ENCODING,
-            ) as fptr:
-                json.dump(data, fptr, indent=2)
+            serializer.dump_file(
+                data, file_path=os.path.join(file_dir, filename), indent=True
+            )
             return HmDataOperationResult.SAVE_SUCCESS
 
         return await self._central.async_add_executor_job(_save)
@@ -0,0 +1,100 @@
+"""
+Write batch module.
+Collects the VALUES writes of a command (e.g. RAMP_TIME, ON_TIME and LEVEL
+of a light) and sends the writes of a channel as one putParamset.
+"""
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+import logging
+from typing import Any, Final
+
+import hahomematic.client as hmcl
+from hahomematic.const import PARAMSET_KEY_VALUES
+
+_LOGGER = logging.getLogger(__name__)
+
+_CURRENT_WRITE_BATCH: Final[ContextVar[WriteBatch | None]] = ContextVar(
+    "write_batch", default=None
+)
+
+
+class WriteBatch:
+    """
+    Writes to the VALUES paramset, collected in the order of the calls.
+    The writes of a channel are sent as one putParamset.
+    If a parameter is written more than once, the order of the writes
+    matters and the writes of the channel are sent as single setValue.
+    """
+
+    def __init__(self) -> None:
+        """Init the write batch."""
+        # (interface_id, channel_address): (client, [(parameter, value)])
+        self._channels: Final[
+            dict[tuple[str, str], tuple[hmcl.Client, list[tuple[str, Any]]]]
+        ] = {}
+
+    @property
+    def size(self) -> int:
+        """Return the number of collected writes."""
+        return sum(len(writes) for _, writes in self._channels.values())
+
+    def add(
+        self, client: hmcl.Client, channel_address: str, parameter: str, value: Any
+    ) -> None:
+        """Add a write to the batch."""
+        key = (client.interface_id, channel_address)
+        if (channel := self._channels.get(key)) is None:
+            channel = self._channels[key] = (client, [])
+        channel[1].append((parameter, value))
+
+    async def send(self) -> None:
+        """Send the collected writes by channel."""
+        for (_, channel_address), (client, writes) in self._channels.items():
+            parameters = [parameter for parameter, _ in writes]
+            if len(writes) > 1 and len(set(parameters)) == len(parameters):
+                _LOGGER.debug(
+                    "send: Sending %s to %s by putParamset",
+                    parameters,
+                    channel_address,
+                )
+                await client.put_paramset(
+                    address=channel_address,
+                    paramset_key=PARAMSET_KEY_VALUES,
+                    value=dict(writes),
+                )
+                continue
+            for parameter, value in writes:
+                await client.set_value(
+                    channel_address=channel_address,
+                    paramset_key=PARAMSET_KEY_VALUES,
+                    parameter=parameter,
+                    value=value,
+                )
+        self._channels.clear()
+
+
+def get_write_batch() -> WriteBatch | None:
+    """Return the write batch of the current context."""
+    return _CURRENT_WRITE_BATCH.get()
+
+
+@asynccontextmanager
+async def write_batch() -> AsyncIterator[WriteBatch]:
+    """
+    Collect the VALUES writes within the context and send them on exit.
+    A nested context joins the outer batch.
+    Nothing is sent, if the context is left by an exception.
+    """
+    if (batch := _CURRENT_WRITE_BATCH.get()) is not None:
+        yield batch
+        return
+    batch = WriteBatch()
+    token = _CURRENT_WRITE_BATCH.set(batch)
+    try:
+        yield batch
+    finally:
+        _CURRENT_WRITE_BATCH.reset(token)
+    await batch.send()
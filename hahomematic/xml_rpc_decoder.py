@@ -0,0 +1,114 @@
+"""
+Decoder module.
+Provides a fast path decoder for the XML-RPC requests,
+that are sent by the CCU or Homegear to the XML-RPC server.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable
+import logging
+from typing import Any, Final
+from xml.etree.ElementTree import Element, ParseError, fromstring
+
+_LOGGER = logging.getLogger(__name__)
+
+# Methods, that are handled by the fast path.
+FAST_PATH_METHODS: Final[tuple[str, ...]] = (
+    "event",
+    "system.multicall",
+    "listDevices",
+    "newDevices",
+    "deleteDevices",
+)
+
+_METHOD_EVENT: Final = "event"
+_METHOD_MULTICALL: Final = "system.multicall"
+_EVENT_PARAM_COUNT: Final = 4
+
+
+class UnsupportedRequest(Exception):
+    """Raised if a request cannot be handled by the fast path."""
+
+
+def _to_bool(element: Element) -> bool:
+    """Convert a boolean element."""
+    if (text := element.text) not in ("0", "1"):
+        raise UnsupportedRequest(f"Bad boolean value {text}")
+    return text == "1"
+
+
+_CONVERTERS: Final[dict[str, Callable[[Element], Any]]] = {
+    "string": lambda element: element.text or "",
+    "i4": lambda element: int(element.text or ""),
+    "int": lambda element: int(element.text or ""),
+    "i8": lambda element: int(element.text or ""),
+    "double": lambda element: float(element.text or ""),
+    "boolean": _to_bool,
+    "nil": lambda element: None,
+}
+
+
+def _decode_value(value: Element) -> Any:
+    """Decode a value element. Values without type are strings."""
+    if len(value) == 0:
+        return value.text or ""
+    typed = value[0]
+    if (tag := typed.tag) == "array":
+        if (items := typed.find("data")) is None:
+            raise UnsupportedRequest("Missing array data")
+        return [_decode_value(item) for item in items]
+    if tag == "struct":
+        return {
+            member.findtext("name"): _decode_value(member[1]) for member in typed
+        }
+    if (converter := _CONVERTERS.get(tag)) is None:
+        raise UnsupportedRequest(f"Unsupported type {tag}")
+    return converter(typed)
+
+
+def decode_request(data: bytes) -> tuple[str, tuple[Any, ...]]:
+    """
+    Decode a XML-RPC request into method name and params.
+    The xml tree is built by the C accelerated ElementTree,
+    which is much faster than the callbacks used by xmlrpc.client.
+    Raises UnsupportedRequest if the request is not supported by the fast path.
+    """
+    try:
+        root = fromstring(data)
+        if (method_name := root.findtext("methodName")) is None:
+            raise UnsupportedRequest("Missing methodName")
+        if (params_element := root.find("params")) is None:
+            return method_name, ()
+        params = tuple(_decode_value(param[0]) for param in params_element)
+    except (ParseError, ValueError, IndexError) as ex:
+        raise UnsupportedRequest(ex) from ex
+    return method_name, params
+
+
+def get_events(
+    method_name: str, params: tuple[Any, ...]
+) -> list[tuple[str, str, str, Any]] | None:
+    """
+    Return the events of an event or a multicall request.
+    Returns None if the request contains other calls than events.
+    """
+    if method_name == _METHOD_EVENT:
+        if len(params) != _EVENT_PARAM_COUNT:
+            return None
+        return [(params[0], params[1], params[2], params[3])]
+    if method_name == _METHOD_MULTICALL:
+        if len(params) != 1 or not isinstance(params[0], list):
+            return None
+        events: list[tuple[str, str, str, Any]] = []
+        for call in params[0]:
+            if (
+                not isinstance(call, dict)
+                or call.get("methodName") != _METHOD_EVENT
+                or len(event_params := call.get("params", ())) != _EVENT_PARAM_COUNT
+            ):
+                return None
+            events.append(
+                (event_params[0], event_params[1], event_params[2], event_params[3])
+            )
+        return events
+    return None
@@ -7,12 +7,18 @@ import asyncio
 from collections.abc import Awaitable, Callable
 from concurrent.futures import ThreadPoolExecutor
 import logging
-from typing import Any, Final
+import time
+from typing import Any, Final, Union
 import xmlrpc.client
 
+from aiohttp import ClientError, ClientSession, ClientTimeout
+
+from hahomematic import config
+from hahomematic.circuit_breaker import CircuitBreaker
 from hahomematic.const import ATTR_TLS, ATTR_VERIFY_TLS
 from hahomematic.exceptions import AuthFailure, NoConnection, ProxyException
 from hahomematic.helpers import get_tls_context
+from hahomematic.rpc_metrics import RpcMetrics
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,11 +37,15 @@ class XmlRpcProxy(xmlrpc.client.ServerProxy):
         max_workers: int,
         thread_name_prefix: str,
         *args: Any,
+        metrics: RpcMetrics | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
         **kwargs: Any,
     ) -> None:
         """
         Initialize new proxy for server and get local ip
         """
+        self._metrics: Final[RpcMetrics | None] = metrics
+        self._circuit_breaker: Final[CircuitBreaker | None] = circuit_breaker
         self._loop: Final[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
         self._proxy_executor: Final[ThreadPoolExecutor] = ThreadPoolExecutor(
             max_workers=max_workers, thread_name_prefix=thread_name_prefix
@@ -62,25 +72,54 @@ class XmlRpcProxy(xmlrpc.client.ServerProxy):
         Call method on server side
         """
         _LOGGER.debug("__async_request: %s", args)
+        is_probe = (
+            self._circuit_breaker.check(method=args[0])
+            if self._circuit_breaker
+            else False
+        )
         parent = xmlrpc.client.ServerProxy
+        started = time.monotonic()
+        error = True
         try:
-            return await self._async_add_proxy_executor_job(
+            result = await self._async_add_proxy_executor_job(
                 # pylint: disable=protected-access
                 parent._ServerProxy__request,  # type: ignore[attr-defined]
                 self,
                 *args,
             )
+            error = False
+            if self._circuit_breaker:
+                self._circuit_breaker.record_success()
+            return result
         except OSError as ose:
             _LOGGER.error(ose.args)
+            if self._circuit_breaker:
+                self._circuit_breaker.record_failure()
             raise NoConnection(ose) from ose
         except xmlrpc.client.Fault as fex:
+            if self._circuit_breaker:
+                self._circuit_breaker.record_success()
             raise ProxyException(fex) from fex
         except xmlrpc.client.ProtocolError as per:
             if per.errmsg == "Unauthorized":
+                if self._circuit_breaker:
+                    self._circuit_breaker.record_success()
                 raise AuthFailure(per) from per
+            if self._circuit_breaker:
+                self._circuit_breaker.record_failure()
             raise NoConnection(per) from per
         except Exception as ex:
             raise ProxyException(ex) from ex
+        finally:
+            if is_probe and self._circuit_breaker:
+                self._circuit_breaker.end_probe()
+            if self._metrics:
+                self._metrics.record(
+                    method=args[0],
+                    latency=time.monotonic() - started,
+                    args=args[1],
+                    error=error,
+                )
 
     def __getattr__(self, *args, **kwargs):  # type: ignore[no-untyped-def]
         """
@@ -91,3 +130,140 @@ class XmlRpcProxy(xmlrpc.client.ServerProxy):
     def stop(self) -> None:
         """Stop depending services."""
         self._proxy_executor.shutdown()
+
+
+class AioXmlRpcProxy:
+    """
+    Asyncio XML-RPC proxy based on an aiohttp ClientSession.
+    Connections are kept alive by the connection pool of the session.
+    The number of concurrent requests is limited per proxy.
+    """
+
+    def __init__(
+        self,
+        client_session: ClientSession,
+        uri: str,
+        headers: list[tuple[str, str]] | None = None,
+        max_concurrency: int | None = None,
+        tls: bool = False,
+        verify_tls: bool = True,
+        metrics: RpcMetrics | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+    ) -> None:
+        """Initialize new proxy for server."""
+        self._metrics: Final[RpcMetrics | None] = metrics
+        self._circuit_breaker: Final[CircuitBreaker | None] = circuit_breaker
+        self._client_session: Final[ClientSession] = client_session
+        self._uri: Final[str] = uri
+        self._headers: Final[dict[str, str]] = {
+            "Content-Type": "text/xml",
+            "User-Agent": xmlrpc.client.Transport.user_agent,
+            **dict(headers or []),
+        }
+        self._sema: Final[asyncio.Semaphore] = asyncio.Semaphore(
+            max_concurrency or config.XML_RPC_PROXY_MAX_CONCURRENCY
+        )
+        self._tls_context = get_tls_context(verify_tls) if tls else None
+
+    async def _async_request(self, method_name: str, params: tuple[Any, ...]) -> Any:
+        """
+        Call method on server side
+        """
+        _LOGGER.debug("_async_request: %s", method_name)
+        is_probe = (
+            self._circuit_breaker.check(method=method_name)
+            if self._circuit_breaker
+            else False
+        )
+        started = time.monotonic()
+        error = True
+        data = b""
+        body = b""
+        try:
+            data = xmlrpc.client.dumps(
+                params, method_name, encoding=ATTR_ENCODING_ISO_8859_1
+            ).encode(ATTR_ENCODING_ISO_8859_1, "xmlcharrefreplace")
+            async with self._sema, self._client_session.post(
+                self._uri,
+                data=data,
+                headers=self._headers,
+                ssl=self._tls_context,
+                timeout=ClientTimeout(total=config.TIMEOUT),
+            ) as response:
+                if response.status != 200:
+                    raise xmlrpc.client.ProtocolError(
+                        self._uri,
+                        response.status,
+                        response.reason or "",
+                        dict(response.headers),
+                    )
+                body = await response.read()
+                parser, unmarshaller = xmlrpc.client.getparser()
+                parser.feed(body)
+                parser.close()
+                result = unmarshaller.close()
+                error = False
+                if self._circuit_breaker:
+                    self._circuit_breaker.record_success()
+                return result[0] if len(result) == 1 else result
+        except (OSError, ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.error(err.args)
+            if self._circuit_breaker:
+                self._circuit_breaker.record_failure()
+            raise NoConnection(err) from err
+        except xmlrpc.client.Fault as fex:
+            if self._circuit_breaker:
+                self._circuit_breaker.record_success()
+            raise ProxyException(fex) from fex
+        except xmlrpc.client.ProtocolError as per:
+            if per.errmsg == "Unauthorized":
+                if self._circuit_breaker:
+                    self._circuit_breaker.record_success()
+                raise AuthFailure(per) from per
+            if self._circuit_breaker:
+                self._circuit_breaker.record_failure()
+            raise NoConnection(per) from per
+        except Exception as ex:
+            raise ProxyException(ex) from ex
+        finally:
+            if is_probe and self._circuit_breaker:
+                self._circuit_breaker.end_probe()
+            if self._metrics:
+                self._metrics.record(
+                    method=method_name,
+                    latency=time.monotonic() - started,
+                    args=params,
+                    error=error,
+                    bytes_sent=len(data),
+                    bytes_received=len(body),
+                )
+
+    def __getattr__(self, name: str) -> _AsyncMethod:
+        """
+        Magic method dispatcher
+        """
+        return _AsyncMethod(send=self._async_request, name=name)
+
+    def stop(self) -> None:
+        """Stop depending services. The client session is owned by the central."""
+
+
+class _AsyncMethod:
+    """XML-RPC method, whose call returns the coroutine of the request."""
+
+    def __init__(
+        self, send: Callable[[str, tuple[Any, ...]], Awaitable[Any]], name: str
+    ) -> None:
+        self._send: Final = send
+        self._name: Final = name
+
+    def __getattr__(self, name: str) -> _AsyncMethod:
+        """Return the method of a dotted name (e.g. system.listMethods)."""
+        return _AsyncMethod(send=self._send, name=f"{self._name}.{name}")
+
+    def __call__(self, *args: Any) -> Awaitable[Any]:
+        """Return the coroutine of the request."""
+        return self._send(self._name, args)
+
+
+BaseXmlRpcProxy = Union[XmlRpcProxy, AioXmlRpcProxy]
@@ -7,8 +7,15 @@ from __future__ import annotations
 
 import logging
 import threading
-from typing import Any, Final
-from xmlrpc.server import SimpleXMLRPCRequestHandler, SimpleXMLRPCServer
+from typing import Any, Final, Union, cast
+from xmlrpc.client import Fault, dumps
+from xmlrpc.server import (
+    SimpleXMLRPCDispatcher,
+    SimpleXMLRPCRequestHandler,
+    SimpleXMLRPCServer,
+)
+
+from aiohttp import web
 
 import hahomematic.central_unit as hmcu
 from hahomematic.const import (
@@ -21,6 +28,12 @@ from hahomematic.const import (
 )
 from hahomematic.decorators import callback_system_event
 from hahomematic.helpers import find_free_port
+from hahomematic.xml_rpc_decoder import (
+    FAST_PATH_METHODS,
+    UnsupportedRequest,
+    decode_request,
+    get_events,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,10 +45,10 @@ class RPCFunctions:
     additionally there are some internal functions for hahomematic itself.
     """
 
-    def __init__(self, xml_rpc_server: XmlRpcServer):
+    def __init__(self, xml_rpc_server: BaseXmlRpcServer):
         """Init RPCFunctions."""
         _LOGGER.debug("__init__")
-        self._xml_rpc_server: XmlRpcServer = xml_rpc_server
+        self._xml_rpc_server: BaseXmlRpcServer = xml_rpc_server
 
     def event(
         self, interface_id: str, channel_address: str, parameter: str, value: Any
@@ -43,8 +56,9 @@ class RPCFunctions:
         """
         If a device emits some sort event, we will handle it here.
         """
-        if central := self._xml_rpc_server.get_central(interface_id):
-            central.event(interface_id, channel_address, parameter, value)
+        self._xml_rpc_server.events(
+            interface_id=interface_id, events=[(channel_address, parameter, value)]
+        )
 
     @callback_system_event(HH_EVENT_ERROR)
     def error(self, interface_id: str, error_code: str, msg: str) -> None:
@@ -146,7 +160,96 @@ class RequestHandler(SimpleXMLRPCRequestHandler):
     )
 
 
-class HaHomematicXMLRPCServer(SimpleXMLRPCServer):
+class FastPathXMLRPCDispatcher(SimpleXMLRPCDispatcher):
+    """
+    XML-RPC dispatcher with a fast path for the callbacks of CCU / Homegear.
+    Events, multicalls of events and the device callbacks are decoded
+    by a specialized decoder and passed directly to RPCFunctions.
+    Events of a multicall are passed as one batch per interface to the central.
+    Everything else is handled by the generic dispatcher.
+    """
+
+    _central_registry: CentralRegistryMixin | None = None
+
+    def set_central_registry(self, central_registry: CentralRegistryMixin) -> None:
+        """Set the registry, that receives the batched events."""
+        self._central_registry = central_registry
+
+    def _marshaled_dispatch(  # type: ignore[override]
+        self, data: bytes, dispatch_method: Any = None, path: Any = None
+    ) -> bytes:
+        """Dispatch a XML-RPC request."""
+        if dispatch_method is None and (response := self._fast_dispatch(data)):
+            return response
+        # The generic dispatcher returns the encoded response as bytes.
+        return cast(
+            bytes,
+            super()._marshaled_dispatch(
+                data, dispatch_method=dispatch_method, path=path
+            ),
+        )
+
+    def _fast_dispatch(self, data: bytes) -> bytes | None:
+        """Dispatch a request by the fast path. Return None if not supported."""
+        try:
+            method_name, params = decode_request(data)
+        except UnsupportedRequest as ure:
+            _LOGGER.debug("_fast_dispatch: Using generic dispatcher: %s", ure)
+            return None
+        if method_name not in FAST_PATH_METHODS:
+            return None
+        events = get_events(method_name=method_name, params=params)
+        if events is None and method_name == "system.multicall":
+            return None
+
+        if not isinstance(rpc_functions := self.instance, RPCFunctions):
+            return None
+        response: Any = None
+        try:
+            if events is None:
+                response = getattr(rpc_functions, method_name)(*params)
+            else:
+                if self._central_registry:
+                    self._dispatch_events(self._central_registry, events)
+                else:
+                    for event in events:
+                        rpc_functions.event(*event)
+                if method_name == "system.multicall":
+                    response = [[None]] * len(events)
+            result = dumps(
+                (response,),
+                methodresponse=True,
+                allow_none=self.allow_none,
+                encoding=self.encoding,
+            )
+        except Exception as ex:  # pylint: disable=broad-except
+            result = dumps(
+                Fault(1, f"{type(ex)}:{ex}"),
+                allow_none=self.allow_none,
+                encoding=self.encoding,
+            )
+        return result.encode(self.encoding, "xmlcharrefreplace")
+
+    @staticmethod
+    def _dispatch_events(
+        central_registry: CentralRegistryMixin,
+        events: list[tuple[str, str, str, Any]],
+    ) -> None:
+        """Dispatch the events as batches of consecutive events per interface."""
+        interface_id: str | None = None
+        batch: list[tuple[str, str, Any]] = []
+        for event_interface_id, channel_address, parameter, value in events:
+            if event_interface_id != interface_id:
+                if interface_id is not None:
+                    central_registry.events(interface_id=interface_id, events=batch)
+                interface_id = event_interface_id
+                batch = []
+            batch.append((channel_address, parameter, value))
+        if interface_id is not None:
+            central_registry.events(interface_id=interface_id, events=batch)
+
+
+class HaHomematicXMLRPCServer(FastPathXMLRPCDispatcher, SimpleXMLRPCServer):
     """Simple XML-RPC server.
 
     Simple XML-RPC server that allows functions and a single instance
@@ -167,7 +270,56 @@ class HaHomematicXMLRPCServer(SimpleXMLRPCServer):
         return SimpleXMLRPCServer.system_listMethods(self)
 
 
-class XmlRpcServer(threading.Thread):
+class HaHomematicXMLRPCDispatcher(FastPathXMLRPCDispatcher):
+    """Simple XML-RPC dispatcher.
+
+    Dispatcher used by the asyncio based XML-RPC server.
+    Works like HaHomematicXMLRPCServer, but without a socket server.
+    """
+
+    # pylint: disable=arguments-differ
+    def system_listMethods(self, interface_id: str | None = None) -> list[str]:
+        """system.listMethods() => ['add', 'subtract', 'multiple']
+        Returns a list of the methods supported by the server.
+        Required for HomeMatic CCU usage."""
+        return SimpleXMLRPCDispatcher.system_listMethods(self)
+
+
+class CentralRegistryMixin:
+    """Mixin to register centrals at an XML-RPC server."""
+
+    _centrals: dict[str, hmcu.CentralUnit]
+
+    def register_central(self, central: hmcu.CentralUnit) -> None:
+        """Register a central in the XmlRPC-Server"""
+        if not self._centrals.get(central.name):
+            self._centrals[central.name] = central
+
+    def un_register_central(self, central: hmcu.CentralUnit) -> None:
+        """Unregister a central from XmlRPC-Server"""
+        if self._centrals.get(central.name):
+            del self._centrals[central.name]
+
+    def get_central(self, interface_id: str) -> hmcu.CentralUnit | None:
+        """Return a central by interface_id"""
+        if (client := hmcu.get_client_by_route(interface_id=interface_id)) and (
+            self._centrals.get(client.central.name) is client.central
+        ):
+            return client.central
+        return None
+
+    def events(self, interface_id: str, events: list[tuple[str, str, Any]]) -> None:
+        """Pass a batch of events to the central of the interface."""
+        if central := self.get_central(interface_id):
+            central.events(interface_id=interface_id, events=events)
+
+    @property
+    def no_central_registered(self) -> bool:
+        """Return if no central is registered."""
+        return len(self._centrals) == 0
+
+
+class XmlRpcServer(threading.Thread, CentralRegistryMixin):
     """
     XML-RPC server thread to handle messages from CCU / Homegear.
     """
@@ -201,7 +353,8 @@ class XmlRpcServer(threading.Thread):
         self._simple_xml_rpc_server.register_instance(
             RPCFunctions(self), allow_dotted_names=True
         )
-        self._centrals: Final[dict[str, hmcu.CentralUnit]] = {}
+        self._simple_xml_rpc_server.set_central_registry(self)
+        self._centrals = {}
 
     def __new__(cls, local_port: int) -> XmlRpcServer:
         """Create new XmlRPC server."""
@@ -234,27 +387,87 @@ class XmlRpcServer(threading.Thread):
         """return if thread is active."""
         return self._started.is_set() is True  # type: ignore[attr-defined]
 
-    def register_central(self, central: hmcu.CentralUnit) -> None:
-        """Register a central in the XmlRPC-Server"""
-        if not self._centrals.get(central.name):
-            self._centrals[central.name] = central
 
-    def un_register_central(self, central: hmcu.CentralUnit) -> None:
-        """Unregister a central from XmlRPC-Server"""
-        if self._centrals.get(central.name):
-            del self._centrals[central.name]
+class AsyncXmlRpcServer(CentralRegistryMixin):
+    """
+    Asyncio based XML-RPC server to handle messages from CCU / Homegear.
+    Requests are handled within the event loop of the centrals,
+    so no thread is required. Keep-alive connections of several
+    interfaces are served concurrently.
+    """
 
-    def get_central(self, interface_id: str) -> hmcu.CentralUnit | None:
-        """Return a central by interface_id"""
-        for central in self._centrals.values():
-            if central.has_client(interface_id=interface_id):
-                return central
-        return None
+    _initialized: bool = False
+    _instances: Final[dict[int, AsyncXmlRpcServer]] = {}
+
+    def __init__(
+        self,
+        local_port: int = PORT_ANY,
+    ):
+        """Init async XmlRPC server."""
+        if self._initialized:
+            return
+        self._initialized = True
+        if local_port == PORT_ANY:
+            local_port = find_free_port()
+        self.local_port: int = local_port
+        self._instances[self.local_port] = self
+        self._dispatcher = HaHomematicXMLRPCDispatcher(allow_none=True)
+        _LOGGER.debug("__init__: Register functions")
+        self._dispatcher.register_introspection_functions()
+        self._dispatcher.register_multicall_functions()
+        _LOGGER.debug("__init__: Registering RPC instance")
+        self._dispatcher.register_instance(RPCFunctions(self), allow_dotted_names=True)
+        self._dispatcher.set_central_registry(self)
+        self._app: Final[web.Application] = web.Application()
+        for rpc_path in RequestHandler.rpc_paths:
+            self._app.router.add_post(rpc_path, self._handle_request)
+        self._runner: web.AppRunner | None = None
+        self._centrals = {}
+
+    def __new__(cls, local_port: int) -> AsyncXmlRpcServer:
+        """Create new async XmlRPC server."""
+        if (xml_rpc := cls._instances.get(local_port)) is None:
+            _LOGGER.debug("Creating async XmlRpc server")
+            xml_rpc = super(AsyncXmlRpcServer, cls).__new__(cls)
+        return xml_rpc
+
+    async def start(self) -> None:
+        """Start the async XmlRPC-Server."""
+        _LOGGER.debug(
+            "start: Starting async XmlRPC-Server at http://%s:%i",
+            IP_ANY_V4,
+            self.local_port,
+        )
+        self._runner = web.AppRunner(self._app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(
+            self._runner, host=IP_ANY_V4, port=self.local_port, reuse_address=True
+        ).start()
+
+    async def stop(self) -> None:
+        """Stop the async XmlRPC-Server."""
+        _LOGGER.debug("stop: Shutting down async XmlRPC-Server")
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+        _LOGGER.debug("stop: Async XmlRPC-Server stopped")
+        if self.local_port in self._instances:
+            del self._instances[self.local_port]
 
     @property
-    def no_central_registered(self) -> bool:
-        """Return if no central is registered."""
-        return len(self._centrals) == 0
+    def started(self) -> bool:
+        """Return if the server is listening."""
+        return self._runner is not None
+
+    async def _handle_request(self, request: web.Request) -> web.Response:
+        """Handle a XML-RPC request within the event loop."""
+        data = await request.read()
+        # pylint: disable=protected-access
+        response = self._dispatcher._marshaled_dispatch(data)
+        return web.Response(body=response, content_type="text/xml")
+
+
+BaseXmlRpcServer = Union[XmlRpcServer, AsyncXmlRpcServer]
 
 
 def register_xml_rpc_server(local_port: int = PORT_ANY) -> XmlRpcServer:
@@ -264,3 +477,14 @@ def register_xml_rpc_server(local_port: int = PORT_ANY) -> XmlRpcServer:
         xml_rpc.start()
         _LOGGER.debug("register_xml_rpc_server: Starting XmlRPC-Server.")
     return xml_rpc
+
+
+async def register_async_xml_rpc_server(
+    local_port: int = PORT_ANY,
+) -> AsyncXmlRpcServer:
+    """Register the asyncio based xml rpc server."""
+    xml_rpc = AsyncXmlRpcServer(local_port=local_port)
+    if not xml_rpc.started:
+        await xml_rpc.start()
+        _LOGGER.debug("register_async_xml_rpc_server: Starting async XmlRPC-Server.")
+    return xml_rpc
@@ -1,19 +1,39 @@
 """Test the HaHomematic central."""
 from __future__ import annotations
 
+import asyncio
 from contextlib import suppress
+from dataclasses import replace
+import os
 from typing import cast
-from unittest.mock import call, patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import const
 import helper
 from helper import get_device, get_generic_entity, get_mock, load_device_description
 import pytest
 
-from hahomematic.const import HmEntityUsage, HmInterfaceEventType, HmPlatform
+from hahomematic import central_unit as hmcu, client as hmcl
+from hahomematic.const import (
+    FILE_PARAMSETS,
+    HH_EVENT_PARAMSET_DESCRIPTIONS_FETCHED,
+    SYSVAR_HM_TYPE_FLOAT,
+    SYSVAR_TYPE_LOGIC,
+    HmCacheFormat,
+    HmDataOperationResult,
+    HmEntityUsage,
+    HmInterfaceEventType,
+    HmPlatform,
+)
 from hahomematic.exceptions import HaHomematicException, NoClients
 from hahomematic.generic_platforms.number import HmFloat
 from hahomematic.generic_platforms.switch import HmSwitch
+from hahomematic.helpers import (
+    HubDataDelta,
+    HubDataSnapshot,
+    ProgramData,
+    SystemVariableData,
+)
 
 TEST_DEVICES: dict[str, str] = {
     "VCU2128127": "HmIP-BSM.json",
@@ -37,6 +57,8 @@ async def test_central_basics(
     assert device
     entities = central.get_readable_entities()
     assert entities
+    rpc_metrics = central.get_rpc_metrics()
+    assert set(rpc_metrics) == {const.LOCAL_INTERFACE_ID, "JSON-RPC"}
 
 
 @pytest.mark.asyncio
@@ -221,6 +243,32 @@ async def test_add_device(
     assert len(central._devices) == 2
 
 
+@pytest.mark.asyncio
+async def test_add_device_progress(
+    central_local_factory: helper.CentralUnitLocalFactory,
+) -> None:
+    """Test the progress of fetching paramset descriptions."""
+    central, mock_client = await central_local_factory.get_default_central(
+        TEST_DEVICES, ignore_devices_on_create=["HmIP-BSM.json", "HmIP-STHD.json"]
+    )
+    assert len(central._devices) == 0
+    dev_desc = load_device_description(
+        central=central, filename="HmIP-BSM.json"
+    ) + load_device_description(central=central, filename="HmIP-STHD.json")
+    with patch("hahomematic.config.MULTICALL_BATCH_SIZE", 1):
+        await central.add_new_devices(const.LOCAL_INTERFACE_ID, dev_desc)
+    assert len(central._devices) == 2
+    progress = [
+        args[1:]
+        for args, _ in central_local_factory.system_event_mock.call_args_list
+        if args[0] == HH_EVENT_PARAMSET_DESCRIPTIONS_FETCHED
+    ]
+    assert sorted(progress) == [
+        (const.LOCAL_INTERFACE_ID, 1, 2),
+        (const.LOCAL_INTERFACE_ID, 2, 2),
+    ]
+
+
 @pytest.mark.asyncio
 async def test_delete_device(
     central_local_factory: helper.CentralUnitLocalFactory,
@@ -299,6 +347,25 @@ async def test_virtual_remote_delete(
     await central.delete_device(const.LOCAL_INTERFACE_ID, "NOT_A_DEVICE_ID")
 
 
+@pytest.mark.asyncio
+async def test_client_routes(
+    central_local_factory: helper.CentralUnitLocalFactory,
+) -> None:
+    """Test the routing of interface_id to client."""
+    central, mock_client = await central_local_factory.get_default_central(TEST_DEVICES)
+    client = central.get_client(const.LOCAL_INTERFACE_ID)
+    assert hmcu.CLIENT_ROUTES[const.LOCAL_INTERFACE_ID] is client
+    assert hmcl.get_client(const.LOCAL_INTERFACE_ID) is client
+    assert hmcl.get_client("unknown") is None
+
+    # The route is only removed by the client, that owns it.
+    other_client = MagicMock()
+    hmcu.CLIENT_ROUTES[const.LOCAL_INTERFACE_ID] = other_client
+    await central.stop()
+    assert hmcl.get_client(const.LOCAL_INTERFACE_ID) is other_client
+    del hmcu.CLIENT_ROUTES[const.LOCAL_INTERFACE_ID]
+
+
 @pytest.mark.asyncio
 async def test_central_not_alive(
     central_local_factory: helper.CentralUnitLocalFactory,
@@ -358,31 +425,38 @@ async def test_central_services(
         include_internal=True
     )
 
-    assert len(mock_client.method_calls) == 41
+    assert len(mock_client.method_calls) == 12
+    assert (
+        call.get_hub_data(
+            include_internal_sysvars=True, include_internal_programs=False
+        )
+        in mock_client.method_calls
+    )
+    assert call.fetch_device_details_rooms_functions() in mock_client.method_calls
     await central.refresh_entity_data(paramset_key="MASTER")
-    assert len(mock_client.method_calls) == 41
+    assert len(mock_client.method_calls) == 12
     await central.refresh_entity_data(paramset_key="VALUES")
-    assert len(mock_client.method_calls) == 73
+    assert len(mock_client.method_calls) == 44
 
     await central.get_system_variable(name="SysVar_Name")
     assert mock_client.method_calls[-1] == call.get_system_variable("SysVar_Name")
 
-    assert len(mock_client.method_calls) == 74
+    assert len(mock_client.method_calls) == 45
     await central.set_system_variable(name="sv_alarm", value=True)
     assert mock_client.method_calls[-1] == call.set_system_variable(
         name="sv_alarm", value=True
     )
-    assert len(mock_client.method_calls) == 75
+    assert len(mock_client.method_calls) == 46
     await central.set_system_variable(name="SysVar_Name", value=True)
-    assert len(mock_client.method_calls) == 75
+    assert len(mock_client.method_calls) == 46
 
     await central.set_install_mode(interface_id=const.LOCAL_INTERFACE_ID)
     assert mock_client.method_calls[-1] == call.set_install_mode(
         on=True, t=60, mode=1, device_address=None
     )
-    assert len(mock_client.method_calls) == 76
+    assert len(mock_client.method_calls) == 47
     await central.set_install_mode(interface_id="NOT_A_VALID_INTERFACE_ID")
-    assert len(mock_client.method_calls) == 76
+    assert len(mock_client.method_calls) == 47
 
     await central.set_value(
         interface_id=const.LOCAL_INTERFACE_ID,
@@ -397,14 +471,14 @@ async def test_central_services(
         value=1.0,
         rx_mode=None,
     )
-    assert len(mock_client.method_calls) == 77
+    assert len(mock_client.method_calls) == 48
     await central.set_value(
         interface_id="NOT_A_VALID_INTERFACE_ID",
         channel_address="123",
         parameter="LEVEL",
         value=1.0,
     )
-    assert len(mock_client.method_calls) == 77
+    assert len(mock_client.method_calls) == 48
 
     await central.put_paramset(
         interface_id=const.LOCAL_INTERFACE_ID,
@@ -415,14 +489,14 @@ async def test_central_services(
     assert mock_client.method_calls[-1] == call.put_paramset(
         address="123", paramset_key="VALUES", value={"LEVEL": 1.0}, rx_mode=None
     )
-    assert len(mock_client.method_calls) == 78
+    assert len(mock_client.method_calls) == 49
     await central.put_paramset(
         interface_id="NOT_A_VALID_INTERFACE_ID",
         address="123",
         paramset_key="VALUES",
         value={"LEVEL": 1.0},
     )
-    assert len(mock_client.method_calls) == 78
+    assert len(mock_client.method_calls) == 49
 
     assert (
         central.get_generic_entity(
@@ -436,6 +510,228 @@ async def test_central_services(
     )
 
 
+@pytest.mark.asyncio
+async def test_hub_data_delta(
+    central_local_factory: helper.CentralUnitLocalFactory,
+) -> None:
+    """Test the hub applies the changes of sysvars and programs between refreshes."""
+    central, mock_client = await central_local_factory.get_default_central(TEST_DEVICES)
+    mock_client.get_hub_data = AsyncMock(
+        return_value=HubDataSnapshot(
+            variables=[
+                SystemVariableData(
+                    name="sv_float", data_type=SYSVAR_HM_TYPE_FLOAT, value=1.5, vid="1"
+                ),
+                SystemVariableData(
+                    name="sv_number", data_type=SYSVAR_HM_TYPE_FLOAT, value=1.0, vid="2"
+                ),
+                SystemVariableData(
+                    name="sv_logic", data_type=SYSVAR_TYPE_LOGIC, value=False, vid="3"
+                ),
+            ],
+            programs=const.PROGRAM_DATA,
+            backend_timestamp=1000,
+        )
+    )
+    mock_client.get_hub_data_since = AsyncMock(
+        return_value=HubDataDelta(
+            backend_timestamp=1060,
+            variables=[
+                SystemVariableData(
+                    name="sv_float", data_type=SYSVAR_HM_TYPE_FLOAT, value=2.5, vid="1"
+                ),
+                SystemVariableData(
+                    name="sv_renamed",
+                    data_type=SYSVAR_HM_TYPE_FLOAT,
+                    value=1.0,
+                    vid="2",
+                ),
+                SystemVariableData(
+                    name="sv_new", data_type=SYSVAR_TYPE_LOGIC, value=True, vid="4"
+                ),
+            ],
+            programs=[
+                ProgramData(
+                    name="p1",
+                    pid="pid1",
+                    is_active=False,
+                    is_internal=False,
+                    last_execute_time="2023-01-16 10:00:00",
+                )
+            ],
+            deleted_sysvar_ids=["3"],
+            deleted_program_ids=["pid2"],
+        )
+    )
+
+    # full refresh
+    await central.fetch_hub_data()
+    assert set(central.sysvar_entities) == {"sv_float", "sv_number", "sv_logic"}
+    assert set(central.program_entities) == {"pid1", "pid2"}
+    assert mock_client.get_hub_data_since.call_count == 0
+
+    # delta
+    await central.fetch_hub_data()
+    mock_client.get_hub_data_since.assert_called_once_with(
+        since=1000,
+        known_sysvar_ids={"1", "2", "3"},
+        known_program_ids={"pid1", "pid2"},
+        include_internal_sysvars=True,
+        include_internal_programs=False,
+    )
+    assert set(central.sysvar_entities) == {"sv_float", "sv_renamed", "sv_new"}
+    assert central.sysvar_entities["sv_float"].value == 2.5
+    assert set(central.program_entities) == {"pid1"}
+    assert central.program_entities["pid1"].is_active is False
+    assert mock_client.get_hub_data.call_count == 1
+
+    # The next delta is based on the backend time of the last delta.
+    await central.fetch_hub_data()
+    assert mock_client.get_hub_data_since.call_args.kwargs["since"] == 1060
+
+    # periodic full refresh
+    with patch("hahomematic.config.HUB_FULL_REFRESH_INTERVAL", 0):
+        await central.fetch_hub_data()
+    assert mock_client.get_hub_data.call_count == 2
+    assert set(central.sysvar_entities) == {"sv_float", "sv_number", "sv_logic"}
+    assert set(central.program_entities) == {"pid1", "pid2"}
+
+
+@pytest.mark.asyncio
+async def test_set_system_variables(
+    central_local_factory: helper.CentralUnitLocalFactory,
+) -> None:
+    """Test several sysvars are set within one call and updated locally."""
+    central, mock_client = await central_local_factory.get_default_central(
+        TEST_DEVICES, add_sysvars=True
+    )
+    mock_client.set_system_variables = AsyncMock(
+        return_value={"sv_alarm_ext": True, "sv_list_ext": True, "sv_float_ext": False}
+    )
+    assert await central.set_system_variables(
+        {
+            "sv_alarm_ext": True,
+            "sv_list_ext": "v3",
+            "sv_float_ext": 24.0,
+            "sv_integer_ext": 35,
+            "sv_unknown": 1,
+        }
+    ) == {
+        "sv_alarm_ext": True,
+        "sv_list_ext": True,
+        "sv_float_ext": False,
+        "sv_integer_ext": False,
+        "sv_unknown": False,
+    }
+    # The invalid and unknown sysvars are not sent.
+    mock_client.set_system_variables.assert_called_once_with(
+        values={"sv_alarm_ext": True, "sv_list_ext": 2, "sv_float_ext": 24.0}
+    )
+    assert central.sysvar_entities["sv_alarm_ext"].value is True
+    assert central.sysvar_entities["sv_list_ext"].value == "v3"
+    assert central.sysvar_entities["sv_float_ext"].value == 23.2
+    assert central.hub_polling_statistics.writes == 1
+
+
+@pytest.mark.asyncio
+async def test_hub_polling(
+    central_local_factory: helper.CentralUnitLocalFactory,
+) -> None:
+    """Test the hub polling backs off and polls fast after a write."""
+    central, mock_client = await central_local_factory.get_default_central(TEST_DEVICES)
+    sysvar_data = SystemVariableData(
+        name="sv_float",
+        data_type=SYSVAR_HM_TYPE_FLOAT,
+        value=1.5,
+        extended_sysvar=True,
+    )
+    mock_client.get_hub_data = AsyncMock(
+        return_value=HubDataSnapshot(variables=[sysvar_data], programs=[])
+    )
+    statistics = central.hub_polling_statistics
+    with patch("hahomematic.config.HUB_POLL_MIN_INTERVAL", 0.01), patch(
+        "hahomematic.config.HUB_POLL_MAX_INTERVAL", 10
+    ):
+        central.start_hub_polling()
+        # backing off, while nothing changes
+        await asyncio.sleep(0.3)
+        assert statistics.polls >= 3
+        assert statistics.polls_with_changes == 0
+        assert statistics.slower == statistics.polls
+        assert statistics.interval >= 0.08
+
+        # A write lets the next poll follow after the floor.
+        mock_client.get_hub_data.return_value = HubDataSnapshot(
+            variables=[replace(sysvar_data, value=3.0)], programs=[]
+        )
+        polls = statistics.polls
+        await central.sysvar_entities["sv_float"].send_variable(2.5)
+        assert statistics.writes == 1
+        await asyncio.sleep(0.05)
+        assert statistics.polls > polls
+        assert statistics.interval < 0.08
+        assert statistics.faster == 1
+        assert statistics.polls_with_changes == 1
+        assert statistics.sysvar_changes == {"sv_float": 1}
+        assert central.sysvar_entities["sv_float"].value == 3.0
+
+        central.stop_hub_polling()
+        polls = statistics.polls
+        await asyncio.sleep(0.1)
+        assert statistics.polls == polls
+
+
+@pytest.mark.asyncio
+async def test_cache_format_migration(tmp_path: str) -> None:
+    """Test the caches are migrated between the JSON and the binary format."""
+    central = MagicMock()
+    central.name = const.CENTRAL_NAME
+    central.config.storage_folder = str(tmp_path)
+    central.config.use_caches = True
+    central.async_add_executor_job = AsyncMock(
+        side_effect=lambda executor_func, *args: executor_func(*args)
+    )
+    json_file = os.path.join(
+        tmp_path, "cache", f"{const.CENTRAL_NAME}_{FILE_PARAMSETS}"
+    )
+    binary_file = f"{os.path.splitext(json_file)[0]}.bin"
+
+    central.config.cache_format = HmCacheFormat.JSON
+    json_cache = hmcu.ParamsetDescriptionCache(central=central)
+    json_cache.add(
+        interface_id=const.LOCAL_INTERFACE_ID,
+        channel_address="VCU0000001:1",
+        paramset_key="VALUES",
+        paramset_description={"LEVEL": {"TYPE": "FLOAT", "MIN": 0.0, "MAX": 1.0}},
+    )
+    await json_cache.save()
+    assert os.path.exists(json_file)
+
+    central.config.cache_format = HmCacheFormat.BINARY
+    binary_cache = hmcu.ParamsetDescriptionCache(central=central)
+    assert await binary_cache.load() == HmDataOperationResult.LOAD_SUCCESS
+    assert binary_cache.get_parameter_data(
+        interface_id=const.LOCAL_INTERFACE_ID,
+        channel_address="VCU0000001:1",
+        paramset_key="VALUES",
+        parameter="LEVEL",
+    ) == {"TYPE": "FLOAT", "MIN": 0.0, "MAX": 1.0}
+    assert os.path.exists(binary_file)
+    assert not os.path.exists(json_file)
+
+    central.config.cache_format = HmCacheFormat.JSON
+    json_cache = hmcu.ParamsetDescriptionCache(central=central)
+    assert await json_cache.load() == HmDataOperationResult.LOAD_SUCCESS
+    assert json_cache.get_by_interface(
+        interface_id=const.LOCAL_INTERFACE_ID
+    ) == binary_cache.get_by_interface(interface_id=const.LOCAL_INTERFACE_ID)
+    assert os.path.exists(json_file)
+    assert not os.path.exists(binary_file)
+
+    await json_cache.clear()
+    assert not os.path.exists(json_file)
+
+
 @pytest.mark.asyncio
 async def test_central_direct(
     central_local_factory: helper.CentralUnitLocalFactory,
@@ -491,3 +787,58 @@ async def test_central_without_interface_config(
     assert central._get_virtual_remote("VCU4264293") is None
 
     await central.stop()
+
+
+@pytest.mark.asyncio
+async def test_device_data_delta() -> None:
+    """Test the device data cache merges the changed device data."""
+    client = MagicMock()
+    client.fetch_all_device_data = AsyncMock()
+    client.fetch_changed_device_data = AsyncMock(return_value=True)
+    central = MagicMock()
+    central.get_primary_client.return_value = client
+    device_data = hmcu.DeviceDataCache(central=central)
+
+    # An empty cache is fetched completely.
+    await device_data.load(changed_only=True)
+    assert client.fetch_all_device_data.call_count == 1
+    assert client.fetch_changed_device_data.call_count == 0
+
+    device_data.add_device_data(
+        device_data={"BidCos-RF": {"VCU0000001:1": {"LEVEL": 0.5, "STATE": True}}},
+        backend_timestamp=1000,
+    )
+    await device_data.load(changed_only=True)
+    assert client.fetch_all_device_data.call_count == 1
+    assert client.fetch_changed_device_data.call_count == 1
+
+    device_data.merge_device_data(
+        records=[
+            ("BidCos-RF", "VCU0000001:1", "LEVEL", 1.0),
+            ("HmIP-RF", "VCU0000002:1", "STATE", False),
+        ],
+        backend_timestamp=1060,
+    )
+    assert device_data.backend_timestamp == 1060
+    for interface, channel_address, parameter, value in (
+        ("BidCos-RF", "VCU0000001:1", "LEVEL", 1.0),
+        ("BidCos-RF", "VCU0000001:1", "STATE", True),
+        ("HmIP-RF", "VCU0000002:1", "STATE", False),
+    ):
+        assert (
+            device_data.get_device_data(
+                interface=interface,
+                channel_address=channel_address,
+                parameter=parameter,
+                max_age_seconds=60,
+            )
+            == value
+        )
+
+    # A backend without deltas is fetched completely.
+    client.fetch_changed_device_data.return_value = False
+    await device_data.load(changed_only=True)
+    assert client.fetch_all_device_data.call_count == 2
+
+    await device_data.clear()
+    assert device_data.backend_timestamp is None
@@ -0,0 +1,89 @@
+"""Test the circuit breaker."""
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+from aiohttp import ClientSession
+import const
+import pytest
+
+from hahomematic.circuit_breaker import CircuitBreaker, CircuitState
+from hahomematic.exceptions import NoConnection
+from hahomematic.helpers import build_xml_rpc_uri, find_free_port
+from hahomematic.rpc_metrics import RpcMetrics
+from hahomematic.xml_rpc_proxy import AioXmlRpcProxy
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker() -> None:
+    """Test open, half open and close of the circuit breaker."""
+    with patch("hahomematic.config.CIRCUIT_BREAKER_FAILURE_THRESHOLD", 2), patch(
+        "hahomematic.config.CIRCUIT_BREAKER_COOL_DOWN", 0.05
+    ):
+        breaker = CircuitBreaker(name="CentralTest-BidCos-RF")
+        breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+        breaker.check(method="getValue")
+        breaker.record_failure()
+        assert breaker.is_open is True
+        with pytest.raises(NoConnection):
+            breaker.check(method="getValue")
+        assert breaker.rejected == 1
+        # Connection checks always pass.
+        breaker.check(method="ping")
+
+        await asyncio.sleep(0.05)
+        assert breaker.state == CircuitState.HALF_OPEN
+        # Only a single probe is let through.
+        breaker.check(method="getValue")
+        with pytest.raises(NoConnection):
+            breaker.check(method="getParamset")
+        breaker.record_failure()
+        assert breaker.is_open is True
+
+        await asyncio.sleep(0.05)
+        breaker.check(method="getValue")
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+
+        breaker.trip()
+        assert breaker.is_open is True
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_end_probe() -> None:
+    """Test that a probe without outcome lets the next call probe."""
+    with patch("hahomematic.config.CIRCUIT_BREAKER_COOL_DOWN", 0.05):
+        breaker = CircuitBreaker(name="CentralTest-BidCos-RF")
+        breaker.trip()
+        await asyncio.sleep(0.05)
+        assert breaker.check(method="getValue") is True
+        breaker.end_probe()
+        assert breaker.check(method="getValue") is True
+        assert breaker.rejected == 0
+        assert breaker.state == CircuitState.HALF_OPEN
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_proxy(client_session: ClientSession) -> None:
+    """Test calls to an unreachable backend fail fast."""
+    metrics = RpcMetrics(name="CentralTest-BidCos-RF")
+    breaker = CircuitBreaker(name="CentralTest-BidCos-RF")
+    proxy = AioXmlRpcProxy(
+        client_session=client_session,
+        uri=build_xml_rpc_uri(host=const.CCU_HOST, port=find_free_port(), path=None),
+        metrics=metrics,
+        circuit_breaker=breaker,
+    )
+    with patch("hahomematic.config.CIRCUIT_BREAKER_FAILURE_THRESHOLD", 1):
+        with pytest.raises(NoConnection):
+            await proxy.getValue("VCU0000001:1", "STATE")
+        assert breaker.is_open is True
+        with pytest.raises(NoConnection):
+            await proxy.getValue("VCU0000001:1", "STATE")
+    # The second call did not reach the backend.
+    assert metrics.snapshot()["getValue"].calls == 1
+    assert breaker.rejected == 1
@@ -0,0 +1,138 @@
+"""Test the client."""
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+import xmlrpc.client
+
+import const
+import helper
+import pydevccu
+import pytest
+
+from hahomematic.central_unit import CentralUnit
+from hahomematic.client import Client, InterfaceConfig
+from hahomematic.exceptions import BaseHomematicException, ProxyException
+
+
+async def _get_pydevccu_client(
+    central_local_factory: helper.CentralUnitLocalFactory,
+) -> tuple[CentralUnit, Client]:
+    """Return a central and a client connected to pydevccu."""
+    interface_config = InterfaceConfig(
+        central_name=const.CENTRAL_NAME,
+        interface="BidCos-RF",
+        port=const.CCU_PORT,
+    )
+    central = await central_local_factory.get_raw_central(
+        interface_config=interface_config
+    )
+    client = await helper.get_client(
+        central=central, interface_config=interface_config, do_mock_client=False
+    )
+    return central, client
+
+
+@pytest.mark.asyncio
+async def test_multicall(
+    ccu: pydevccu.Server,
+    central_local_factory: helper.CentralUnitLocalFactory,
+) -> None:
+    """Test reads by system.multicall."""
+    central, client = await _get_pydevccu_client(central_local_factory)
+    device_descriptions = [
+        device_description
+        for device_description in await client.get_all_device_descriptions()
+        if device_description["ADDRESS"].startswith("VCU2128127")
+    ]
+    paramsets = await client.get_all_paramset_descriptions(device_descriptions)
+    assert paramsets["VCU2128127"] == {}
+    assert "STATE" in paramsets["VCU2128127:4"]["VALUES"]
+
+    values = await client.get_values(
+        requests=[
+            ("VCU2128127:0", "VALUES", "UNREACH"),
+            ("VCU2128127:4", "VALUES", "STATE"),
+            ("VCU2128127:4", "VALUES", "NOT_A_PARAMETER"),
+            ("VCU2128127:0", "MASTER", "NOT_A_PARAMETER"),
+        ]
+    )
+    assert values[0] is False
+    assert values[1] is False
+    assert isinstance(values[2], BaseHomematicException)
+    assert values[3] is None
+    await central.stop()
+
+
+@pytest.mark.asyncio
+async def test_multicall_fallback(
+    central_local_factory: helper.CentralUnitLocalFactory,
+) -> None:
+    """Test single calls, if multicall is not supported."""
+    central, client = await central_local_factory.get_default_central(
+        {}, do_mock_client=False
+    )
+    single_calls: list[tuple[Any, ...]] = []
+
+    async def multicall(calls: list[dict[str, Any]]) -> None:
+        fault = xmlrpc.client.Fault(1, "unknown method")
+        raise ProxyException(fault) from fault
+
+    async def get_value(*args: Any) -> Any:
+        single_calls.append(args)
+        if args[1] == "NOT_A_PARAMETER":
+            raise ProxyException("unknown parameter")
+        return 1
+
+    proxy = SimpleNamespace(
+        system=SimpleNamespace(multicall=multicall), getValue=get_value
+    )
+    results = await client._multicall(
+        proxy=proxy,
+        calls=[
+            ("getValue", ("VCU2128127:1", "LEVEL")),
+            ("getValue", ("VCU2128127:1", "NOT_A_PARAMETER")),
+        ],
+    )
+    assert results[0] == 1
+    assert isinstance(results[1], ProxyException)
+    assert len(single_calls) == 2
+
+    # multicall is not tried again.
+    results = await client._multicall(
+        proxy=proxy, calls=[("getValue", ("VCU2128127:1", "LEVEL"))]
+    )
+    assert results == [1]
+    assert len(single_calls) == 3
+    await central.stop()
+
+
+@pytest.mark.asyncio
+async def test_multicall_error(
+    central_local_factory: helper.CentralUnitLocalFactory,
+) -> None:
+    """Test that other multicall errors do not disable multicall."""
+    central, client = await central_local_factory.get_default_central(
+        {}, do_mock_client=False
+    )
+    multicalls: list[list[dict[str, Any]]] = []
+
+    async def multicall(calls: list[dict[str, Any]]) -> list[Any]:
+        multicalls.append(calls)
+        if len(multicalls) == 1:
+            raise ProxyException("Connection reset by peer")
+        return [[1] for _ in calls]
+
+    proxy = SimpleNamespace(system=SimpleNamespace(multicall=multicall))
+    calls = [
+        ("getValue", ("VCU2128127:1", "LEVEL")),
+        ("getValue", ("VCU2128127:1", "STATE")),
+    ]
+    results = await client._multicall(proxy=proxy, calls=calls)
+    assert len(results) == 2
+    assert all(isinstance(result, ProxyException) for result in results)
+
+    # multicall is still used.
+    assert await client._multicall(proxy=proxy, calls=calls) == [1, 1]
+    assert len(multicalls) == 2
+    await central.stop()
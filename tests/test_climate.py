@@ -246,21 +246,19 @@ async def test_ceipthermostat(
     assert climate.preset_mode == HmPresetMode.NONE
 
     await climate.set_hvac_mode(HmHvacMode.OFF)
-    assert mock_client.method_calls[-1] == call.set_value(
-        channel_address="VCU1769958:1",
+    assert mock_client.method_calls[-1] == call.put_paramset(
+        address="VCU1769958:1",
         paramset_key="VALUES",
-        parameter="SET_POINT_TEMPERATURE",
-        value=4.5,
+        value={"CONTROL_MODE": 1, "SET_POINT_TEMPERATURE": 4.5},
     )
     assert climate.hvac_mode == HmHvacMode.OFF
     assert climate.hvac_action == HmHvacAction.OFF
 
     await climate.set_hvac_mode(HmHvacMode.HEAT)
-    assert mock_client.method_calls[-1] == call.set_value(
-        channel_address="VCU1769958:1",
+    assert mock_client.method_calls[-1] == call.put_paramset(
+        address="VCU1769958:1",
         paramset_key="VALUES",
-        parameter="SET_POINT_TEMPERATURE",
-        value=5.0,
+        value={"CONTROL_MODE": 1, "SET_POINT_TEMPERATURE": 5.0},
     )
     central.event(
         const.LOCAL_INTERFACE_ID, "VCU1769958:1", "SET_POINT_MODE", HMIP_MODE_MANU
@@ -283,11 +281,10 @@ async def test_ceipthermostat(
     assert climate.preset_mode == HmPresetMode.BOOST
 
     await climate.set_hvac_mode(HmHvacMode.AUTO)
-    assert mock_client.method_calls[-1] == call.set_value(
-        channel_address="VCU1769958:1",
+    assert mock_client.method_calls[-1] == call.put_paramset(
+        address="VCU1769958:1",
         paramset_key="VALUES",
-        parameter="BOOST_MODE",
-        value=False,
+        value={"CONTROL_MODE": 0, "BOOST_MODE": False},
     )
     central.event(
         const.LOCAL_INTERFACE_ID, "VCU1769958:1", "SET_POINT_MODE", HMIP_MODE_AUTO
@@ -320,17 +317,10 @@ async def test_ceipthermostat(
         const.LOCAL_INTERFACE_ID, "VCU1769958:1", "SET_POINT_MODE", HMIP_MODE_AUTO
     )
     await climate.set_preset_mode(HmPresetMode.WEEK_PROGRAM_1)
-    assert mock_client.method_calls[-2] == call.set_value(
-        channel_address="VCU1769958:1",
-        paramset_key="VALUES",
-        parameter="BOOST_MODE",
-        value=False,
-    )
-    assert mock_client.method_calls[-1] == call.set_value(
-        channel_address="VCU1769958:1",
+    assert mock_client.method_calls[-1] == call.put_paramset(
+        address="VCU1769958:1",
         paramset_key="VALUES",
-        parameter="ACTIVE_PROFILE",
-        value=1,
+        value={"BOOST_MODE": False, "ACTIVE_PROFILE": 1},
     )
     assert climate.preset_mode == HmPresetMode.WEEK_PROGRAM_1
 
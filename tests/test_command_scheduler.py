@@ -0,0 +1,111 @@
+"""Test the command scheduler."""
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from hahomematic.command_scheduler import CommandPriority, CommandScheduler
+
+INTERFACE_ID = "CentralTest-HmIP-RF"
+
+
+class _Sender:
+    """Record sent commands."""
+
+    def __init__(self) -> None:
+        self.commands: list[tuple[str, str, str | None, Any, str | None]] = []
+
+    async def __call__(
+        self,
+        address: str,
+        paramset_key: str,
+        parameter: str | None,
+        value: Any,
+        rx_mode: str | None,
+    ) -> None:
+        self.commands.append((address, paramset_key, parameter, value, rx_mode))
+
+
+@pytest.mark.asyncio
+async def test_command_scheduler() -> None:
+    """Test priority, collapsing and metrics of the command scheduler."""
+    sender = _Sender()
+    with patch("hahomematic.config.COMMAND_BURST", 1), patch(
+        "hahomematic.config.COMMAND_RATE", 100
+    ):
+        scheduler = CommandScheduler(interface_id=INTERFACE_ID, send=sender)
+        tasks = [
+            asyncio.create_task(scheduler.schedule(*command))
+            for command in (
+                ("VCU0000001:1", "VALUES", "LEVEL", 0.1),
+                ("VCU0000002:1", "MASTER", None, {"A": 1}, None, CommandPriority.LOW),
+                ("VCU0000003:1", "VALUES", "STATE", True),
+                ("VCU0000001:1", "VALUES", "LEVEL", 0.5),
+                ("VCU0000002:1", "MASTER", None, {"B": 2}, None, CommandPriority.LOW),
+                ("VCU0000004:1", "VALUES", "STATE", True, None, CommandPriority.HIGH),
+            )
+        ]
+        await asyncio.sleep(0)
+        assert scheduler.queue_depth == 4
+        await asyncio.gather(*tasks)
+
+    assert sender.commands == [
+        ("VCU0000004:1", "VALUES", "STATE", True, None),
+        ("VCU0000001:1", "VALUES", "LEVEL", 0.5, None),
+        ("VCU0000003:1", "VALUES", "STATE", True, None),
+        ("VCU0000002:1", "MASTER", None, {"A": 1, "B": 2}, None),
+    ]
+    assert scheduler.queue_depth == 0
+    assert scheduler.statistics.sent == 4
+    assert scheduler.statistics.collapsed == 2
+    assert scheduler.statistics.max_queue_depth == 4
+    assert scheduler.statistics.max_wait > 0.0
+    assert scheduler.statistics.mean_wait > 0.0
+
+
+@pytest.mark.asyncio
+async def test_command_scheduler_paramset_order() -> None:
+    """Test that collapsed paramsets send the newer parameters last."""
+    sender = _Sender()
+    scheduler = CommandScheduler(interface_id=INTERFACE_ID, send=sender)
+    await asyncio.gather(
+        scheduler.schedule("VCU0000002:1", "MASTER", None, {"A": 1, "B": 2}),
+        scheduler.schedule("VCU0000002:1", "MASTER", None, {"A": 3}),
+    )
+    assert len(sender.commands) == 1
+    value = sender.commands[0][3]
+    assert value == {"A": 3, "B": 2}
+    assert list(value) == ["B", "A"]
+
+
+@pytest.mark.asyncio
+async def test_command_scheduler_duty_cycle() -> None:
+    """Test the rate is reduced by the duty cycle and rx_mode costs."""
+    sender = _Sender()
+    with patch("hahomematic.config.COMMAND_BURST", 3), patch(
+        "hahomematic.config.COMMAND_RATE", 100
+    ):
+        scheduler = CommandScheduler(interface_id=INTERFACE_ID, send=sender)
+        assert scheduler.rate == 100.0
+        scheduler.set_duty_cycle_level(50)
+        scheduler.set_carrier_sense_level(80)
+        assert scheduler.rate == pytest.approx(20.0)
+        scheduler.set_duty_cycle_level(100)
+        scheduler.set_carrier_sense_level("invalid")
+        assert scheduler.rate == pytest.approx(5.0)
+        scheduler.set_duty_cycle_level(0)
+        scheduler.set_carrier_sense_level(0)
+
+        # A BURST command takes the whole bucket.
+        await scheduler.schedule("VCU0000001:1", "VALUES", "STATE", True, "BURST")
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await scheduler.schedule("VCU0000001:1", "VALUES", "STATE", False)
+        assert loop.time() - started >= 0.005
+        assert len(sender.commands) == 2
+
+        scheduler.clear()
+        assert scheduler.queue_depth == 0
@@ -92,3 +92,33 @@ async def test_deviceerrorevent(
             "value": True,
         },
     )
+
+
+@pytest.mark.asyncio
+async def test_events_batch(
+    central_local_factory: helper.CentralUnitLocalFactory,
+) -> None:
+    """Test a batch of events."""
+    central, mock_client = await central_local_factory.get_default_central(TEST_DEVICES)
+    central_local_factory.ha_event_mock.reset_mock()
+    events = [
+        ("VCU2128127:1", "PRESS_SHORT", True),
+        ("VCU0000263:1", "SEQUENCE_OK", True),
+    ]
+    central.events(const.LOCAL_INTERFACE_ID, events)
+    assert central_local_factory.ha_event_mock.call_count == 2
+    assert central_local_factory.entity_event_mock.call_args_list[-1] == call(
+        const.LOCAL_INTERFACE_ID, "VCU0000263:1", "SEQUENCE_OK", True
+    )
+    assert const.LOCAL_INTERFACE_ID in central.last_events
+
+    # A batch from another thread is passed to the loop at once.
+    await asyncio.get_running_loop().run_in_executor(
+        None, central.events, const.LOCAL_INTERFACE_ID, events
+    )
+    await asyncio.sleep(0)
+    assert central_local_factory.ha_event_mock.call_count == 4
+
+    # Events of unknown interfaces are ignored.
+    central.events("unknown", events)
+    assert central_local_factory.ha_event_mock.call_count == 4
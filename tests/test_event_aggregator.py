@@ -0,0 +1,100 @@
+"""Test the event aggregator."""
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from hahomematic.event_aggregator import EventAggregate, EventAggregator
+
+INTERFACE_ID = "CentralTest-BidCos-RF"
+DEVICE_TYPES = {"VCU0000001": "HM-ES-PMSw1-Pl", "VCU0000002": "HmIP-PSM"}
+INTERVAL = 0.05
+
+
+def _get_aggregator(
+    emitted: list[tuple[str, str, str, Any]]
+) -> EventAggregator:
+    """Return an aggregator, that records emitted events."""
+    return EventAggregator(
+        loop=asyncio.get_running_loop(),
+        intervals={
+            ("HM-ES-PMSw1-Pl", "POWER"): INTERVAL,
+            ("*", "VOLTAGE"): INTERVAL,
+        },
+        get_device_type=DEVICE_TYPES.get,
+        emit=lambda *args: emitted.append(args),
+    )
+
+
+@pytest.mark.asyncio
+async def test_event_aggregator() -> None:
+    """Test rate limit and aggregation of events."""
+    emitted: list[tuple[str, str, str, Any]] = []
+    aggregator = _get_aggregator(emitted)
+
+    # The first event passes, the following are aggregated.
+    assert aggregator.aggregate(INTERFACE_ID, "VCU0000001:1", "POWER", 10.0) is False
+    assert aggregator.aggregate(INTERFACE_ID, "VCU0000001:1", "POWER", 30.0) is True
+    assert aggregator.aggregate(INTERFACE_ID, "VCU0000001:1", "POWER", 20.0) is True
+    assert aggregator.get_aggregate("VCU0000001:1", "POWER") == EventAggregate(
+        last=20.0, count=3, min=10.0, max=30.0, mean=20.0
+    )
+    # Not configured parameters and unknown devices are not aggregated.
+    assert aggregator.aggregate(INTERFACE_ID, "VCU0000001:1", "CURRENT", 1) is False
+    assert aggregator.aggregate(INTERFACE_ID, "VCU0000001:1", "CURRENT", 2) is False
+    assert aggregator.aggregate(INTERFACE_ID, "VCU0000009:1", "POWER", 1) is False
+    # The wildcard device type matches all devices.
+    assert aggregator.aggregate(INTERFACE_ID, "VCU0000002:1", "VOLTAGE", 230) is False
+    assert aggregator.aggregate(INTERFACE_ID, "VCU0000002:1", "VOLTAGE", 231) is True
+
+    await asyncio.sleep(INTERVAL * 1.5)
+    assert sorted(emitted) == [
+        (INTERFACE_ID, "VCU0000001:1", "POWER", 20.0),
+        (INTERFACE_ID, "VCU0000002:1", "VOLTAGE", 231),
+    ]
+
+    # The next window is still rate limited.
+    assert aggregator.aggregate(INTERFACE_ID, "VCU0000001:1", "POWER", 40.0) is True
+    await asyncio.sleep(INTERVAL * 1.5)
+    assert emitted[-1] == (INTERFACE_ID, "VCU0000001:1", "POWER", 40.0)
+    await asyncio.sleep(INTERVAL * 1.5)
+    assert aggregator.get_aggregate("VCU0000001:1", "POWER") == EventAggregate(
+        last=40.0, count=1, min=40.0, max=40.0, mean=40.0
+    )
+
+    # After a quiet window, the next event passes immediately.
+    assert aggregator.aggregate(INTERFACE_ID, "VCU0000001:1", "POWER", 50.0) is False
+    assert aggregator.aggregate(INTERFACE_ID, "VCU0000001:1", "POWER", True) is True
+    assert aggregator.get_aggregate("VCU0000001:1", "POWER") == EventAggregate(
+        last=True, count=2
+    )
+    aggregator.clear()
+    count = len(emitted)
+    await asyncio.sleep(INTERVAL * 1.5)
+    assert len(emitted) == count
+
+
+@pytest.mark.asyncio
+async def test_event_aggregator_remove_device() -> None:
+    """Test the intervals of a removed device are determined again."""
+    emitted: list[tuple[str, str, str, Any]] = []
+    device_types = dict(DEVICE_TYPES)
+    aggregator = EventAggregator(
+        loop=asyncio.get_running_loop(),
+        intervals={("HM-ES-PMSw1-Pl", "POWER"): INTERVAL},
+        get_device_type=device_types.get,
+        emit=lambda *args: emitted.append(args),
+    )
+    assert aggregator.aggregate(INTERFACE_ID, "VCU0000001:1", "POWER", 10.0) is False
+    assert aggregator.aggregate(INTERFACE_ID, "VCU0000001:1", "POWER", 20.0) is True
+
+    # The device is paired again with another device type.
+    aggregator.remove_device(device_address="VCU0000001")
+    device_types["VCU0000001"] = "HmIP-PSM"
+    assert aggregator.get_aggregate("VCU0000001:1", "POWER") is None
+    assert aggregator.aggregate(INTERFACE_ID, "VCU0000001:1", "POWER", 30.0) is False
+    assert aggregator.aggregate(INTERFACE_ID, "VCU0000001:1", "POWER", 40.0) is False
+    await asyncio.sleep(INTERVAL * 1.5)
+    assert emitted == []
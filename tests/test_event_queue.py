@@ -0,0 +1,96 @@
+"""Test the event queue."""
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from hahomematic.event_queue import EventQueue
+
+INTERFACE_1 = "CentralTest-HmIP-RF"
+INTERFACE_2 = "CentralTest-BidCos-RF"
+
+
+class _Recorder:
+    """Record processed events."""
+
+    def __init__(self) -> None:
+        self.batches: list[tuple[str, list[tuple[str, str, Any]]]] = []
+
+    def __call__(self, interface_id: str, events: list[tuple[str, str, Any]]) -> None:
+        self.batches.append((interface_id, events))
+
+    def events(self, interface_id: str) -> list[tuple[str, str, Any]]:
+        """Return all processed events of an interface."""
+        return [
+            event
+            for batch_interface_id, batch in self.batches
+            if batch_interface_id == interface_id
+            for event in batch
+        ]
+
+
+async def _drain() -> None:
+    """Give the event loop the chance to drain the queue."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_event_queue() -> None:
+    """Test events are passed in order and in batches."""
+    recorder = _Recorder()
+    queue = EventQueue(loop=asyncio.get_running_loop(), process=recorder, capacity=10)
+    events = [(f"VCU000000{i}:1", "LEVEL", i) for i in range(5)]
+    await asyncio.get_running_loop().run_in_executor(
+        None, queue.put, INTERFACE_1, events
+    )
+    await _drain()
+    assert queue.size == 0
+    assert recorder.batches == [(INTERFACE_1, events)]
+    assert queue.statistics.enqueued == 5
+    assert queue.statistics.dropped == 0
+    assert queue.statistics.max_lag > 0.0
+
+
+@pytest.mark.asyncio
+async def test_event_queue_saturated() -> None:
+    """Test coalescing, dropping and fairness of a saturated queue."""
+    recorder = _Recorder()
+    queue = EventQueue(loop=asyncio.get_running_loop(), process=recorder, capacity=4)
+    queue.put(INTERFACE_1, [("VCU0000001:1", "LEVEL", 0.1)])
+    queue.put(INTERFACE_2, [("VCU0000002:1", "STATE", False)])
+    # Each interface gets a share of 2 events.
+    queue.put(
+        INTERFACE_1,
+        [
+            ("VCU0000001:1", "WORKING", True),
+            ("VCU0000001:1", "LEVEL", 0.2),
+            ("VCU0000001:1", "LEVEL", 0.3),
+            ("VCU0000003:1", "LEVEL", 1.0),
+        ],
+    )
+    queue.put(INTERFACE_2, [("VCU0000002:1", "STATE", True)])
+    assert queue.size == 4
+    assert queue.statistics.enqueued == 4
+    assert queue.statistics.coalesced == 2
+    assert queue.statistics.dropped == 1
+    queue.put(INTERFACE_2, [("VCU0000002:1", "STATE", False)])
+    assert queue.statistics.coalesced == 3
+
+    await _drain()
+    assert recorder.events(INTERFACE_1) == [
+        ("VCU0000001:1", "LEVEL", 0.3),
+        ("VCU0000001:1", "WORKING", True),
+    ]
+    assert recorder.events(INTERFACE_2) == [
+        ("VCU0000002:1", "STATE", False),
+        ("VCU0000002:1", "STATE", False),
+    ]
+
+    queue.put(INTERFACE_1, [("VCU0000001:1", "LEVEL", 0.4)])
+    queue.clear()
+    await _drain()
+    assert queue.size == 0
+    assert recorder.events(INTERFACE_1)[-1] == ("VCU0000001:1", "WORKING", True)
@@ -0,0 +1,434 @@
+"""Test the json rpc client."""
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Final
+from unittest.mock import patch
+
+from aiohttp import ClientSession, web
+import const
+import pytest
+
+from hahomematic.helpers import (
+    HubDataDelta,
+    ProgramData,
+    SystemVariableData,
+    find_free_port,
+)
+from hahomematic.json_rpc_client import JsonRpcAioHttpClient
+
+
+_RESULTS: dict[str, Any] = {
+    "Device.listAllDetail": [{"address": "VCU0000001", "name": "Device"}],
+    "Program.getAll": [
+        {
+            "id": "1",
+            "name": "Program",
+            "isActive": True,
+            "isInternal": False,
+            "lastExecuteTime": "",
+        }
+    ],
+    "ReGa.runScript": '[{"id": "2", "hasExtMarker": true}]',
+    "SysVar.getAll": [
+        {
+            "id": "2",
+            "name": "SysVar",
+            "isInternal": False,
+            "type": "NUMBER",
+            "value": "1.5",
+            "unit": "",
+        }
+    ],
+    "Room.getAll": [{"id": "3", "name": "Kitchen", "channelIds": ["1001"]}],
+    "Subsection.getAll": [{"id": "4", "name": "Light", "channelIds": ["1001"]}],
+}
+_DEVICE_DATA: Final = (
+    '{"BidCos-RF.VCU0000001%3A1.STATE":true,\n'
+    '"BidCos-RF.VCU0000001%3A1.LEVEL":0.5,\n'
+    '"HmIP-RF.VCU0000002%3A0.NAME":"K%FCche \\"1\\""}'
+)
+
+_HUB_DATA_DELTA: Final = (
+    '{"now":1060,"sysvars":['
+    '{"id":"1","name":"K%FCche","isInternal":false,"type":"NUMBER","value":"5",'
+    '"unit":"%B0C","valueList":"","minValue":"-10.000000","maxValue":"50.000000",'
+    '"hasExtMarker":true},\n'
+    '{"id":"2","name":"Alarm","isInternal":false,"type":"ALARM","value":"true",'
+    '"unit":"","valueList":"","minValue":"0.000000","maxValue":"0.000000",'
+    '"hasExtMarker":false}],'
+    '"programs":[{"id":"5","name":"Program%201","isActive":true,"isInternal":false,'
+    '"lastExecuteTime":"2023-01-16 10:00:00"}],'
+    '"deletedSysvarIds":["3"],"deletedProgramIds":[]}'
+)
+
+
+class _FakeJsonRpcServer:
+    """JSON-RPC server of a CCU, that records the called methods."""
+
+    def __init__(self, supports_batch: bool = False) -> None:
+        self.methods: list[str] = []
+        self.posts = 0
+        self.valid_session_ids: set[str] = set()
+        self._supports_batch = supports_batch
+        self._logins = 0
+
+    async def handle(self, request: web.Request) -> web.Response:
+        """Handle a JSON-RPC request or batch."""
+        self.posts += 1
+        payload = await request.json()
+        if not isinstance(payload, list):
+            return web.json_response(await self._handle_request(payload))
+        if not self._supports_batch:
+            return web.json_response(
+                {"result": None, "error": {"code": 500, "message": "invalid request"}}
+            )
+        # answer in reverse order, the ids assign the responses
+        return web.json_response(
+            [
+                {"id": request_data["id"], **await self._handle_request(request_data)}
+                for request_data in reversed(payload)
+            ]
+        )
+
+    async def _handle_request(self, request_data: dict[str, Any]) -> dict[str, Any]:
+        """Handle a single JSON-RPC request."""
+        method: str = request_data["method"]
+        params: dict[str, Any] = request_data["params"]
+        self.methods.append(method)
+        if method == "Session.login":
+            # a slow login lets concurrent calls wait for it
+            await asyncio.sleep(0.01)
+            self._logins += 1
+            session_id = f"session-{self._logins}"
+            self.valid_session_ids.add(session_id)
+            return {"result": session_id, "error": None}
+        if params.get("_session_id_") not in self.valid_session_ids:
+            return {
+                "result": None,
+                "error": {"code": 400, "message": "access denied (1)"},
+            }
+        if method == "Session.logout":
+            self.valid_session_ids.discard(params["_session_id_"])
+        if method in ("Session.logout", "Session.renew"):
+            return {"result": True, "error": None}
+        if method == "ReGa.runScript":
+            return {"result": _get_script_result(params["script"]), "error": None}
+        return {"result": _RESULTS.get(method, [{"name": "HmIP-RF"}]), "error": None}
+
+
+def _get_script_result(script: str) -> str:
+    """Return the output of a ReGa script."""
+    if script.startswith("!# fetch_all_device_data"):
+        return _DEVICE_DATA
+    if script.startswith("!# set_system_variables"):
+        assert 'oSysvars.Get("SysVar")' in script
+        assert "Write(oSysvar.State(1.500000));" in script
+        assert "Write(oSysvar.State(true));" in script
+        assert "Quote" not in script
+        assert "Infinite" not in script
+        return "[true,false]"
+    if script.startswith("!# get_backend_time"):
+        return '{"now":1000}'
+    if script.startswith("!# fetch_hub_data_since"):
+        assert "integer iSince = 1000;" in script
+        assert 'string sKnownSysvarIds = "\t1\t3\t";' in script
+        assert "boolean bIncludeInternalPrograms = false;" in script
+        return _HUB_DATA_DELTA
+    if "integer iSince = 1000;" in script:
+        return '{"now":1060,"data":[["BidCos-RF.VCU0000001%3A1.LEVEL",1.0]]}'
+    return str(_RESULTS["ReGa.runScript"])
+
+
+async def _start_server(server: _FakeJsonRpcServer) -> tuple[web.AppRunner, int]:
+    """Start the fake JSON-RPC server and return its runner and port."""
+    app = web.Application()
+    app.router.add_post("/api/homematic.cgi", server.handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    port = find_free_port()
+    await web.TCPSite(runner, host=const.CCU_HOST, port=port).start()
+    return runner, port
+
+
+def _get_json_rpc_client(
+    client_session: ClientSession, port: int
+) -> JsonRpcAioHttpClient:
+    """Return a json rpc client for the port."""
+    return JsonRpcAioHttpClient(
+        username=const.CCU_USERNAME,
+        password=const.CCU_PASSWORD,
+        device_url=f"http://{const.CCU_HOST}:{port}",
+        client_session=client_session,
+    )
+
+
+@pytest.mark.asyncio
+async def test_json_rpc_session(client_session: ClientSession) -> None:
+    """Test shared login, retry of expired sessions and background renew."""
+    server = _FakeJsonRpcServer()
+    runner, port = await _start_server(server)
+    json_rpc_client = _get_json_rpc_client(client_session, port)
+    try:
+        with patch("hahomematic.config.JSON_SESSION_RENEW_INTERVAL", 0.05):
+            # Concurrent calls share one login.
+            results = await asyncio.gather(
+                *(json_rpc_client.get_available_interfaces() for _ in range(3))
+            )
+            assert results == [["HmIP-RF"]] * 3
+            assert server.methods.count("Session.login") == 1
+            assert server.methods.count("Interface.listInterfaces") == 3
+
+            # A further call is a single request.
+            server.methods.clear()
+            await json_rpc_client.get_available_interfaces()
+            assert server.methods == ["Interface.listInterfaces"]
+
+            # An expired session is retried once with a new session.
+            server.methods.clear()
+            server.valid_session_ids.clear()
+            assert await json_rpc_client.get_available_interfaces() == ["HmIP-RF"]
+            assert server.methods == [
+                "Interface.listInterfaces",
+                "Session.login",
+                "Interface.listInterfaces",
+            ]
+
+            # The session is renewed in the background.
+            server.methods.clear()
+            await asyncio.sleep(0.12)
+            assert "Session.renew" in server.methods
+
+        await json_rpc_client.logout()
+        assert json_rpc_client.is_activated is False
+        assert server.methods[-1] == "Session.logout"
+    finally:
+        await json_rpc_client.logout()
+        await runner.cleanup()
+
+
+@pytest.mark.parametrize("supports_batch", [True, False])
+@pytest.mark.asyncio
+async def test_json_rpc_batch(
+    client_session: ClientSession, supports_batch: bool
+) -> None:
+    """Test the hub data is fetched by one batch or by concurrent requests."""
+    server = _FakeJsonRpcServer(supports_batch=supports_batch)
+    runner, port = await _start_server(server)
+    json_rpc_client = _get_json_rpc_client(client_session, port)
+    try:
+        for _ in range(2):
+            server.posts = 0
+            hub_data = await json_rpc_client.get_hub_data(
+                include_internal_sysvars=True, include_internal_programs=False
+            )
+            assert [
+                (data.name, data.value, data.extended_sysvar)
+                for data in hub_data.variables
+            ] == [("SysVar", 1.5, True)]
+            assert [data.name for data in hub_data.programs] == ["Program"]
+            assert hub_data.backend_timestamp == 1000
+        # The support of batches is remembered, the ext markers are cached.
+        assert server.posts == (1 if supports_batch else 3)
+        # The calls of a batch are recorded by method,
+        # the rejected batch as failed calls.
+        metrics = json_rpc_client.rpc_metrics
+        assert not any("," in method for method in metrics)
+        assert metrics["SysVar.getAll"].calls == (2 if supports_batch else 3)
+        assert metrics["SysVar.getAll"].errors == (0 if supports_batch else 1)
+
+        (
+            device_details,
+            channel_ids_room,
+            channel_ids_function,
+        ) = await json_rpc_client.get_device_details_rooms_functions()
+        assert device_details == [{"address": "VCU0000001", "name": "Device"}]
+        assert channel_ids_room == {"3": {"Kitchen"}, "1001": {"Kitchen"}}
+        assert channel_ids_function == {"4": {"Light"}, "1001": {"Light"}}
+    finally:
+        await json_rpc_client.logout()
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_json_rpc_ext_markers(client_session: ClientSession) -> None:
+    """Test the ext markers are only fetched, if sysvars were added or removed."""
+    server = _FakeJsonRpcServer(supports_batch=True)
+    runner, port = await _start_server(server)
+    json_rpc_client = _get_json_rpc_client(client_session, port)
+    sysvar = _RESULTS["SysVar.getAll"][0]
+    try:
+        for _ in range(2):
+            variables = await json_rpc_client.get_all_system_variables(
+                include_internal=True
+            )
+            assert variables[0].extended_sysvar is True
+        assert server.methods.count("ReGa.runScript") == 1
+
+        # an added sysvar
+        with patch.dict(
+            _RESULTS, {"SysVar.getAll": [sysvar, {**sysvar, "id": "3", "name": "New"}]}
+        ):
+            variables = await json_rpc_client.get_all_system_variables(
+                include_internal=True
+            )
+        assert [data.extended_sysvar for data in variables] == [True, False]
+        assert server.methods.count("ReGa.runScript") == 2
+
+        # a removed sysvar
+        await json_rpc_client.get_all_system_variables(include_internal=True)
+        assert server.methods.count("ReGa.runScript") == 3
+
+        # explicit invalidation
+        json_rpc_client.clear_ext_markers()
+        await json_rpc_client.get_all_system_variables(include_internal=True)
+        assert server.methods.count("ReGa.runScript") == 4
+        await json_rpc_client.get_all_system_variables(include_internal=True)
+        assert server.methods.count("ReGa.runScript") == 4
+    finally:
+        await json_rpc_client.logout()
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_json_rpc_ext_markers_failed(client_session: ClientSession) -> None:
+    """Test a failed fetch of the ext markers is not retried with every call."""
+    server = _FakeJsonRpcServer(supports_batch=True)
+    runner, port = await _start_server(server)
+    json_rpc_client = _get_json_rpc_client(client_session, port)
+    try:
+        with patch.dict(_RESULTS, {"ReGa.runScript": "{"}):
+            for _ in range(2):
+                variables = await json_rpc_client.get_all_system_variables(
+                    include_internal=True
+                )
+                assert variables[0].extended_sysvar is False
+        await json_rpc_client.get_all_system_variables(include_internal=True)
+        assert server.methods.count("ReGa.runScript") == 1
+
+        # explicit invalidation
+        json_rpc_client.clear_ext_markers()
+        variables = await json_rpc_client.get_all_system_variables(
+            include_internal=True
+        )
+        assert variables[0].extended_sysvar is True
+        assert server.methods.count("ReGa.runScript") == 2
+    finally:
+        await json_rpc_client.logout()
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_json_rpc_set_system_variables(client_session: ClientSession) -> None:
+    """Test several sysvars are set by one script."""
+    server = _FakeJsonRpcServer()
+    runner, port = await _start_server(server)
+    json_rpc_client = _get_json_rpc_client(client_session, port)
+    try:
+        assert await json_rpc_client.set_system_variables(
+            {
+                "SysVar": 1.5,
+                "Missing": True,
+                "Quote": 'a "b"',
+                "Infinite": float("inf"),
+            }
+        ) == {"SysVar": True, "Missing": False, "Quote": False, "Infinite": False}
+        assert server.methods == ["Session.login", "ReGa.runScript"]
+    finally:
+        await json_rpc_client.logout()
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_json_rpc_stream_device_data(client_session: ClientSession) -> None:
+    """Test the device data is decoded, while the response is read."""
+    server = _FakeJsonRpcServer()
+    runner, port = await _start_server(server)
+    json_rpc_client = _get_json_rpc_client(client_session, port)
+    try:
+        with patch("hahomematic.json_rpc_client._STREAM_CHUNK_SIZE", 7):
+            for _ in range(2):
+                records = [
+                    record async for record in json_rpc_client.iter_all_device_data()
+                ]
+                assert records == [
+                    ("BidCos-RF", "VCU0000001:1", "STATE", True),
+                    ("BidCos-RF", "VCU0000001:1", "LEVEL", 0.5),
+                    ("HmIP-RF", "VCU0000002:0", "NAME", 'K%FCche "1"'),
+                ]
+                # The next request is retried with a new session.
+                server.valid_session_ids.clear()
+        metrics = json_rpc_client.rpc_metrics["ReGa.runScript"]
+        assert metrics.calls == 3
+        assert metrics.errors == 1
+    finally:
+        await json_rpc_client.logout()
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_json_rpc_device_data_since(client_session: ClientSession) -> None:
+    """Test only the device data, that changed since a backend time, is fetched."""
+    server = _FakeJsonRpcServer()
+    runner, port = await _start_server(server)
+    json_rpc_client = _get_json_rpc_client(client_session, port)
+    try:
+        assert await json_rpc_client.get_backend_time() == 1000
+        assert await json_rpc_client.get_device_data_since(since=1000) == (
+            1060,
+            [("BidCos-RF", "VCU0000001:1", "LEVEL", 1.0)],
+        )
+    finally:
+        await json_rpc_client.logout()
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_json_rpc_hub_data_since(client_session: ClientSession) -> None:
+    """Test the changes of sysvars and programs are decoded."""
+    server = _FakeJsonRpcServer()
+    runner, port = await _start_server(server)
+    json_rpc_client = _get_json_rpc_client(client_session, port)
+    try:
+        assert await json_rpc_client.get_hub_data_since(
+            since=1000,
+            known_sysvar_ids={"3", "1"},
+            known_program_ids=set(),
+            include_internal_sysvars=True,
+            include_internal_programs=False,
+        ) == HubDataDelta(
+            backend_timestamp=1060,
+            variables=[
+                SystemVariableData(
+                    name="K\u00fcche",
+                    data_type="INTEGER",
+                    unit="\u00b0C",
+                    value=5,
+                    max_value=50,
+                    min_value=-10,
+                    extended_sysvar=True,
+                    vid="1",
+                ),
+                SystemVariableData(
+                    name="Alarm",
+                    data_type="ALARM",
+                    unit="",
+                    value=True,
+                    vid="2",
+                ),
+            ],
+            programs=[
+                ProgramData(
+                    name="Program 1",
+                    pid="5",
+                    is_active=True,
+                    is_internal=False,
+                    last_execute_time="2023-01-16 10:00:00",
+                )
+            ],
+            deleted_sysvar_ids=["3"],
+            deleted_program_ids=[],
+        )
+    finally:
+        await json_rpc_client.logout()
+        await runner.cleanup()
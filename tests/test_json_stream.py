@@ -0,0 +1,66 @@
+"""Test the incremental JSON decoders."""
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from hahomematic.json_stream import DeviceDataDecoder, JsonRpcResultDecoder
+
+_DEVICE_DATA = (
+    '{"BidCos-RF.VCU0000001%3A1.STATE":true,\n'
+    '"BidCos-RF.VCU0000001%3A1.LEVEL":0.5,\n'
+    '"HmIP-RF.VCU0000002%3A0.NAME":"K\u00fcche \\"\U0001F600\\"",\n'
+    '"HmIP-RF.VCU0000002%3A0.SUBJECT":"a\\\\"}'
+)
+
+
+@pytest.mark.parametrize("ensure_ascii", [True, False])
+def test_json_stream_chunks(ensure_ascii: bool) -> None:
+    """Test the result is decoded for all chunk sizes."""
+    body = json.dumps(
+        {"version": "1.1", "result": _DEVICE_DATA, "error": None},
+        ensure_ascii=ensure_ascii,
+    ).encode("utf-8")
+    for size in range(1, len(body) + 1):
+        result_decoder = JsonRpcResultDecoder()
+        device_data_decoder = DeviceDataDecoder()
+        text = ""
+        records = []
+        for pos in range(0, len(body), size):
+            chunk_text = result_decoder.feed(body[pos : pos + size])
+            text += chunk_text
+            records.extend(device_data_decoder.feed(chunk_text))
+        records.extend(device_data_decoder.close())
+        assert text == _DEVICE_DATA
+        assert result_decoder.close() == {
+            "version": "1.1",
+            "result": "",
+            "error": None,
+        }
+        assert records == [
+            ("BidCos-RF", "VCU0000001:1", "STATE", True),
+            ("BidCos-RF", "VCU0000001:1", "LEVEL", 0.5),
+            ("HmIP-RF", "VCU0000002:0", "NAME", 'K\u00fcche "\U0001F600"'),
+            ("HmIP-RF", "VCU0000002:0", "SUBJECT", "a\\"),
+        ]
+
+
+def test_json_stream_errors() -> None:
+    """Test errors and incomplete responses."""
+    result_decoder = JsonRpcResultDecoder()
+    assert result_decoder.feed(b'{"result": null, "error": {"code": 1}}') == ""
+    assert result_decoder.close() == {"result": None, "error": {"code": 1}}
+
+    result_decoder = JsonRpcResultDecoder()
+    assert result_decoder.feed(b'{"result": "{\\"a') == '{"a'
+    with pytest.raises(ValueError):
+        result_decoder.close()
+
+    device_data_decoder = DeviceDataDecoder()
+    assert device_data_decoder.feed('{"BidCos-RF.VCU0000001%3A1.STATE":true,\n') == [
+        ("BidCos-RF", "VCU0000001:1", "STATE", True)
+    ]
+    device_data_decoder.feed('"BidCos-RF.VCU0000001%3A1.LEVEL":0.5')
+    with pytest.raises(ValueError):
+        device_data_decoder.close()
@@ -70,37 +70,17 @@ async def test_cedimmer(
     assert light.channel_brightness == 102
 
     await light.turn_on(**{"on_time": 5.0, "ramp_time": 6.0})
-    assert mock_client.method_calls[-3] == call.set_value(
-        channel_address="VCU1399816:4",
-        paramset_key="VALUES",
-        parameter="RAMP_TIME",
-        value=6.0,
-    )
-    assert mock_client.method_calls[-2] == call.set_value(
-        channel_address="VCU1399816:4",
-        paramset_key="VALUES",
-        parameter="ON_TIME",
-        value=5.0,
-    )
-    assert mock_client.method_calls[-1] == call.set_value(
-        channel_address="VCU1399816:4",
+    assert mock_client.method_calls[-1] == call.put_paramset(
+        address="VCU1399816:4",
         paramset_key="VALUES",
-        parameter="LEVEL",
-        value=0.10980392156862745,
+        value={"RAMP_TIME": 6.0, "ON_TIME": 5.0, "LEVEL": 0.10980392156862745},
     )
 
     await light.turn_off(**{"ramp_time": 6.0})
-    assert mock_client.method_calls[-2] == call.set_value(
-        channel_address="VCU1399816:4",
-        paramset_key="VALUES",
-        parameter="RAMP_TIME",
-        value=6.0,
-    )
-    assert mock_client.method_calls[-1] == call.set_value(
-        channel_address="VCU1399816:4",
+    assert mock_client.method_calls[-1] == call.put_paramset(
+        address="VCU1399816:4",
         paramset_key="VALUES",
-        parameter="LEVEL",
-        value=0.0,
+        value={"RAMP_TIME": 6.0, "LEVEL": 0.0},
     )
     assert light.brightness == 0
 
@@ -337,59 +317,52 @@ async def test_ceipfixedcolorlight(
 
     assert light.color_name == "BLACK"
     await light.turn_on(**{"hs_color": (0, 0)})
-    assert mock_client.method_calls[-1] == call.set_value(
-        channel_address="VCU3716619:8",
+    assert mock_client.method_calls[-1] == call.put_paramset(
+        address="VCU3716619:8",
         paramset_key="VALUES",
-        parameter="LEVEL",
-        value=1.0,
+        value={"COLOR": 7, "LEVEL": 1.0},
     )
     assert light.color_name == "WHITE"
     await light.turn_on(**{"hs_color": (60, 50)})
-    assert mock_client.method_calls[-2] == call.set_value(
-        channel_address="VCU3716619:8",
+    assert mock_client.method_calls[-1] == call.put_paramset(
+        address="VCU3716619:8",
         paramset_key="VALUES",
-        parameter="COLOR",
-        value=6,
+        value={"COLOR": 6, "LEVEL": 1.0},
     )
     assert light.color_name == "YELLOW"
     await light.turn_on(**{"hs_color": (120, 50)})
-    assert mock_client.method_calls[-2] == call.set_value(
-        channel_address="VCU3716619:8",
+    assert mock_client.method_calls[-1] == call.put_paramset(
+        address="VCU3716619:8",
         paramset_key="VALUES",
-        parameter="COLOR",
-        value=2,
+        value={"COLOR": 2, "LEVEL": 1.0},
     )
     assert light.color_name == "GREEN"
     await light.turn_on(**{"hs_color": (180, 50)})
-    assert mock_client.method_calls[-2] == call.set_value(
-        channel_address="VCU3716619:8",
+    assert mock_client.method_calls[-1] == call.put_paramset(
+        address="VCU3716619:8",
         paramset_key="VALUES",
-        parameter="COLOR",
-        value=3,
+        value={"COLOR": 3, "LEVEL": 1.0},
     )
     assert light.color_name == "TURQUOISE"
     await light.turn_on(**{"hs_color": (240, 50)})
-    assert mock_client.method_calls[-2] == call.set_value(
-        channel_address="VCU3716619:8",
+    assert mock_client.method_calls[-1] == call.put_paramset(
+        address="VCU3716619:8",
         paramset_key="VALUES",
-        parameter="COLOR",
-        value=1,
+        value={"COLOR": 1, "LEVEL": 1.0},
     )
     assert light.color_name == "BLUE"
     await light.turn_on(**{"hs_color": (300, 50)})
-    assert mock_client.method_calls[-2] == call.set_value(
-        channel_address="VCU3716619:8",
+    assert mock_client.method_calls[-1] == call.put_paramset(
+        address="VCU3716619:8",
         paramset_key="VALUES",
-        parameter="COLOR",
-        value=5,
+        value={"COLOR": 5, "LEVEL": 1.0},
     )
     assert light.color_name == "PURPLE"
     await light.turn_on(**{"hs_color": (350, 50)})
-    assert mock_client.method_calls[-2] == call.set_value(
-        channel_address="VCU3716619:8",
+    assert mock_client.method_calls[-1] == call.put_paramset(
+        address="VCU3716619:8",
         paramset_key="VALUES",
-        parameter="COLOR",
-        value=4,
+        value={"COLOR": 4, "LEVEL": 1.0},
     )
     assert light.color_name == "RED"
 
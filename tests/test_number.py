@@ -1,6 +1,7 @@
 """Tests for number entities of hahomematic."""
 from __future__ import annotations
 
+import asyncio
 from typing import cast
 from unittest.mock import call
 
@@ -47,6 +48,37 @@ async def test_hmfloat(
     assert efloat.value == 0.5
 
 
+@pytest.mark.asyncio
+async def test_hmfloat_send_debounce(
+    central_local_factory: helper.CentralUnitLocalFactory,
+) -> None:
+    """Test last write wins of HmFloat."""
+    central, mock_client = await central_local_factory.get_default_central(TEST_DEVICES)
+    efloat: HmFloat = cast(
+        HmFloat,
+        await get_generic_entity(central, "VCU0000011:3", "LEVEL"),
+    )
+    efloat.set_send_debounce_window(0.05)
+    call_count = len(mock_client.method_calls)
+    await efloat.send_value(0.1)
+    await asyncio.gather(*(efloat.send_value(level / 10) for level in range(2, 6)))
+    assert mock_client.method_calls[call_count:] == [
+        call.set_value(
+            channel_address="VCU0000011:3",
+            paramset_key="VALUES",
+            parameter="LEVEL",
+            value=0.1,
+        ),
+        call.set_value(
+            channel_address="VCU0000011:3",
+            paramset_key="VALUES",
+            parameter="LEVEL",
+            value=0.5,
+        ),
+    ]
+    assert efloat.value == 0.5
+
+
 @pytest.mark.asyncio
 async def test_hminteger(
     central_local_factory: helper.CentralUnitLocalFactory,
@@ -0,0 +1,85 @@
+"""Test the rpc metrics."""
+from __future__ import annotations
+
+import logging
+from unittest.mock import patch
+
+from aiohttp import ClientSession
+import const
+import pydevccu
+import pytest
+
+from hahomematic.exceptions import ProxyException
+from hahomematic.helpers import build_headers, build_xml_rpc_uri
+from hahomematic.rpc_metrics import LATENCY_BUCKETS, RpcMetrics
+from hahomematic.xml_rpc_proxy import AioXmlRpcProxy, XmlRpcProxy
+
+
+def test_rpc_metrics(caplog: pytest.LogCaptureFixture) -> None:
+    """Test counters, histogram and slow call log."""
+    metrics = RpcMetrics(name="JSON-RPC")
+    metrics.record(method="SysVar.getAll", latency=0.02, bytes_sent=10)
+    metrics.record(method="SysVar.getAll", latency=0.3, error=True, bytes_received=5)
+    with patch("hahomematic.config.RPC_SLOW_CALL_THRESHOLD", 1.0), caplog.at_level(
+        logging.WARNING
+    ):
+        metrics.record(
+            method="Session.login",
+            latency=20.0,
+            args={"username": "Admin", "password": "secret", "script": "x" * 500},
+        )
+    snapshot = metrics.snapshot()
+
+    sys_var = snapshot["SysVar.getAll"]
+    assert sys_var.calls == 2
+    assert sys_var.errors == 1
+    assert sys_var.bytes_sent == 10
+    assert sys_var.bytes_received == 5
+    assert sys_var.max_latency == 0.3
+    assert sys_var.mean_latency == pytest.approx(0.16)
+    assert sys_var.histogram[LATENCY_BUCKETS.index(0.05)] == 1
+    assert sys_var.histogram[LATENCY_BUCKETS.index(0.5)] == 1
+    assert snapshot["Session.login"].histogram[-1] == 1
+
+    assert "Slow call: Session.login took 20.00s on JSON-RPC" in caplog.text
+    assert "secret" not in caplog.text
+    assert "Admin" not in caplog.text
+    assert "x" * 500 not in caplog.text
+
+    # The snapshot is a copy.
+    sys_var.histogram[0] = 100
+    assert metrics.snapshot()["SysVar.getAll"].histogram[0] == 0
+
+
+@pytest.mark.asyncio
+async def test_xml_rpc_proxy_metrics(
+    ccu: pydevccu.Server, client_session: ClientSession
+) -> None:
+    """Test the xml rpc proxies record their calls."""
+    uri = build_xml_rpc_uri(host=const.CCU_HOST, port=const.CCU_PORT, path=None)
+    headers = build_headers(username=const.CCU_USERNAME, password=const.CCU_PASSWORD)
+    metrics = RpcMetrics(name="CentralTest-BidCos-RF")
+    aio_proxy = AioXmlRpcProxy(
+        client_session=client_session, uri=uri, headers=headers, metrics=metrics
+    )
+    await aio_proxy.getVersion()
+    with pytest.raises(ProxyException):
+        await aio_proxy.unknownMethod()
+    proxy = XmlRpcProxy(
+        max_workers=1,
+        thread_name_prefix="test",
+        uri=uri,
+        headers=headers,
+        metrics=metrics,
+    )
+    await proxy.getVersion()
+    proxy.stop()
+
+    snapshot = metrics.snapshot()
+    assert snapshot["getVersion"].calls == 2
+    assert snapshot["getVersion"].errors == 0
+    # Only the aiohttp proxy knows the byte sizes.
+    assert snapshot["getVersion"].bytes_sent > 0
+    assert snapshot["getVersion"].bytes_received > 0
+    assert snapshot["unknownMethod"].calls == 1
+    assert snapshot["unknownMethod"].errors == 1
@@ -0,0 +1,46 @@
+"""Test the send debouncer."""
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from hahomematic.send_debouncer import SendDebouncer
+
+WINDOW = 0.05
+
+
+@pytest.mark.asyncio
+async def test_send_debouncer() -> None:
+    """Test the newest value is sent after the value in flight."""
+    sent: list[Any] = []
+
+    async def send(value: Any) -> None:
+        sent.append(value)
+
+    debouncer = SendDebouncer(window=WINDOW, send=send)
+    await debouncer.send(1)
+    assert sent == [1]
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    await asyncio.gather(*(debouncer.send(value) for value in (2, 3, 4)))
+    assert loop.time() - started >= WINDOW * 0.9
+    assert sent == [1, 4]
+    assert debouncer.superseded == 2
+
+
+@pytest.mark.asyncio
+async def test_send_debouncer_failure() -> None:
+    """Test the callers of a failed value get the exception."""
+
+    async def send(value: Any) -> None:
+        raise ValueError(value)
+
+    debouncer = SendDebouncer(window=WINDOW, send=send)
+    results = await asyncio.gather(
+        debouncer.send(1), debouncer.send(2), return_exceptions=True
+    )
+    assert isinstance(results[0], ValueError)
+    assert isinstance(results[1], ValueError)
@@ -0,0 +1,70 @@
+"""Test the serializer."""
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from hahomematic import serializer
+
+_DATA = {
+    "VCU0000001:1": {
+        "LEVEL": {"MIN": 0.0, "MAX": 1.0, "DEFAULT": 0.0, "FLAGS": 1},
+        "NAME": {"DEFAULT": "Küche \U0001F600", "VALUE_LIST": ["A", "B"]},
+        "STATE": {"DEFAULT": False, "UNIT": None},
+    }
+}
+
+
+@pytest.mark.parametrize("backend", list(serializer.AVAILABLE_BACKENDS))
+def test_serializer(backend: str, tmp_path: str) -> None:
+    """Test all available backends read and write the same JSON."""
+    default_backend = serializer.get_backend()
+    serializer.set_backend(backend)
+    try:
+        assert serializer.get_backend() == backend
+        data = serializer.dumps(_DATA)
+        assert isinstance(data, bytes)
+        assert serializer.loads(data) == _DATA
+        assert serializer.loads(data.decode("utf-8")) == _DATA
+        assert serializer.loads(serializer.dumps({1: True})) == {"1": True}
+
+        file_path = os.path.join(tmp_path, "paramsets.json")
+        serializer.dump_file(_DATA, file_path=file_path, indent=True)
+        with open(file=file_path, mode="rb") as fptr:
+            assert b'\n  "VCU0000001:1": {' in fptr.read()
+        for other_backend in serializer.AVAILABLE_BACKENDS:
+            serializer.set_backend(other_backend)
+            assert serializer.load_file(file_path=file_path) == _DATA
+
+        serializer.set_backend(backend)
+        with pytest.raises(serializer.JSONDecodeError):
+            serializer.loads(b'{"LEVEL": ')
+    finally:
+        serializer.set_backend(default_backend)
+
+
+def test_serializer_unknown_backend() -> None:
+    """Test an unknown backend is rejected."""
+    with pytest.raises(ValueError):
+        serializer.set_backend("unknown")
+
+
+def test_serializer_binary(tmp_path: str) -> None:
+    """Test the binary format, its interned strings and its header."""
+    file_path = os.path.join(tmp_path, "paramsets.bin")
+    serializer.dump_binary_file(_DATA, file_path=file_path)
+    data = serializer.load_binary_file(file_path=file_path)
+    assert data == _DATA
+    # equal strings are shared
+    level_keys = {key: key for key in data["VCU0000001:1"]["LEVEL"]}
+    name_keys = {key: key for key in data["VCU0000001:1"]["NAME"]}
+    assert level_keys["DEFAULT"] is name_keys["DEFAULT"]
+
+    with open(file=file_path, mode="rb") as fptr:
+        content = fptr.read()
+    for invalid_content in (b"{}", content[:-3], b"HAHMCACHE\x00" + content[10:]):
+        with open(file=file_path, mode="wb") as fptr:
+            fptr.write(invalid_content)
+        with pytest.raises(serializer.BinaryDecodeError):
+            serializer.load_binary_file(file_path=file_path)
@@ -0,0 +1,61 @@
+"""Test the single flight."""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from hahomematic.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_single_flight() -> None:
+    """Test concurrent identical calls share one call."""
+    single_flight = SingleFlight()
+    calls: list[str] = []
+    release = asyncio.Event()
+
+    async def get_value(value: str) -> str:
+        calls.append(value)
+        await release.wait()
+        if value == "fail":
+            raise ValueError(value)
+        return value
+
+    tasks = [
+        asyncio.create_task(single_flight.run(key=key, func=lambda k=key: get_value(k)))
+        for key in ("a", "a", "b", "a", "fail", "fail")
+    ]
+    await asyncio.sleep(0)
+    assert single_flight.in_flight == 3
+    release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert results[:4] == ["a", "a", "b", "a"]
+    assert all(isinstance(result, ValueError) for result in results[4:])
+    assert calls == ["a", "b", "fail"]
+    assert single_flight.statistics.calls == 3
+    assert single_flight.statistics.deduplicated == 3
+    assert single_flight.in_flight == 0
+
+    # Finished calls are not shared.
+    assert await single_flight.run(key="a", func=lambda: get_value("a")) == "a"
+    assert single_flight.statistics.calls == 4
+
+
+@pytest.mark.asyncio
+async def test_single_flight_cancel() -> None:
+    """Test the cancellation of a caller does not cancel the shared call."""
+    single_flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def get_value() -> int:
+        await release.wait()
+        return 1
+
+    first = asyncio.create_task(single_flight.run(key="a", func=get_value))
+    second = asyncio.create_task(single_flight.run(key="a", func=get_value))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+    assert await second == 1
+    assert first.cancelled()
@@ -0,0 +1,70 @@
+"""Test the write batch."""
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, call
+
+import pytest
+
+from hahomematic.write_batch import get_write_batch, write_batch
+
+
+def _get_client(interface_id: str) -> MagicMock:
+    """Return a client mock."""
+    client = MagicMock(interface_id=interface_id)
+    client.set_value = AsyncMock()
+    client.put_paramset = AsyncMock()
+    return client
+
+
+@pytest.mark.asyncio
+async def test_write_batch() -> None:
+    """Test writes are sent by channel."""
+    client = _get_client("CentralTest-HmIP-RF")
+    assert get_write_batch() is None
+    async with write_batch() as batch:
+        batch.add(client, "VCU0000001:4", "RAMP_TIME", 6.0)
+        batch.add(client, "VCU0000002:1", "STATE", True)
+        # A nested batch joins the outer batch.
+        async with write_batch() as nested_batch:
+            assert nested_batch is batch
+            nested_batch.add(client, "VCU0000001:4", "LEVEL", 1.0)
+        assert batch.size == 3
+        client.put_paramset.assert_not_called()
+    assert get_write_batch() is None
+    assert client.mock_calls == [
+        call.put_paramset(
+            address="VCU0000001:4",
+            paramset_key="VALUES",
+            value={"RAMP_TIME": 6.0, "LEVEL": 1.0},
+        ),
+        call.set_value(
+            channel_address="VCU0000002:1",
+            paramset_key="VALUES",
+            parameter="STATE",
+            value=True,
+        ),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_write_batch_sequential() -> None:
+    """Test repeated writes of a parameter are sent in order."""
+    client = _get_client("CentralTest-HmIP-RF")
+    async with write_batch() as batch:
+        batch.add(client, "VCU0000001:4", "EFFECT", 0)
+        batch.add(client, "VCU0000001:4", "COLOR", 2)
+        batch.add(client, "VCU0000001:4", "EFFECT", 3)
+    assert [method_call.kwargs["parameter"] for method_call in client.mock_calls] == [
+        "EFFECT",
+        "COLOR",
+        "EFFECT",
+    ]
+
+    # Nothing is sent, if the batch is left by an exception.
+    client = _get_client("CentralTest-HmIP-RF")
+    with pytest.raises(ValueError):
+        async with write_batch() as batch:
+            batch.add(client, "VCU0000001:4", "LEVEL", 1.0)
+            raise ValueError("failed")
+    assert client.mock_calls == []
+    assert get_write_batch() is None
@@ -0,0 +1,90 @@
+"""Test the xml rpc decoder."""
+from __future__ import annotations
+
+from xmlrpc import client as xmlrpc_client
+
+import const
+import pytest
+
+from hahomematic.xml_rpc_decoder import UnsupportedRequest, decode_request, get_events
+
+DEVICE_DESCRIPTIONS = [
+    {
+        "ADDRESS": "VCU2128127",
+        "CHILDREN": ["VCU2128127:0", "VCU2128127:1"],
+        "FIRMWARE": "1.2.3",
+        "FLAGS": 1,
+        "PARAMSETS": ["MASTER", "VALUES"],
+        "ROAMING": False,
+        "RX_MODE": 1,
+        "TYPE": "HmIP-BSM",
+        "VERSION": 9,
+    }
+]
+
+
+@pytest.mark.parametrize(
+    "method_name, params",
+    [
+        ("event", (const.LOCAL_INTERFACE_ID, "VCU2128127:1", "STATE", True)),
+        ("event", (const.LOCAL_INTERFACE_ID, "VCU2128127:1", "LEVEL", 0.25)),
+        ("event", (const.LOCAL_INTERFACE_ID, "VCU2128127:1", "ERROR", 7)),
+        ("event", (const.LOCAL_INTERFACE_ID, "VCU2128127:1", "TEXT", "a <&> b")),
+        ("listDevices", (const.LOCAL_INTERFACE_ID,)),
+        ("newDevices", (const.LOCAL_INTERFACE_ID, DEVICE_DESCRIPTIONS)),
+        ("deleteDevices", (const.LOCAL_INTERFACE_ID, ["VCU2128127"])),
+        ("system.listMethods", (const.LOCAL_INTERFACE_ID, None)),
+    ],
+)
+def test_decode_request(method_name: str, params: tuple) -> None:
+    """Test that the decoder is compatible with xmlrpc.client."""
+    data = xmlrpc_client.dumps(params, methodname=method_name, allow_none=True)
+    assert decode_request(data.encode()) == (method_name, params)
+    assert decode_request(data.encode()) == tuple(
+        reversed(xmlrpc_client.loads(data))
+    )
+
+
+def test_decode_untyped_value() -> None:
+    """Test values without type are decoded as string."""
+    data = (
+        b"<?xml version='1.0'?><methodCall><methodName>event</methodName><params>"
+        b"<param><value>CentralTest-Local</value></param>"
+        b"<param><value>VCU2128127:1</value></param>"
+        b"<param><value><string>STATE</string></value></param>"
+        b"<param><value></value></param>"
+        b"</params></methodCall>"
+    )
+    assert decode_request(data) == (
+        "event",
+        ("CentralTest-Local", "VCU2128127:1", "STATE", ""),
+    )
+
+
+def test_decode_unsupported() -> None:
+    """Test requests, that are not supported by the fast path."""
+    data = xmlrpc_client.dumps(
+        (xmlrpc_client.Binary(b"abc"),), methodname="event"
+    ).encode()
+    with pytest.raises(UnsupportedRequest):
+        decode_request(data)
+    with pytest.raises(UnsupportedRequest):
+        decode_request(b"<methodCall><methodName>event</methodName>")
+    with pytest.raises(UnsupportedRequest):
+        decode_request(b"<params></params>")
+
+
+def test_get_events() -> None:
+    """Test the extraction of events."""
+    event = (const.LOCAL_INTERFACE_ID, "VCU2128127:1", "STATE", True)
+    assert get_events("event", event) == [event]
+    assert get_events("event", event[:3]) is None
+    assert get_events("listDevices", (const.LOCAL_INTERFACE_ID,)) is None
+
+    multicall = [
+        {"methodName": "event", "params": list(event)},
+        {"methodName": "event", "params": list(event)},
+    ]
+    assert get_events("system.multicall", (multicall,)) == [event, event]
+    multicall.append({"methodName": "listDevices", "params": ["x"]})
+    assert get_events("system.multicall", (multicall,)) is None
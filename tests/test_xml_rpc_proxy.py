@@ -0,0 +1,63 @@
+"""Test the xml rpc proxies."""
+from __future__ import annotations
+
+from aiohttp import ClientSession, web
+import const
+import pydevccu
+import pytest
+
+from hahomematic.exceptions import AuthFailure, NoConnection, ProxyException
+from hahomematic.helpers import build_headers, build_xml_rpc_uri, find_free_port
+from hahomematic.xml_rpc_proxy import AioXmlRpcProxy
+
+
+def _get_proxy(client_session: ClientSession, port: int) -> AioXmlRpcProxy:
+    """Return an aiohttp proxy for the port."""
+    return AioXmlRpcProxy(
+        client_session=client_session,
+        uri=build_xml_rpc_uri(host=const.CCU_HOST, port=port, path=None),
+        headers=build_headers(
+            username=const.CCU_USERNAME, password=const.CCU_PASSWORD
+        ),
+        max_concurrency=2,
+    )
+
+
+@pytest.mark.asyncio
+async def test_aio_xml_rpc_proxy(
+    ccu: pydevccu.Server, client_session: ClientSession
+) -> None:
+    """Test the aiohttp proxy against pydevccu."""
+    proxy = _get_proxy(client_session, const.CCU_PORT)
+    methods = await proxy.system.listMethods()
+    assert "getVersion" in methods
+    assert "pydevccu" in await proxy.getVersion()
+    assert len(await proxy.listDevices()) > 0
+
+    with pytest.raises(ProxyException):
+        await proxy.unknownMethod()
+    proxy.stop()
+
+
+@pytest.mark.asyncio
+async def test_aio_xml_rpc_proxy_errors(client_session: ClientSession) -> None:
+    """Test the error handling of the aiohttp proxy."""
+
+    async def unauthorized(request: web.Request) -> web.Response:
+        """Reject all requests."""
+        raise web.HTTPUnauthorized()
+
+    app = web.Application()
+    app.router.add_post("/", unauthorized)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    port = find_free_port()
+    await web.TCPSite(runner, host=const.CCU_HOST, port=port).start()
+    try:
+        with pytest.raises(AuthFailure):
+            await _get_proxy(client_session, port).getVersion()
+    finally:
+        await runner.cleanup()
+
+    with pytest.raises(NoConnection):
+        await _get_proxy(client_session, port).getVersion()
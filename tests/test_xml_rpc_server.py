@@ -0,0 +1,117 @@
+"""Test the xml rpc servers."""
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+from xmlrpc import client as xmlrpc_client
+
+from aiohttp import ClientSession
+import const
+import pytest
+
+from hahomematic import central_unit as hmcu, xml_rpc_server as xml_rpc
+from hahomematic.const import PORT_ANY
+
+
+def _get_central_mock() -> MagicMock:
+    """Return a central mock with a client for the local interface."""
+    central = MagicMock()
+    central.name = const.CENTRAL_NAME
+    client = MagicMock()
+    client.central = central
+    client.interface_id = const.LOCAL_INTERFACE_ID
+    central.client = client
+    return central
+
+
+async def _post(
+    client_session: ClientSession, local_port: int, method: str, *params: object
+) -> object:
+    """Post a xml rpc request to the server."""
+    async with client_session.post(
+        f"http://127.0.0.1:{local_port}/RPC2",
+        data=xmlrpc_client.dumps(params, methodname=method, allow_none=True),
+        headers={"Content-Type": "text/xml"},
+    ) as response:
+        assert response.status == 200
+        result, _ = xmlrpc_client.loads(await response.read())
+        return result[0]
+
+
+@pytest.mark.asyncio
+async def test_async_xml_rpc_server(client_session: ClientSession) -> None:
+    """Test the asyncio based xml rpc server."""
+    server = await xml_rpc.register_async_xml_rpc_server(local_port=PORT_ANY)
+    central = _get_central_mock()
+    server.register_central(central)
+    routes = patch.dict(
+        hmcu.CLIENT_ROUTES, {const.LOCAL_INTERFACE_ID: central.client}
+    )
+    routes.start()
+    try:
+        assert server.started is True
+        assert server.get_central(const.LOCAL_INTERFACE_ID) is central
+        assert server.get_central("unknown") is None
+
+        await _post(
+            client_session,
+            server.local_port,
+            "event",
+            const.LOCAL_INTERFACE_ID,
+            "VCU2128127:1",
+            "STATE",
+            True,
+        )
+        central.events.assert_called_with(
+            interface_id=const.LOCAL_INTERFACE_ID,
+            events=[("VCU2128127:1", "STATE", True)],
+        )
+
+        await _post(
+            client_session,
+            server.local_port,
+            "system.multicall",
+            [
+                {
+                    "methodName": "event",
+                    "params": [
+                        const.LOCAL_INTERFACE_ID,
+                        "VCU2128127:2",
+                        "LEVEL",
+                        0.5,
+                    ],
+                },
+                {
+                    "methodName": "event",
+                    "params": [
+                        const.LOCAL_INTERFACE_ID,
+                        "VCU2128127:2",
+                        "WORKING",
+                        False,
+                    ],
+                },
+            ],
+        )
+        # The events of a multicall are passed as one batch.
+        assert central.events.call_count == 2
+        central.events.assert_called_with(
+            interface_id=const.LOCAL_INTERFACE_ID,
+            events=[
+                ("VCU2128127:2", "LEVEL", 0.5),
+                ("VCU2128127:2", "WORKING", False),
+            ],
+        )
+
+        methods = await _post(
+            client_session,
+            server.local_port,
+            "system.listMethods",
+            const.LOCAL_INTERFACE_ID,
+        )
+        assert "event" in methods
+        assert "newDevices" in methods
+    finally:
+        routes.stop()
+        server.un_register_central(central)
+        assert server.no_central_registered is True
+        await server.stop()
+    assert server.started is False